@@ -1,49 +1,79 @@
 # app/__init__.py
-print("<<<< START __init__.py wird GELADEN >>>>")
+import time
+_IMPORT_STARTED_AT = time.perf_counter() # Beginn des Kaltstarts (Import des Pakets 'app')
 
+import logging
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
-from flask_migrate import Migrate
-from config import Config # Deine Konfigurationsklasse
+from config import Config, DOTENV_FOUND, DOTENV_PATH # Deine Konfigurationsklasse
 import os
 from datetime import datetime, timezone # timezone für UTC und datetime für current_year
-import pytz # Für Zeitzonenkonvertierung
 # from calendar import monthrange # Wird jetzt in main_routes.py importiert, wo es gebraucht wird
 
+logger = logging.getLogger(__name__)
+
 db = SQLAlchemy()
 login_manager = LoginManager()
 login_manager.login_view = 'auth.login' # Route, zu der umgeleitet wird, wenn Zugriff verweigert
 login_manager.login_message = "Bitte melden Sie sich an, um auf diese Seite zuzugreifen."
 login_manager.login_message_category = "info" # Für Bootstrap-Styling von Flash-Nachrichten
 
-migrate = Migrate()
+# <<< GEÄNDERT >>> Flask-Migrate (und damit Alembic, ~1/4 der Importzeit) wird nur für die Flask-CLI geladen,
+# nicht beim Start der gunicorn-Worker. Siehe init_migrate().
+migrate = None
+
+def init_migrate(app):
+    global migrate
+    from flask_migrate import Migrate
+    if migrate is None:
+        migrate = Migrate()
+    migrate.init_app(app, db)
 
 # bootstrap = Bootstrap() # Auskommentiert, da wir es nicht aktiv nutzen
 
+def _log_config_diagnostics(app):
+    # Startdiagnose aus config.py; erst hier, weil app.logger dann einen Handler und das Log-Level hat
+    if DOTENV_FOUND:
+        app.logger.debug(".env Datei %s geladen.", DOTENV_PATH)
+    else:
+        app.logger.debug(".env Datei %s nicht gefunden (erwartet auf Railway).", DOTENV_PATH)
+    if not os.environ.get('SECRET_KEY'):
+        app.logger.debug("SECRET_KEY nicht gesetzt, Fallback wird verwendet.")
+    database_uri = app.config.get('SQLALCHEMY_DATABASE_URI')
+    app.logger.debug("Datenbank: %s", database_uri.split('://', 1)[0] if database_uri else "DATABASE_URL nicht gesetzt")
+
 def create_app(config_class=Config):
-    print("<<<< create_app() WIRD AUFGERUFEN (__init__.py) >>>>")
+    create_started_at = time.perf_counter()
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.logger.setLevel(app.config.get('LOG_LEVEL', 'INFO')) # Logger 'app': gilt auch für die Modul-Logger app.*
+    _log_config_diagnostics(app)
 
     db.init_app(app)
-    print("<<<< db.init_app() VORBEI (__init__.py) >>>>")
     login_manager.init_app(app)
-    migrate.init_app(app, db)
+    import click
+    if click.get_current_context(silent=True) is not None: # Aufruf über die Flask-CLI (flask db ..., flask run, ...)
+        init_migrate(app)
+    from app.cache import dashboard_cache
+    dashboard_cache.init_app(app)
+    from app import instrumentation
+    instrumentation.init_app(app)
     # bootstrap.init_app(app) # Auskommentiert
 
     # Blueprints registrieren
     from app.auth import bp as auth_bp
     app.register_blueprint(auth_bp, url_prefix='/auth')
-    print("<<<< auth_bp REGISTRIERT (__init__.py) >>>>")
 
     from app.main_routes import bp as main_bp 
     app.register_blueprint(main_bp)
-    print("<<<< main_bp REGISTRIERT (__init__.py) >>>>")
 
     from app.admin import bp as admin_bp
     app.register_blueprint(admin_bp, url_prefix='/admin')
-    print("<<<< admin_bp REGISTRIERT (__init__.py) >>>>")
+    logger.debug("Blueprints registriert: %s", ', '.join(app.blueprints))
+
+    from app.commands import register_commands
+    register_commands(app)
     
     # Kontextprozessor für globale Variablen in Templates (z.B. aktuelles Jahr)
     @app.context_processor
@@ -73,6 +103,7 @@ def create_app(config_class=Config):
         if utc_dt.tzinfo is None or utc_dt.tzinfo.utcoffset(utc_dt) is None:
             utc_dt = utc_dt.replace(tzinfo=timezone.utc) # Mache es UTC-aware, falls es naiv ist
         
+        import pytz # Für Zeitzonenkonvertierung; erst beim ersten Rendern laden
         athens_tz = pytz.timezone('Europe/Athens')
         try:
             local_dt = utc_dt.astimezone(athens_tz)
@@ -91,11 +122,16 @@ def create_app(config_class=Config):
     except OSError:
         pass
     
-    print("<<<< VOR Import von app.models in create_app (__init__.py) >>>>")
     from app import models # Dieser Import ist entscheidend, damit Modelle db kennen
-    print("<<<< NACH Import von app.models in create_app (__init__.py) >>>>")
 
-    print("<<<< create_app() FERTIG, app wird zurückgegeben (__init__.py) >>>>")
+    # <<< NEU >>> Startzeit messen: Kaltstart = Import von 'app' bis hier (nur beim ersten create_app im Prozess aussagekräftig)
+    now = time.perf_counter()
+    app.extensions['startup_profile'] = {
+        'cold_start_ms': round((now - _IMPORT_STARTED_AT) * 1000, 1),
+        'create_app_ms': round((now - create_started_at) * 1000, 1),
+    }
+    app.logger.info("App gestartet: Kaltstart %.1f ms (davon create_app %.1f ms), PID %s",
+                app.extensions['startup_profile']['cold_start_ms'], app.extensions['startup_profile']['create_app_ms'], os.getpid())
     return app
 
 # Der globale Import von 'from app import models' hier unten ist oft wichtig für
@@ -104,8 +140,4 @@ def create_app(config_class=Config):
 # Wenn der Import innerhalb von create_app() nicht für alle CLI-Tools ausreicht,
 # kann dieser globale Import helfen. Flask-Migrate benötigt oft, dass die Modelle
 # beim Import von 'app' bereits bekannt sind.
-print("<<<< VOR globalem Import von app.models am Ende von __init__.py >>>>")
 from app import models 
-print("<<<< NACH globalem Import von app.models am Ende von __init__.py >>>>")
-
-print("<<<< ENDE __init__.py wurde GELADEN >>>>")
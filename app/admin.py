@@ -1,37 +1,104 @@
 # app/admin.py
-from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app
+import io
+from flask import Blueprint, render_template, redirect, url_for, flash, request, current_app, abort, Response, stream_with_context, jsonify
 from flask_login import login_required, current_user
-from sqlalchemy import desc, or_
+from sqlalchemy import false
 from app import db
-from app.models import User, Team, TeamMember, Coaching # Ensure Coaching is imported
-from app.forms import RegistrationForm, TeamForm, TeamMemberForm, CoachingForm # Import CoachingForm
+from app.models import User, Team, TeamMember, Coaching, ArchivedCoaching, coaching_list_options # Ensure Coaching is imported
+from app.forms import RegistrationForm, TeamForm, TeamMemberForm, CoachingForm, CoachingImportForm # Import CoachingForm
 
 # <<< GEÄNDERT >>> Importiere die neue Hilfsfunktion und die Konstante
 from app.utils import role_required, ROLE_ADMIN, ROLE_TEAMLEITER, get_or_create_archiv_team, ARCHIV_TEAM_NAME
 
 # Import helpers from main_routes (ensure main_routes.py has these accessible or define them here)
 from app.main_routes import calculate_date_range, get_month_name_german
+from app.pagination import keyset_paginate
+from app.rollup import record_coaching_changed, record_coaching_deleted, record_coachings_deleted, record_member_moved, coaching_stats_snapshot
+from app.membership import assign_coaching_team, record_member_team_changed
+from app.retention import TIER_ARCHIVE, TIER_HOT, tier_model
+from app.search import apply_coaching_search, apply_ilike_search, index_coaching, refresh_search_documents, remove_search_documents
+from app.stats import get_member_counts_by_team
+from app.lookup import lookup_page, LOOKUP_PAGE_SIZE, MAX_LOOKUP_PAGE_SIZE
 from datetime import datetime, timezone # For month_options generation
 
 bp = Blueprint('admin', __name__)
 
+IMPORT_ERRORS_SHOWN = 200 # so viele Fehlerzeilen zeigt die Import-Seite an
+
 @bp.route('/')
 @login_required
 @role_required(ROLE_ADMIN)
 def panel():
-    # <<< GEÄNDERT >>> Schließe das ARCHIV-Team von der Hauptliste aus
-    users = User.query.order_by(User.username).all()
-    teams = Team.query.filter(Team.name != ARCHIV_TEAM_NAME).order_by(Team.name).all()
-    team_members = TeamMember.query.order_by(TeamMember.name).all()
-    
-    # Finde archivierte Mitglieder separat, um sie optional anzuzeigen
-    archiv_team = Team.query.filter_by(name=ARCHIV_TEAM_NAME).first()
-    archived_members = archiv_team.members.all() if archiv_team else []
+    # <<< GEÄNDERT >>> Die Tabellen (Benutzer, Teams, Mitglieder, ARCHIV) lädt die Seite seitenweise
+    # über die JSON-Endpunkte unten nach – die Seite selbst fragt keine Listen mehr ab.
+    return render_template('admin/admin_panel.html', title='Admin Panel', config=current_app.config)
+
+# --- JSON-Endpunkte für Admin-Tabellen und Filter-Dropdowns (seitenweise, Präfix-Suche, siehe app/lookup.py) ---
+def _lookup_args():
+    limit = min(max(request.args.get('limit', LOOKUP_PAGE_SIZE, type=int) or LOOKUP_PAGE_SIZE, 1), MAX_LOOKUP_PAGE_SIZE)
+    return {'term': request.args.get('q', ''), 'after': request.args.get('after'), 'limit': limit}
 
-    return render_template('admin/admin_panel.html', title='Admin Panel',
-                           users=users, teams=teams, team_members=team_members, 
-                           archived_members=archived_members, # <<< NEU >>>
-                           config=current_app.config)
+def _lookup_response(items, next_cursor):
+    return jsonify({'items': items, 'next_cursor': next_cursor})
+
+@bp.route('/api/users')
+@login_required
+@role_required(ROLE_ADMIN)
+def lookup_users():
+    query = db.session.query(User.id, User.username, User.email, User.role, Team.name.label('team_name'))\
+        .outerjoin(Team, Team.team_leader_id == User.id)
+    rows, next_cursor = lookup_page(query, User.username, User.id, **_lookup_args())
+    return _lookup_response([{
+        'id': r.id, 'username': r.username, 'email': r.email, 'role': r.role, 'team': r.team_name,
+        'edit_url': url_for('admin.edit_user', user_id=r.id),
+        'delete_url': url_for('admin.delete_user', user_id=r.id) if r.username != 'admin' and r.id != current_user.id else None,
+    } for r in rows], next_cursor)
+
+@bp.route('/api/teams')
+@login_required
+@role_required(ROLE_ADMIN)
+def lookup_teams():
+    query = db.session.query(Team.id, Team.name, User.username.label('leader'))\
+        .outerjoin(User, Team.team_leader_id == User.id)
+    if request.args.get('include_archiv') != '1':
+        query = query.filter(Team.name != ARCHIV_TEAM_NAME)
+    rows, next_cursor = lookup_page(query, Team.name, Team.id, **_lookup_args())
+    member_counts = get_member_counts_by_team([r.id for r in rows]) # ein GROUP BY für die ganze Seite
+    return _lookup_response([{
+        'id': r.id, 'name': r.name, 'leader': r.leader, 'member_count': member_counts.get(r.id, 0),
+        'edit_url': url_for('admin.edit_team', team_id=r.id),
+        'delete_url': url_for('admin.delete_team', team_id=r.id),
+    } for r in rows], next_cursor)
+
+@bp.route('/api/team_members')
+@login_required
+@role_required(ROLE_ADMIN)
+def lookup_team_members():
+    """?archived=0 (Standard): aktive Mitglieder, 1: nur ARCHIV, all: alle; optional ?team_id=."""
+    query = db.session.query(TeamMember.id, TeamMember.name, TeamMember.team_id, Team.name.label('team_name'))\
+        .join(Team, TeamMember.team_id == Team.id)
+    archived = request.args.get('archived', '0')
+    if archived == '0':
+        query = query.filter(Team.name != ARCHIV_TEAM_NAME)
+    elif archived == '1':
+        query = query.filter(Team.name == ARCHIV_TEAM_NAME)
+    team_id = request.args.get('team_id', type=int)
+    if team_id:
+        query = query.filter(TeamMember.team_id == team_id)
+    rows, next_cursor = lookup_page(query, TeamMember.name, TeamMember.id, **_lookup_args())
+    return _lookup_response([{
+        'id': r.id, 'name': r.name, 'team_id': r.team_id, 'team': r.team_name,
+        'edit_url': url_for('admin.edit_team_member', member_id=r.id),
+    } for r in rows], next_cursor)
+
+@bp.route('/api/coaches')
+@login_required
+@role_required(ROLE_ADMIN)
+def lookup_coaches():
+    """Benutzer mit mindestens einem Coaching (EXISTS über den Index auf coachings.coach_id)."""
+    query = db.session.query(User.id, User.username).filter(User.coachings_done.any())
+    rows, next_cursor = lookup_page(query, User.username, User.id, **_lookup_args())
+    return _lookup_response([{'id': r.id, 'username': r.username} for r in rows], next_cursor)
 
 # --- User Management ---
 @bp.route('/users/create', methods=['GET', 'POST'])
@@ -105,6 +172,7 @@ def edit_user(user_id):
         try:
             original_team_id_if_leader = user_to_edit.team_id_if_leader
             original_role = user_to_edit.role
+            username_changed = user_to_edit.username != form.username.data
             user_to_edit.username = form.username.data
             user_to_edit.email = form.email.data if form.email.data else None
             user_to_edit.role = form.role.data
@@ -117,6 +185,8 @@ def edit_user(user_id):
             
             if form.password.data:
                 user_to_edit.set_password(form.password.data)
+            if username_changed:
+                refresh_search_documents(Coaching.coach_id == user_to_edit.id)
             
             db.session.commit()
 
@@ -166,6 +236,12 @@ def delete_user(user_id):
     if user.username == 'admin' or user.id == current_user.id:
         flash('Dieser Benutzer kann nicht gelöscht werden.', 'danger')
         return redirect(url_for('admin.panel'))
+    # <<< NEU >>> Auch archivierte Coachings zählen: coachings_archive hat keinen Fremdschlüssel auf users,
+    # ein späteres Zurückholen (app/retention.py) bräuchte den Coach aber wieder
+    if any(db.session.query(model.query.filter_by(coach_id=user_id).exists()).scalar()
+           for model in (Coaching, ArchivedCoaching)):
+        flash('Benutzer kann nicht gelöscht werden, da ihm noch Coachings zugeordnet sind (auch im Archiv).', 'danger')
+        return redirect(url_for('admin.panel'))
     
     try:
         if user.role == ROLE_TEAMLEITER and user.team_id_if_leader:
@@ -240,6 +316,7 @@ def edit_team(team_id):
             return redirect(url_for('admin.edit_team', team_id=team_id))
             
         try:
+            name_changed = team_to_edit.name != form.name.data
             team_to_edit.name = form.name.data
             new_leader_id = int(form.team_leader_id.data) if form.team_leader_id.data and str(form.team_leader_id.data).isdigit() else 0
             old_leader_id = team_to_edit.team_leader_id
@@ -262,6 +339,8 @@ def edit_team(team_id):
                         team_to_edit.team_leader_id = old_leader_id
                 else:
                     team_to_edit.team_leader_id = None
+            if name_changed:
+                refresh_search_documents(TeamMember.team_id == team_to_edit.id)
             
             db.session.commit()
             flash('Team erfolgreich aktualisiert!', 'success')
@@ -338,8 +417,11 @@ def edit_team_member(member_id):
 
     if form.validate_on_submit():
         try:
+            record_member_moved(member.id, member.team_id, form.team_id.data)
+            record_member_team_changed(member.id, form.team_id.data)
             member.name = form.name.data
             member.team_id = form.team_id.data
+            refresh_search_documents(Coaching.team_member_id == member.id)
             db.session.commit()
             flash('Teammitglied erfolgreich aktualisiert!', 'success')
             # <<< GEÄNDERT >>> Redirect back to the team edit page for better workflow
@@ -369,7 +451,10 @@ def move_to_archiv(member_id):
         return redirect(url_for('admin.panel'))
 
     try:
+        record_member_moved(member_to_move.id, original_team_id, archiv_team.id)
+        record_member_team_changed(member_to_move.id, archiv_team.id)
         member_to_move.team_id = archiv_team.id
+        refresh_search_documents(Coaching.team_member_id == member_to_move.id)
         db.session.commit()
         flash(f'Mitglied "{member_to_move.name}" wurde von Team "{original_team_name}" ins ARCHIV verschoben.', 'success')
     except Exception as e:
@@ -404,61 +489,87 @@ def move_to_archiv(member_id):
 
 
 # --- Coaching Management (Unverändert, aber hier zur Vollständigkeit) ---
+def get_filtered_coachings_query(args):
+    """
+    Baut die gefilterte Coaching-Abfrage der Coaching-Verwaltung (period, team, teammember, coach, search, tier)
+    aus den Request-Argumenten. Gemeinsam genutzt von manage_coachings und export_coachings.
+    tier='archiv' liest statt coachings die Archivtabelle (ArchivedCoaching, siehe app/retention.py).
+    Gibt (query, relevance_column, filters) zurück; relevance_column ist nur bei einer Volltextsuche gesetzt.
+    """
+    filters = {
+        'period': args.get('period', 'all'),
+        'team': args.get('team', 'all'),
+        'teammember': args.get('teammember', 'all'),
+        'coach': args.get('coach', 'all'),
+        'search': args.get('search', default="", type=str).strip(),
+        'tier': TIER_ARCHIVE if args.get('tier') == TIER_ARCHIVE else TIER_HOT,
+    }
+    model = tier_model(filters['tier'])
+    archive_tier = model is not Coaching
+
+    coachings_query = model.query \
+        .join(TeamMember, model.team_member_id == TeamMember.id) \
+        .join(User, model.coach_id == User.id, isouter=True) \
+        .join(Team, TeamMember.team_id == Team.id) \
+        .options(*coaching_list_options(model.coach_notes, model.project_leader_notes, model=model)) # Notizen werden hier nicht angezeigt
+
+    # <<< GEÄNDERT >>> Das ARCHIV-Team aus der Coaching-Verwaltung standardmäßig ausblenden (im Archiv-Bestand nicht)
+    if filters['team'] == 'all' and not archive_tier:
+         coachings_query = coachings_query.filter(Coaching.is_archived == false())
+
+    start_date, end_date = calculate_date_range(filters['period'])
+    if start_date:
+        coachings_query = coachings_query.filter(model.coaching_date >= start_date)
+    if end_date:
+        coachings_query = coachings_query.filter(model.coaching_date <= end_date)
+
+    if filters['team'] and filters['team'].isdigit():
+        coachings_query = coachings_query.filter(model.team_id == int(filters['team']))
+        if not archive_tier:
+            # is_archived mitfiltern, damit reguläre Teams den Teilindex über aktive Coachings nutzen
+            # (Team landet in der Identity-Map, manage_coachings holt es danach ohne weitere Abfrage)
+            team = db.session.get(Team, int(filters['team']))
+            coachings_query = coachings_query.filter(Coaching.is_archived == (team is not None and team.name == ARCHIV_TEAM_NAME))
+    if filters['teammember'] and filters['teammember'].isdigit():
+        coachings_query = coachings_query.filter(model.team_member_id == int(filters['teammember']))
+    if filters['coach'] and filters['coach'].isdigit():
+        coachings_query = coachings_query.filter(model.coach_id == int(filters['coach']))
+    
+    relevance_column = None
+    if filters['search']:
+        fallback_columns = (
+            TeamMember.name, User.username, Team.name,
+            model.coaching_subject, model.coaching_style, model.tcap_id,
+            model.coach_notes, model.project_leader_notes
+        )
+        if archive_tier: # archivierte Coachings haben keine Suchdokumente
+            coachings_query = apply_ilike_search(coachings_query, filters['search'], fallback_columns)
+        else:
+            coachings_query, relevance_column = apply_coaching_search(coachings_query, filters['search'], fallback_columns=fallback_columns)
+    return coachings_query, relevance_column, filters
+
 @bp.route('/manage_coachings', methods=['GET', 'POST'])
 @login_required
 @role_required([ROLE_ADMIN])
 def manage_coachings():
     # ... (Rest der Funktion bleibt unverändert)
-    page = request.args.get('page', 1, type=int)
-    period_filter_arg = request.args.get('period', 'all')
-    team_filter_arg = request.args.get('team', 'all')
-    team_member_filter_arg = request.args.get('teammember', 'all')
-    coach_filter_arg = request.args.get('coach', 'all')
-    search_term = request.args.get('search', default="", type=str).strip()
-
-    coachings_query = Coaching.query \
-        .join(TeamMember, Coaching.team_member_id == TeamMember.id) \
-        .join(User, Coaching.coach_id == User.id, isouter=True) \
-        .join(Team, TeamMember.team_id == Team.id)
-
-    # <<< GEÄNDERT >>> Das ARCHIV-Team aus der Coaching-Verwaltung standardmäßig ausblenden
-    if team_filter_arg == 'all':
-         coachings_query = coachings_query.filter(Team.name != ARCHIV_TEAM_NAME)
-
-    start_date, end_date = calculate_date_range(period_filter_arg)
-    if start_date:
-        coachings_query = coachings_query.filter(Coaching.coaching_date >= start_date)
-    if end_date:
-        coachings_query = coachings_query.filter(Coaching.coaching_date <= end_date)
-
-    if team_filter_arg and team_filter_arg.isdigit():
-        coachings_query = coachings_query.filter(TeamMember.team_id == int(team_filter_arg))
-    if team_member_filter_arg and team_member_filter_arg.isdigit():
-        coachings_query = coachings_query.filter(Coaching.team_member_id == int(team_member_filter_arg))
-    if coach_filter_arg and coach_filter_arg.isdigit():
-        coachings_query = coachings_query.filter(Coaching.coach_id == int(coach_filter_arg))
-    
-    if search_term:
-        search_pattern = f"%{search_term}%"
-        coachings_query = coachings_query.filter(
-            or_(
-                TeamMember.name.ilike(search_pattern),
-                User.username.ilike(search_pattern),
-                Team.name.ilike(search_pattern),
-                Coaching.coaching_subject.ilike(search_pattern),
-                Coaching.coaching_style.ilike(search_pattern),
-                Coaching.tcap_id.ilike(search_pattern),
-                Coaching.coach_notes.ilike(search_pattern),
-                Coaching.project_leader_notes.ilike(search_pattern)
-            )
-        )
-    
-    if request.method == 'POST':
+    after_arg = request.args.get('after'); before_arg = request.args.get('before')
+    coachings_query, relevance_column, filters = get_filtered_coachings_query(request.args)
+    period_filter_arg = filters['period']
+    team_filter_arg = filters['team']
+    team_member_filter_arg = filters['teammember']
+    coach_filter_arg = filters['coach']
+    search_term = filters['search']
+    tier_arg = filters['tier']
+
+    if request.method == 'POST' and tier_arg == TIER_HOT: # archivierte Coachings sind schreibgeschützt
         if 'delete_selected' in request.form:
             coaching_ids_to_delete = request.form.getlist('coaching_ids')
             if coaching_ids_to_delete:
                 try:
                     coaching_ids_to_delete_int = [int(id_str) for id_str in coaching_ids_to_delete]
+                    record_coachings_deleted(Coaching.id.in_(coaching_ids_to_delete_int))
+                    remove_search_documents(Coaching.id.in_(coaching_ids_to_delete_int))
                     deleted_count = Coaching.query.filter(Coaching.id.in_(coaching_ids_to_delete_int)).delete(synchronize_session='fetch')
                     db.session.commit()
                     flash(f'{deleted_count} Coaching(s) erfolgreich gelöscht.', 'success')
@@ -468,16 +579,17 @@ def manage_coachings():
                     db.session.rollback()
                     current_app.logger.error(f"Fehler beim Löschen von Coachings: {e}")
                     flash(f'Fehler beim Löschen der Coachings: {str(e)}', 'danger')
-                return redirect(url_for('admin.manage_coachings', page=page, period=period_filter_arg, team=team_filter_arg,teammember=team_member_filter_arg,coach=coach_filter_arg,search=search_term))
+                return redirect(url_for('admin.manage_coachings', after=after_arg, before=before_arg, period=period_filter_arg, team=team_filter_arg,teammember=team_member_filter_arg,coach=coach_filter_arg,search=search_term,tier=tier_arg))
             else:
                 flash('Keine Coachings zum Löschen ausgewählt.', 'info')
 
-    coachings_paginated = coachings_query.order_by(desc(Coaching.coaching_date))\
-        .paginate(page=page, per_page=15, error_out=False)
+    coachings_paginated = keyset_paginate(coachings_query, per_page=15, after=after_arg, before=before_arg, rank_column=relevance_column)
 
-    all_teams = Team.query.order_by(Team.name).all() # Hier alle anzeigen, inkl. ARCHIV für Filterung
-    all_team_members = TeamMember.query.order_by(TeamMember.name).all()
-    all_coaches = User.query.filter(User.coachings_done.any()).distinct().order_by(User.username).all()
+    # <<< GEÄNDERT >>> Die Filter-Dropdowns laden ihre Einträge per Präfix-Suche nach (lookup_teams,
+    # lookup_team_members, lookup_coaches); hier nur die aktuell gewählten Einträge
+    selected_team = Team.query.get(int(team_filter_arg)) if team_filter_arg.isdigit() else None
+    selected_team_member = TeamMember.query.get(int(team_member_filter_arg)) if team_member_filter_arg.isdigit() else None
+    selected_coach = User.query.get(int(coach_filter_arg)) if coach_filter_arg.isdigit() else None
 
     now_dt = datetime.now(timezone.utc)
     current_year_val = now_dt.year
@@ -492,18 +604,64 @@ def manage_coachings():
     return render_template('admin/manage_coachings.html', 
                            title='Coachings Verwalten',
                            coachings_paginated=coachings_paginated,
-                           all_teams=all_teams,
-                           all_team_members=all_team_members,
-                           all_coaches=all_coaches,
+                           selected_team=selected_team,
+                           selected_team_member=selected_team_member,
+                           selected_coach=selected_coach,
                            month_options=month_options_for_filter,
                            current_period_filter=period_filter_arg,
                            current_team_id_filter=team_filter_arg,
                            current_teammember_id_filter=team_member_filter_arg,
                            current_coach_id_filter=coach_filter_arg,
                            current_search_term=search_term,
+                           current_tier=tier_arg,
+                           TIER_ARCHIVE=TIER_ARCHIVE,
                            config=current_app.config,
                            ARCHIV_TEAM_NAME=ARCHIV_TEAM_NAME) # <<< NEU >>> an Template übergeben
 
+@bp.route('/manage_coachings/export')
+@login_required
+@role_required([ROLE_ADMIN])
+def export_coachings():
+    """Exportiert alle Coachings mit den Filtern der Coaching-Verwaltung (inkl. tier) als CSV oder XLSX (gestreamt)."""
+    from app.export import EXPORT_FORMATS, export_rows # erst bei Bedarf laden (Worker-Start)
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        abort(400)
+    coachings_query, relevance_column, filters = get_filtered_coachings_query(request.args)
+    writer, mimetype, extension = EXPORT_FORMATS[export_format]
+    prefix = 'coachings_archiv' if filters['tier'] == TIER_ARCHIVE else 'coachings'
+    filename = f"{prefix}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M')}.{extension}"
+    return Response(
+        stream_with_context(writer(export_rows(coachings_query, relevance_column))),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"', 'X-Accel-Buffering': 'no'}
+    )
+
+@bp.route('/manage_coachings/import', methods=['GET', 'POST'])
+@login_required
+@role_required([ROLE_ADMIN])
+def import_coachings_view():
+    from app.importer import import_coachings # erst bei Bedarf laden (Worker-Start)
+    form = CoachingImportForm()
+    result = None
+    if form.validate_on_submit():
+        text_stream = io.TextIOWrapper(form.csv_file.data.stream, encoding='utf-8-sig', newline='')
+        try:
+            result = import_coachings(text_stream, dry_run=form.dry_run.data, skip_invalid=form.skip_invalid.data)
+            if result.dry_run:
+                flash(f'Probelauf: {len(result.valid_rows)} von {result.total_rows} Zeilen gültig, {result.error_rows} fehlerhaft.', 'info')
+            elif result.imported:
+                flash(f'{result.imported} Coaching(s) importiert.' + (f' {result.error_rows} fehlerhafte Zeile(n) übersprungen.' if result.errors else ''), 'success')
+            else:
+                flash('Nichts importiert – bitte die Fehler unten korrigieren.', 'danger')
+        except UnicodeDecodeError:
+            flash('Die Datei ist nicht UTF-8-kodiert. Bitte als "CSV UTF-8" speichern.', 'danger')
+        except Exception as e:
+            current_app.logger.error(f"Fehler beim Coaching-Import: {e}")
+            flash(f'Fehler beim Import: {str(e)}', 'danger')
+    return render_template('admin/import_coachings.html', title='Coachings importieren', form=form, result=result,
+                           max_errors_shown=IMPORT_ERRORS_SHOWN, config=current_app.config)
+
 # ... (Rest der Datei bleibt gleich) ...
 @bp.route('/coaching/<int:coaching_id>/edit', methods=['GET', 'POST'])
 @login_required
@@ -511,10 +669,16 @@ def manage_coachings():
 def edit_coaching_entry(coaching_id):
     coaching_to_edit = Coaching.query.get_or_404(coaching_id)
     form = CoachingForm(obj=coaching_to_edit, current_user_role=ROLE_ADMIN, current_user_team_id=None)
+    # Choices müssen VOR der Validierung gesetzt sein (alle Teams inkl. Archiv, damit alte Einträge bearbeitbar bleiben)
+    form.update_team_member_choices(exclude_archiv=False)
 
     if form.validate_on_submit():
         try:
+            old_stats = coaching_stats_snapshot(coaching_to_edit)
             form.populate_obj(coaching_to_edit)
+            assign_coaching_team(coaching_to_edit)
+            record_coaching_changed(old_stats, coaching_to_edit)
+            index_coaching(coaching_to_edit)
             db.session.commit()
             flash(f'Coaching ID {coaching_id} erfolgreich aktualisiert!', 'success')
             return redirect(url_for('admin.manage_coachings'))
@@ -522,22 +686,7 @@ def edit_coaching_entry(coaching_id):
             db.session.rollback()
             current_app.logger.error(f"Error updating coaching ID {coaching_id}: {e}")
             flash(f'Fehler beim Aktualisieren von Coaching ID {coaching_id}.', 'danger')
-    elif request.method == 'GET':
-        pass
-
-    if request.method == 'GET' or not form.validate_on_submit():
-        generated_choices = []
-        all_teams = Team.query.order_by(Team.name).all() # Alle Teams inkl. Archiv, damit alte Einträge bearbeitbar bleiben
-        for team_obj_form in all_teams:
-            members = TeamMember.query.filter_by(team_id=team_obj_form.id).order_by(TeamMember.name).all()
-            for m in members:
-                generated_choices.append((m.id, f"{m.name} ({team_obj_form.name})"))
-        
-        if not generated_choices:
-            form.team_member_id.choices = []
-        else:
-            form.team_member_id.choices = generated_choices
-        
+    else:
         form.team_member_id.data = coaching_to_edit.team_member_id
 
     tcap_js_for_edit = """ ... """ # (unverändert)
@@ -555,6 +704,8 @@ def edit_coaching_entry(coaching_id):
 def delete_coaching_entry(coaching_id):
     coaching = Coaching.query.get_or_404(coaching_id)
     try:
+        record_coaching_deleted(coaching)
+        remove_search_documents(Coaching.id == coaching.id)
         db.session.delete(coaching)
         db.session.commit()
         flash(f'Coaching ID {coaching_id} erfolgreich gelöscht.', 'success')
@@ -0,0 +1,262 @@
+# app/cache.py
+# Cache für Dashboard-Aggregate (Charts und Gesamtsummen der Startseite).
+# Einträge werden unter (Bereich, Name, Generation, Schlüssel) abgelegt. Jeder Bereich (CACHE_SCOPES)
+# hat eine eigene Generation, die nach jedem commit() erhöht wird, der eine seiner Tabellen ändert –
+# ältere Einträge werden damit nie mehr gelesen.
+#   'dashboard' – Charts und Gesamtsummen (Coachings, Teams, Teammitglieder, Tages-Rollup)
+#   'members'   – Auswahllisten der Teammitglieder (nur Teams und Teammitglieder)
+# Die Generation von 'dashboard' dient den JSON-APIs als Datenversion für ETags (conditional_get).
+#
+# Backends (Config DASHBOARD_CACHE_BACKEND):
+#   'lru'    – In-Process-LRU, nur für einen einzelnen Worker geeignet (Generation lebt im Prozess)
+#   'sqlite' – gemeinsame SQLite-Datei (DASHBOARD_CACHE_PATH) für mehrere gunicorn-Worker auf einem Host
+#   'none'   – Cache deaktiviert
+
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, has_app_context, make_response, request
+from flask_login import current_user
+from app import db
+
+DEFAULT_SCOPE = 'dashboard'
+CACHE_SCOPES = {
+    'dashboard': {'coachings', 'teams', 'team_members', 'coaching_daily_stats'},
+    'members': {'teams', 'team_members'},
+}
+SESSION_DIRTY_FLAG = 'dashboard_cache_dirty' # Menge der betroffenen Bereiche
+
+class NullCacheBackend:
+    epoch = None # kein Cache -> keine Datenversion, keine ETags
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, generation, ttl, scope=DEFAULT_SCOPE):
+        pass
+
+    def generation(self, scope=DEFAULT_SCOPE):
+        return 0
+
+    def bump_generation(self, scope=DEFAULT_SCOPE):
+        pass
+
+class LRUCacheBackend:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._reset()
+        # gunicorn preload_app: Backend entsteht im Master; jeder (auch neu gestartete) Worker braucht eine
+        # eigene Epoche, sonst träfe sein Generationsstand 0 auf ETags, die ein anderer Prozess vergeben hat
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._entries = OrderedDict() # key -> (expires_at, value, scope)
+        self._generations = {}
+        self.epoch = secrets.token_hex(4) # neu pro Prozess, weil die Generation bei jedem Start wieder bei 0 beginnt
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, generation, ttl, scope=DEFAULT_SCOPE):
+        with self._lock:
+            if generation != self._generations.get(scope, 0):
+                return # Während der Berechnung wurde geschrieben – Ergebnis nicht mehr ablegen
+            self._entries[key] = (time.time() + ttl, value, scope)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self, scope=DEFAULT_SCOPE):
+        return self._generations.get(scope, 0)
+
+    def bump_generation(self, scope=DEFAULT_SCOPE):
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in [k for k, entry in self._entries.items() if entry[2] == scope]:
+                del self._entries[key]
+
+class SQLiteCacheBackend:
+    """Gemeinsamer Cache in einer SQLite-Datei; eine Verbindung pro Thread, WAL für parallele Leser."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._reset_connections) # gunicorn preload_app: keine Verbindung aus dem Master erben
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_entries ("
+                         "key TEXT PRIMARY KEY, generation INTEGER NOT NULL, expires_at REAL NOT NULL, value TEXT NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('epoch', ?)", (secrets.randbits(31),))
+            self.epoch = conn.execute("SELECT value FROM cache_meta WHERE name = 'epoch'").fetchone()[0]
+
+    def _reset_connections(self):
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connection().execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires_at >= ?", (key, time.time())
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _meta_name(scope):
+        return 'generation' if scope == DEFAULT_SCOPE else f'generation:{scope}'
+
+    def set(self, key, value, generation, ttl, scope=DEFAULT_SCOPE):
+        with self._connection() as conn:
+            now = time.time()
+            conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, generation, expires_at, value) "
+                "SELECT ?, ?, ?, ? WHERE coalesce((SELECT value FROM cache_meta WHERE name = ?), 0) = ?",
+                (key, generation, now + ttl, json.dumps(value, default=float), self._meta_name(scope), generation)
+            )
+
+    def generation(self, scope=DEFAULT_SCOPE):
+        row = self._connection().execute("SELECT value FROM cache_meta WHERE name = ?", (self._meta_name(scope),)).fetchone()
+        return row[0] if row else 0
+
+    def bump_generation(self, scope=DEFAULT_SCOPE):
+        with self._connection() as conn:
+            conn.execute("INSERT INTO cache_meta (name, value) VALUES (?, 1) "
+                         "ON CONFLICT(name) DO UPDATE SET value = value + 1", (self._meta_name(scope),))
+            conn.execute("DELETE FROM cache_entries WHERE key LIKE ? AND generation < "
+                         "(SELECT value FROM cache_meta WHERE name = ?)", (f'{scope}:%', self._meta_name(scope)))
+
+def create_backend(app):
+    backend_name = app.config.get('DASHBOARD_CACHE_BACKEND', 'lru')
+    if backend_name == 'lru':
+        return LRUCacheBackend(app.config.get('DASHBOARD_CACHE_MAX_ENTRIES', 256))
+    if backend_name == 'sqlite':
+        path = app.config.get('DASHBOARD_CACHE_PATH') or os.path.join(app.instance_path, 'dashboard_cache.sqlite3')
+        return SQLiteCacheBackend(path)
+    if backend_name == 'none':
+        return NullCacheBackend()
+    raise ValueError(f"Unbekanntes DASHBOARD_CACHE_BACKEND: {backend_name!r}")
+
+class DashboardCache:
+    """Flask-Erweiterung; das Backend wird pro App in app.extensions['dashboard_cache'] gehalten."""
+
+    def init_app(self, app):
+        app.extensions['dashboard_cache'] = create_backend(app)
+
+    @property
+    def backend(self):
+        return current_app.extensions.get('dashboard_cache') or NullCacheBackend()
+
+    def get_or_compute(self, name, key_parts, compute, scope=DEFAULT_SCOPE):
+        backend = self.backend
+        generation = backend.generation(scope) # VOR der Berechnung lesen, sonst könnten veraltete Werte abgelegt werden
+        key = ':'.join([scope, name, str(generation)] + [str(p) for p in key_parts])
+        value = backend.get(key)
+        if value is None:
+            value = compute()
+            backend.set(key, value, generation, current_app.config.get('DASHBOARD_CACHE_TTL', 600), scope)
+        return value
+
+    def cached(self, name, key_func, scope=DEFAULT_SCOPE):
+        """Decorator: cacht das Ergebnis unter key_func(*args, **kwargs). Die ungecachte Funktion bleibt als .uncached erreichbar."""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return self.get_or_compute(name, key_func(*args, **kwargs), lambda: func(*args, **kwargs), scope)
+            wrapper.uncached = func
+            return wrapper
+        return decorator
+
+    def invalidate(self, scope=DEFAULT_SCOPE):
+        self.backend.bump_generation(scope)
+
+    def data_version(self):
+        """Aktuelle Datenversion ('epoch.generation') oder None, wenn kein Cache aktiv ist."""
+        backend = self.backend
+        if backend.epoch is None:
+            return None
+        return f"{backend.epoch}.{backend.generation()}"
+
+dashboard_cache = DashboardCache()
+
+def conditional_get(name):
+    """
+    Decorator für JSON-APIs: starker ETag aus Datenversion, Benutzer und Query-String.
+    Passt If-None-Match, wird 304 geantwortet, ohne die View (und damit die DB) aufzurufen.
+    Ohne aktiven Cache (DASHBOARD_CACHE_BACKEND='none') werden keine ETags gesetzt.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            version = dashboard_cache.data_version()
+            if version is None:
+                return func(*args, **kwargs)
+            query = '&'.join(f"{k}={v}" for k, v in sorted(request.args.items(multi=True)))
+            ttl_bucket = int(time.time() // current_app.config.get('DASHBOARD_CACHE_TTL', 600)) # gleiches Sicherheitsnetz wie die Cache-TTL
+            etag = hashlib.sha1(f"{name}|{version}|{ttl_bucket}|{current_user.get_id()}|{query}".encode('utf-8')).hexdigest()
+            if etag in request.if_none_match:
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(func(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache' # Browser darf speichern, muss aber jedes Mal revalidieren
+            response.vary.add('Cookie')
+            return response
+        return wrapper
+    return decorator
+
+# --- Invalidierung über Session-Events ---
+
+def _mark_dirty(session, table_name):
+    for scope, tables in CACHE_SCOPES.items():
+        if table_name in tables:
+            session.info.setdefault(SESSION_DIRTY_FLAG, set()).add(scope)
+
+def _mark_dirty_after_flush(session, flush_context):
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        _mark_dirty(session, getattr(obj, '__tablename__', None))
+
+def _mark_dirty_on_dml(orm_execute_state):
+    # Bulk-Statements (Query.delete/update, Core-Inserts ins Rollup) laufen nicht über den Flush
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, 'table', None)
+    _mark_dirty(orm_execute_state.session, getattr(table, 'name', None))
+
+def _invalidate_after_commit(session):
+    scopes = session.info.pop(SESSION_DIRTY_FLAG, None)
+    if scopes and has_app_context():
+        for scope in scopes:
+            dashboard_cache.invalidate(scope)
+
+def _clear_flag_after_rollback(session):
+    session.info.pop(SESSION_DIRTY_FLAG, None)
+
+db.event.listen(db.session, 'after_flush', _mark_dirty_after_flush)
+db.event.listen(db.session, 'do_orm_execute', _mark_dirty_on_dml)
+db.event.listen(db.session, 'after_commit', _invalidate_after_commit)
+db.event.listen(db.session, 'after_rollback', _clear_flag_after_rollback)
@@ -0,0 +1,176 @@
+# app/commands.py
+# Flask-CLI-Befehle (Aufruf z.B. mit: flask rebuild-daily-stats)
+
+import click
+
+def register_commands(app):
+
+    @app.cli.command('rebuild-daily-stats')
+    def rebuild_daily_stats_command():
+        """Baut die Rollup-Tabelle coaching_daily_stats aus allen Coachings neu auf."""
+        from app.rollup import rebuild_daily_stats
+        row_count = rebuild_daily_stats()
+        click.echo(f"coaching_daily_stats neu aufgebaut: {row_count} Zeilen.")
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index_command():
+        """Baut die Suchdokumente (Volltextsuche) aller Coachings neu auf."""
+        from app.search import rebuild_search_index, search_backend
+        doc_count = rebuild_search_index()
+        backend = search_backend() or 'keiner (ILIKE-Fallback)'
+        click.echo(f"coaching_search_documents neu aufgebaut: {doc_count} Dokumente, Suchindex: {backend}.")
+
+    @app.cli.command('rebuild-coaching-teams')
+    def rebuild_coaching_teams_command():
+        """Setzt team_id/is_archived aller Coachings neu aus dem aktuellen Team ihres Mitglieds."""
+        from app.membership import rebuild_coaching_teams
+        changed = rebuild_coaching_teams()
+        click.echo(f"coachings.team_id/is_archived abgeglichen: {changed} Coachings korrigiert.")
+
+    @app.cli.command('archive-coachings')
+    @click.option('--older-than-years', type=click.IntRange(min=1), default=None,
+                  help='Coachings älter als N Jahre verschieben (Standard: COACHING_RETENTION_YEARS).')
+    @click.option('--archived-members/--no-archived-members', default=True, show_default=True,
+                  help='Coachings von Mitgliedern im ARCHIV verschieben.')
+    @click.option('--batch-size', type=click.IntRange(min=1), default=1000, show_default=True, help='Coachings pro Transaktion.')
+    @click.option('--dry-run', is_flag=True, help='Nur zählen, nichts verschieben.')
+    def archive_coachings_command(older_than_years, archived_members, batch_size, dry_run):
+        """Verschiebt alte bzw. archivierte Coachings in die Archivtabelle coachings_archive (Cold-Storage)."""
+        from app import db
+        from app.models import Coaching
+        from app.retention import archive_coachings, retention_criterion
+        years = older_than_years or app.config.get('COACHING_RETENTION_YEARS') or None
+        criterion = retention_criterion(older_than_years=years, archived_members=archived_members)
+        if criterion is None:
+            raise click.ClickException("Keine Regel aktiv – --older-than-years angeben oder --archived-members verwenden.")
+        rules = ', '.join(([f"älter als {years} Jahr(e)"] if years else []) + (["Mitglieder im ARCHIV"] if archived_members else []))
+        if dry_run:
+            count = db.session.query(db.func.count(Coaching.id)).filter(criterion).scalar()
+            click.echo(f"{count} Coachings betroffen ({rules}). Probelauf – nichts verschoben.")
+            return
+        moved = archive_coachings(criterion, batch_size=batch_size)
+        click.echo(f"{moved} Coachings nach coachings_archive verschoben ({rules}).")
+
+    @app.cli.command('restore-coachings')
+    @click.option('--member-id', 'member_ids', type=int, multiple=True, help='Nur Coachings dieses Mitglieds (mehrfach möglich).')
+    @click.option('--all', 'restore_all', is_flag=True, help='Alle archivierten Coachings zurückholen.')
+    @click.option('--batch-size', type=click.IntRange(min=1), default=1000, show_default=True, help='Coachings pro Transaktion.')
+    def restore_coachings_command(member_ids, restore_all, batch_size):
+        """Holt Coachings aus coachings_archive zurück (z.B. nach der Reaktivierung eines Mitglieds)."""
+        from app import db
+        from app.models import ArchivedCoaching
+        from app.retention import orphaned_archive_criterion, restore_coachings
+        if not member_ids and not restore_all:
+            raise click.ClickException("--member-id oder --all angeben.")
+        criterion = ArchivedCoaching.team_member_id.in_(member_ids) if member_ids else db.true()
+        restored = restore_coachings(criterion, batch_size=batch_size)
+        click.echo(f"{restored} Coachings aus coachings_archive zurückgeholt.")
+        orphaned = ArchivedCoaching.query.filter(criterion, orphaned_archive_criterion()).count()
+        if orphaned:
+            click.echo(f"{orphaned} Coachings bleiben im Archiv: Coach oder Teammitglied existiert nicht mehr.", err=True)
+
+    @app.cli.command('ensure-coaching-partitions')
+    @click.option('--years-ahead', type=click.IntRange(min=0), default=1, show_default=True,
+                  help='Jahrespartitionen über das laufende Jahr hinaus anlegen.')
+    def ensure_coaching_partitions_command(years_ahead):
+        """Legt fehlende Jahrespartitionen von coachings an (nur PostgreSQL nach Migration 9e4b2c6d1f37)."""
+        from app.partitioning import coaching_partitions, coachings_partitioned, ensure_coaching_partitions
+        if not coachings_partitioned():
+            click.echo("coachings ist nicht partitioniert (nur PostgreSQL) – nichts zu tun.")
+            return
+        created = ensure_coaching_partitions(years_ahead=years_ahead)
+        click.echo(f"Neu angelegt: {', '.join(map(str, created))}." if created else "Alle Jahrespartitionen vorhanden.")
+        for name, bounds, rows in coaching_partitions():
+            click.echo(f"  {name}: {bounds} (~{max(rows, 0)} Zeilen)")
+
+    @app.cli.command('import-coachings')
+    @click.argument('csv_path', type=click.Path(exists=True, dir_okay=False))
+    @click.option('--dry-run', is_flag=True, help='Nur prüfen, nichts speichern.')
+    @click.option('--skip-invalid', is_flag=True, help='Gültige Zeilen auch bei fehlerhaften anderen Zeilen importieren.')
+    def import_coachings_command(csv_path, dry_run, skip_invalid):
+        """Importiert Coachings aus einer CSV-Datei (Spalten wie im CSV-Export)."""
+        from app.importer import import_coachings
+        with open(csv_path, encoding='utf-8-sig', newline='') as csv_file:
+            result = import_coachings(csv_file, dry_run=dry_run, skip_invalid=skip_invalid)
+        for line_no, message in result.errors:
+            click.echo(f"Zeile {line_no}: {message}", err=True)
+        click.echo(f"{result.total_rows} Zeilen gelesen, {len(result.valid_rows)} gültig, {result.error_rows} fehlerhaft.")
+        if dry_run:
+            click.echo("Probelauf – nichts gespeichert.")
+        elif result.imported:
+            click.echo(f"{result.imported} Coachings importiert.")
+        else:
+            click.echo("Nichts importiert.")
+            raise SystemExit(1)
+
+    @app.cli.command('seed')
+    @click.option('--teams', default=20, show_default=True, help='Anzahl der Teams (ohne ARCHIV).')
+    @click.option('--members-per-team', default=15, show_default=True)
+    @click.option('--archived-members', default=50, show_default=True, help='Mitglieder im Team ARCHIV.')
+    @click.option('--coachings', default=50000, show_default=True)
+    @click.option('--days', default=730, show_default=True, help='Zeitraum der Coachings bis heute.')
+    @click.option('--seed', 'seed_value', default=1, show_default=True, help='Zufalls-Seed (gleicher Seed = gleiche Daten).')
+    @click.option('--password', default='seed', show_default=True, help='Passwort aller angelegten Benutzer.')
+    @click.option('--reset', is_flag=True, help='Alle Tabellen löschen und neu anlegen (drop_all/create_all).')
+    @click.option('--yes', is_flag=True, help='Keine Rückfrage bei --reset.')
+    def seed_command(teams, members_per_team, archived_members, coachings, days, seed_value, password, reset, yes):
+        """Befüllt eine leere Datenbank mit synthetischen Teams, Mitgliedern und Coachings (Entwicklung, Benchmarks)."""
+        import time
+        from app import db
+        from app.seed import seed_database, database_is_empty
+        url = db.engine.url.render_as_string(hide_password=True)
+        if reset:
+            if not yes:
+                click.confirm(f"ALLE Daten in {url} löschen?", abort=True)
+            db.drop_all()
+        db.create_all() # legt nur fehlende Tabellen an
+        if not database_is_empty():
+            raise click.ClickException("Die Datenbank enthält bereits Daten – mit --reset neu anlegen.")
+        started_at = time.perf_counter()
+        counts = seed_database(teams=teams, members_per_team=members_per_team, archived_members=archived_members,
+                               coachings=coachings, days=days, seed=seed_value, password=password)
+        click.echo(f"{counts['coachings']} Coachings, {counts['team_members']} Teammitglieder "
+                   f"(davon {counts['archived_members']} archiviert), {counts['teams']} Teams, {counts['users']} Benutzer "
+                   f"in {time.perf_counter() - started_at:.1f}s angelegt ({url}).")
+        click.echo(f"Anmeldung z.B. als 'admin', 'pl', 'qm1' oder 'tl001' mit Passwort '{password}'.")
+
+    @app.cli.command('startup-profile')
+    @click.option('--top', default=20, show_default=True, help='Anzahl der angezeigten Module.')
+    @click.option('--runs', default=3, show_default=True, help='Anzahl der Messläufe (Kaltstart = Median).')
+    def startup_profile_command(top, runs):
+        """Misst den Worker-Kaltstart (Import von 'app' + create_app) in frischen Prozessen, mit Importzeit pro Modul."""
+        import json
+        import os
+        import statistics
+        import subprocess
+        import sys
+        script = ("import json; from app import create_app; a = create_app(); "
+                  "print(json.dumps(a.extensions['startup_profile']))")
+        env = dict(os.environ, LOG_LEVEL='WARNING')
+        profiles, import_times = [], {}
+        for _ in range(runs):
+            proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', script], capture_output=True, text=True,
+                                  env=env, cwd=os.path.dirname(app.root_path))
+            if proc.returncode != 0:
+                raise click.ClickException(f"App-Start fehlgeschlagen:\n{proc.stderr[-2000:]}")
+            profiles.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            # Zeilenformat: "import time: <self us> | <kumuliert us> | <Einrückung><Modul>"
+            for line in proc.stderr.splitlines():
+                if not line.startswith('import time:') or 'cumulative' in line:
+                    continue
+                self_us, cumulative_us, module = line[len('import time:'):].split('|')
+                import_times.setdefault(module.strip(), []).append((int(self_us), int(cumulative_us)))
+
+        cold_start = statistics.median(p['cold_start_ms'] for p in profiles)
+        create_app_ms = statistics.median(p['create_app_ms'] for p in profiles)
+        click.echo(f"Kaltstart (Median aus {runs}): {cold_start:.1f} ms, davon create_app {create_app_ms:.1f} ms "
+                   f"(ohne Start des Python-Interpreters)")
+
+        medians = {module: (statistics.median(t[0] for t in times) / 1000, statistics.median(t[1] for t in times) / 1000)
+                   for module, times in import_times.items()}
+        for title, modules in (("Top-Level-Pakete", [m for m in medians if '.' not in m]),
+                               ("Module der App", [m for m in medians if m == 'app' or m.startswith('app.')])):
+            click.echo(f"\n{title} nach kumulierter Importzeit:")
+            click.echo(f"  {'Modul':<40} {'kumuliert ms':>13} {'selbst ms':>10}")
+            for module in sorted(modules, key=lambda m: medians[m][1], reverse=True)[:top]:
+                click.echo(f"  {module:<40} {medians[module][1]:>13.1f} {medians[module][0]:>10.1f}")
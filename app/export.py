@@ -0,0 +1,168 @@
+# app/export.py
+# Streaming-Export von Coachings als CSV oder XLSX.
+# Die Zeilen werden per Server-Side-Cursor (yield_per) gelesen und blockweise an den Client
+# geschrieben – der Speicherbedarf bleibt unabhängig von der Anzahl der Zeilen konstant.
+# XLSX wird ohne Zusatzbibliothek erzeugt (SpreadsheetML mit Inline-Strings in einem gestreamten ZIP).
+
+import csv
+import io
+import re
+import zipfile
+from decimal import Decimal
+from xml.sax.saxutils import escape
+from app.models import User, Team, TeamMember, Coaching, LEITFADEN_FIELDS
+
+EXPORT_BATCH_SIZE = 1000 # Zeilen pro DB-Fetch und pro geschriebenem Block
+
+def export_columns(model=Coaching):
+    """(Überschrift, Spalte) der Exportspalten für Coaching bzw. ArchivedCoaching (Archiv-Bestand)."""
+    return [
+        ("ID", model.id),
+        ("Datum (UTC)", model.coaching_date),
+        ("Teammitglied", TeamMember.name),
+        ("Team", Team.name),
+        ("Coach", User.username),
+        ("Coaching-Stil", model.coaching_style),
+        ("TCAP ID", model.tcap_id),
+        ("Thema", model.coaching_subject),
+        ("Note (0-10)", model.performance_mark),
+        ("Zeit (Min.)", model.time_spent),
+    ] + [(f"Leitfaden {label}", getattr(model, attr)) for label, attr in LEITFADEN_FIELDS] + [
+        ("Leitfaden-Erfüllung (%)", model.leitfaden_erfuellung_prozent),
+        ("Coach-Notizen", model.coach_notes),
+        ("Projektleiter-Notizen", model.project_leader_notes),
+    ]
+
+EXPORT_COLUMNS = export_columns()
+
+def export_rows(query, relevance_column=None):
+    """
+    Liefert die Exportzeilen (Tupel in der Reihenfolge von EXPORT_COLUMNS) für eine gefilterte
+    Coaching-Abfrage, in derselben Sortierung wie die Liste in der Coaching-Verwaltung.
+    """
+    model = query.column_descriptions[0]['entity'] # Coaching oder ArchivedCoaching
+    order = [model.coaching_date.desc(), model.id.desc()]
+    if relevance_column is not None:
+        order.insert(0, relevance_column.desc())
+    rows = query.with_entities(*[column for _, column in export_columns(model)])\
+        .order_by(*order)\
+        .yield_per(EXPORT_BATCH_SIZE)
+    for row in rows:
+        yield tuple(_export_value(value) for value in row)
+
+def _export_value(value):
+    if hasattr(value, 'isoformat'):
+        return value.strftime('%Y-%m-%d %H:%M')
+    if isinstance(value, (float, Decimal)): # Leitfaden-Erfüllung (PostgreSQL liefert Decimal)
+        return round(float(value), 1)
+    return value
+
+# Freitext (Notizen, Thema, Namen), der mit diesen Zeichen beginnt, würde Excel als Formel ausführen (CSV-Injection).
+# XLSX ist nicht betroffen: Zellen werden dort immer als Inline-Strings geschrieben.
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def iter_csv(rows):
+    """CSV mit Semikolon und UTF-8-BOM, damit Excel (deutsche Einstellungen) Umlaute und Spalten korrekt erkennt."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=';')
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8') # Kopfzeile sofort senden
+    buffer.seek(0); buffer.truncate()
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0); buffer.truncate(); pending = 0
+    if pending:
+        yield buffer.getvalue().encode('utf-8')
+
+class _ChunkSink(io.RawIOBase):
+    """Nicht-seekbares Ziel für zipfile; sammelt die geschriebenen Bytes bis zum nächsten drain()."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>',
+    '_rels/.rels':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>',
+    'xl/workbook.xml':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Coachings" sheetId="1" r:id="rId1"/></sheets></workbook>',
+    'xl/_rels/workbook.xml.rels':
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>',
+}
+
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def _xlsx_row(values):
+    return '<row>' + ''.join(_xlsx_cell(v) for v in values) + '</row>'
+
+def iter_xlsx(rows):
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            zf.writestr(name, content)
+        with zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                         + _xlsx_row([header for header, _ in EXPORT_COLUMNS])).encode('utf-8'))
+            sheet.flush()
+            yield sink.drain()
+            pending = []
+            for row in rows:
+                pending.append(_xlsx_row(row))
+                if len(pending) >= EXPORT_BATCH_SIZE:
+                    sheet.write(''.join(pending).encode('utf-8')); pending = []
+                    yield sink.drain()
+            sheet.write((''.join(pending) + '</sheetData></worksheet>').encode('utf-8'))
+    yield sink.drain()
+
+EXPORT_FORMATS = {
+    'csv': (iter_csv, 'text/csv', 'csv'),
+    'xlsx': (iter_xlsx, 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
@@ -1,10 +1,13 @@
 # app/forms.py
 from flask_wtf import FlaskForm
+from flask_wtf.file import FileField, FileRequired, FileAllowed
 from wtforms import StringField, PasswordField, BooleanField, SubmitField, SelectField, IntegerField, TextAreaField, HiddenField
 from wtforms.validators import DataRequired, EqualTo, ValidationError, Length, NumberRange 
 # <<< GEÄNDERT >>> Importiere die ARCHIV-Konstante
+from app import db
 from app.models import User, Team, TeamMember
 from app.utils import ARCHIV_TEAM_NAME
+from app.cache import dashboard_cache
 
 class LoginForm(FlaskForm):
     username = StringField('Benutzername', validators=[DataRequired("Benutzername ist erforderlich.")])
@@ -99,6 +102,24 @@ COACHING_SUBJECT_CHOICES = [
     ('Allgemein', 'Allgemein') 
 ]
 
+# <<< NEU >>> Alle Teammitglieder mit Team in EINER Abfrage, gecacht pro Archiv-Modus.
+# Wird bei Änderungen an Teams/Teammitgliedern invalidiert (Cache-Bereich 'members'), nicht bei neuen Coachings.
+def get_team_member_choice_rows(exclude_archiv=False, cached=True):
+    """
+    Liste von [member_id, member_name, team_id, team_name], sortiert nach Team- und Mitgliedsname.
+    cached=False liest direkt aus der DB (Validierung eines POST: der Cache anderer Worker kann veraltet sein).
+    """
+    def compute():
+        q = db.session.query(TeamMember.id, TeamMember.name, Team.id, Team.name)\
+            .join(Team, TeamMember.team_id == Team.id)
+        if exclude_archiv:
+            q = q.filter(Team.name != ARCHIV_TEAM_NAME)
+        return [list(row) for row in q.order_by(Team.name, Team.id, TeamMember.name).all()]
+    if not cached:
+        return compute()
+    mode = 'ohne_archiv' if exclude_archiv else 'alle'
+    return dashboard_cache.get_or_compute('team_member_choices', (mode,), compute, scope='members')
+
 class CoachingForm(FlaskForm):
     team_member_id = SelectField(
         'Teammitglied', 
@@ -133,26 +154,17 @@ class CoachingForm(FlaskForm):
         """
         Füllt dynamisch die Auswahl für team_member_id, basierend auf der Rolle des Benutzers
         und ob das Archiv ausgeschlossen werden soll.
+        Beim Absenden ungecacht, damit gerade angelegte oder verschobene Mitglieder gültige Auswahlen sind.
         """
-        generated_choices = [] 
-
+        cached = not self.is_submitted()
         if self.current_user_role == 'Teamleiter' and self.current_user_team_id:
             # Teamleiter sehen nur Mitglieder ihres eigenen Teams.
-            team_members = TeamMember.query.filter_by(team_id=self.current_user_team_id).order_by(TeamMember.name).all()
-            for m in team_members:
-                generated_choices.append((m.id, m.name))
+            generated_choices = [(member_id, member_name) for member_id, member_name, team_id, _ in get_team_member_choice_rows(cached=cached)
+                                 if team_id == self.current_user_team_id]
         else: 
             # Admins, QM, etc. sehen Mitglieder aus allen Teams.
-            query = Team.query
-            if exclude_archiv:
-                # Schließt das ARCHIV-Team aus, wenn angefordert (z.B. beim Hinzufügen eines neuen Coachings).
-                query = query.filter(Team.name != ARCHIV_TEAM_NAME)
-            
-            all_teams_for_choices = query.order_by(Team.name).all()
-            for team_obj in all_teams_for_choices:
-                members = TeamMember.query.filter_by(team_id=team_obj.id).order_by(TeamMember.name).all()
-                for m in members:
-                    generated_choices.append((m.id, f"{m.name} ({team_obj.name})"))
+            # Schließt das ARCHIV-Team aus, wenn angefordert (z.B. beim Hinzufügen eines neuen Coachings).
+            generated_choices = [(member_id, f"{member_name} ({team_name})") for member_id, member_name, _, team_name in get_team_member_choice_rows(exclude_archiv, cached=cached)]
         
         # Setzt die Choices. Wenn keine Mitglieder gefunden werden, ist die Liste leer,
         # was den DataRequired-Validator korrekt fehlschlagen lässt.
@@ -164,3 +176,9 @@ class ProjectLeaderNoteForm(FlaskForm):
                           validators=[DataRequired("Die Notiz darf nicht leer sein."), 
                                       Length(max=2000)])
     # coaching_id und submit werden im Template/Route gehandhabt
+
+class CoachingImportForm(FlaskForm):
+    csv_file = FileField('CSV-Datei', validators=[FileRequired("Bitte eine CSV-Datei auswählen."), FileAllowed(['csv', 'txt'], "Nur CSV-Dateien erlaubt.")])
+    dry_run = BooleanField('Nur prüfen (Probelauf, nichts wird gespeichert)', default=True)
+    skip_invalid = BooleanField('Fehlerhafte Zeilen überspringen und gültige trotzdem importieren')
+    submit = SubmitField('Import starten')
@@ -0,0 +1,234 @@
+# app/importer.py
+# Massenimport von Coachings aus CSV (Admin-Oberfläche und 'flask import-coachings').
+# Ablauf: alle Zeilen gegen die Regeln des CoachingForm prüfen (Namen über vorab geladene
+# Lookup-Maps auflösen), dann in großen Blöcken in EINER Transaktion einfügen –
+# per COPY auf PostgreSQL (psycopg2), sonst per executemany. Rollup und Suchdokumente
+# werden in derselben Transaktion nachgezogen.
+# Die Spaltenköpfe entsprechen denen des CSV-Exports (app/export.py), ein Export kann also
+# direkt wieder importiert werden. Unbekannte Spalten (z.B. "ID") werden ignoriert.
+
+import csv
+import io
+from collections import defaultdict
+from datetime import datetime
+from itertools import islice
+from sqlalchemy import func
+from app import db
+from app.models import User, Team, TeamMember, Coaching, LEITFADEN_FIELDS
+from app.forms import LEITFADEN_CHOICES, COACHING_SUBJECT_CHOICES
+from app.rollup import adjust_daily_stats
+from app.search import refresh_search_documents
+from app.utils import ARCHIV_TEAM_NAME
+
+IMPORT_BATCH_SIZE = 5000
+MAX_NOTES_LENGTH = 2000 # wie Length(max=2000) in CoachingForm / ProjectLeaderNoteForm
+
+COACHING_STYLES = ('Side-by-Side', 'TCAP')
+COACHING_SUBJECTS = tuple(value for value, _ in COACHING_SUBJECT_CHOICES if value)
+LEITFADEN_VALUES = {value.lower(): value for value, _ in LEITFADEN_CHOICES}
+DATE_FORMATS = ('%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d.%m.%Y %H:%M', '%d.%m.%Y')
+
+# Spalte in der CSV-Datei -> Feld
+IMPORT_COLUMNS = {
+    'Datum (UTC)': 'coaching_date',
+    'Teammitglied': 'team_member',
+    'Team': 'team', # optional, nur zur Unterscheidung gleichnamiger Mitglieder
+    'Coach': 'coach',
+    'Coaching-Stil': 'coaching_style',
+    'TCAP ID': 'tcap_id',
+    'Thema': 'coaching_subject',
+    'Note (0-10)': 'performance_mark',
+    'Zeit (Min.)': 'time_spent',
+    'Coach-Notizen': 'coach_notes',
+    'Projektleiter-Notizen': 'project_leader_notes',
+}
+IMPORT_COLUMNS.update({f"Leitfaden {label}": attr for label, attr in LEITFADEN_FIELDS})
+REQUIRED_COLUMNS = ('Datum (UTC)', 'Teammitglied', 'Coach', 'Coaching-Stil', 'Thema', 'Note (0-10)', 'Zeit (Min.)')
+
+INSERT_COLUMNS = ['team_member_id', 'team_id', 'is_archived', 'coach_id', 'coaching_date', 'coaching_style', 'tcap_id', 'coaching_subject',
+                  'coach_notes', 'project_leader_notes', 'performance_mark', 'time_spent'] + [attr for _, attr in LEITFADEN_FIELDS]
+
+class ImportResult:
+    def __init__(self, dry_run):
+        self.dry_run = dry_run
+        self.total_rows = 0
+        self.valid_rows = []
+        self.errors = [] # (Zeilennummer, Meldung)
+        self.imported = 0
+
+    @property
+    def error_rows(self):
+        return len({line for line, _ in self.errors})
+
+def _build_lookups():
+    """Lädt Mitglieder und Coaches einmalig: Name (casefold) -> Kandidaten bzw. ID."""
+    members = defaultdict(list)
+    for member_id, name, team_id, team_name in db.session.query(TeamMember.id, TeamMember.name, TeamMember.team_id, Team.name)\
+            .join(Team, TeamMember.team_id == Team.id):
+        members[name.strip().casefold()].append((member_id, team_id, team_name))
+    coaches = {username.strip().casefold(): user_id for user_id, username in db.session.query(User.id, User.username)}
+    return members, coaches
+
+def _parse_date(value):
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+def _parse_int(value, field_label, errors, minimum=None, maximum=None):
+    try:
+        number = int(value)
+    except ValueError:
+        errors.append(f"{field_label}: '{value}' ist keine ganze Zahl.")
+        return None
+    if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+        bounds = f"{minimum}-{maximum}" if maximum is not None else f">= {minimum}"
+        errors.append(f"{field_label}: {number} liegt nicht im erlaubten Bereich ({bounds}).")
+        return None
+    return number
+
+def validate_row(raw, members, coaches):
+    """Prüft eine CSV-Zeile. Gibt (werte_dict, team_id, fehlerliste) zurück."""
+    errors = []
+    get = lambda field: (raw.get(field) or '').strip()
+
+    coaching_date = _parse_date(get('coaching_date'))
+    if coaching_date is None:
+        errors.append(f"Datum: '{get('coaching_date')}' ist ungültig (erwartet z.B. 2024-03-31 14:30 oder 31.03.2024).")
+
+    member_id = team_id = team_name = None
+    candidates = members.get(get('team_member').casefold(), [])
+    if get('team'):
+        candidates = [c for c in candidates if c[2].casefold() == get('team').casefold()]
+    if not get('team_member'):
+        errors.append("Teammitglied ist erforderlich.")
+    elif not candidates:
+        errors.append(f"Teammitglied '{get('team_member')}' nicht gefunden" + (f" (Team '{get('team')}')." if get('team') else "."))
+    elif len(candidates) > 1:
+        errors.append(f"Teammitglied '{get('team_member')}' ist mehrdeutig ({', '.join(c[2] for c in candidates)}) – bitte Spalte 'Team' angeben.")
+    else:
+        member_id, team_id, team_name = candidates[0]
+
+    coach_id = coaches.get(get('coach').casefold())
+    if coach_id is None:
+        errors.append(f"Coach '{get('coach')}' nicht gefunden." if get('coach') else "Coach ist erforderlich.")
+
+    coaching_style = get('coaching_style')
+    if coaching_style not in COACHING_STYLES:
+        errors.append(f"Coaching-Stil '{coaching_style}' ist ungültig (erlaubt: {', '.join(COACHING_STYLES)}).")
+    tcap_id = get('tcap_id') if coaching_style == 'TCAP' and get('tcap_id') else None # wie in add_coaching
+
+    coaching_subject = get('coaching_subject')
+    if coaching_subject not in COACHING_SUBJECTS:
+        errors.append(f"Thema '{coaching_subject}' ist ungültig (erlaubt: {', '.join(COACHING_SUBJECTS)}).")
+
+    performance_mark = _parse_int(get('performance_mark'), "Note", errors, 0, 10) if get('performance_mark') else None
+    if not get('performance_mark'):
+        errors.append("Note ist erforderlich.")
+    time_spent = _parse_int(get('time_spent'), "Zeit", errors, 1) if get('time_spent') else None
+    if not get('time_spent'):
+        errors.append("Zeit ist erforderlich.")
+
+    values = {
+        'team_member_id': member_id, 'team_id': team_id, 'is_archived': team_name == ARCHIV_TEAM_NAME,
+        'coach_id': coach_id, 'coaching_date': coaching_date,
+        'coaching_style': coaching_style, 'tcap_id': tcap_id, 'coaching_subject': coaching_subject,
+        'performance_mark': performance_mark, 'time_spent': time_spent,
+    }
+    for label, attr in LEITFADEN_FIELDS:
+        value = LEITFADEN_VALUES.get(get(attr).lower() or 'k.a.')
+        if value is None:
+            errors.append(f"Leitfaden {label}: '{get(attr)}' ist ungültig (erlaubt: Ja, Nein, k.A.).")
+        values[attr] = value
+    for attr, label in (('coach_notes', 'Coach-Notizen'), ('project_leader_notes', 'Projektleiter-Notizen')):
+        if len(get(attr)) > MAX_NOTES_LENGTH:
+            errors.append(f"{label}: maximal {MAX_NOTES_LENGTH} Zeichen erlaubt.")
+        values[attr] = get(attr) or None
+    return values, team_id, errors
+
+def read_import_file(text_stream, result):
+    """Liest die CSV-Datei (Trennzeichen ';' oder ',') und prüft alle Zeilen; füllt result."""
+    sample = text_stream.read(4096); text_stream.seek(0)
+    delimiter = ';' if sample.count(';') >= sample.count(',') else ','
+    reader = csv.DictReader(text_stream, delimiter=delimiter)
+    headers = [h.strip() for h in (reader.fieldnames or [])]
+    missing = [col for col in REQUIRED_COLUMNS if col not in headers]
+    if missing:
+        result.errors.append((1, f"Fehlende Spalten: {', '.join(missing)}"))
+        return
+    reader.fieldnames = [IMPORT_COLUMNS.get(h, h) for h in headers]
+
+    members, coaches = _build_lookups()
+    for raw in reader:
+        result.total_rows += 1
+        line_no = reader.line_num
+        values, team_id, errors = validate_row(raw, members, coaches)
+        if errors:
+            result.errors.extend((line_no, message) for message in errors)
+        else:
+            result.valid_rows.append((values, team_id))
+
+def _insert_batch_copy(raw_connection, batch):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for values in batch:
+        writer.writerow([values[col] for col in INSERT_COLUMNS]) # None -> leeres Feld -> NULL
+    buffer.seek(0)
+    with raw_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY coachings ({', '.join(INSERT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+def insert_coachings(values_iter, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Fügt Coachings (Dicts mit den Schlüsseln aus INSERT_COLUMNS) blockweise in der laufenden
+    Session-Transaktion ein, ohne ORM-Objekte. Auch von 'flask seed' (app/seed.py) genutzt.
+    """
+    connection = db.session.connection() # gleiche Verbindung/Transaktion wie die Session
+    use_copy = connection.dialect.name == 'postgresql' and connection.dialect.driver == 'psycopg2'
+    raw_connection = connection.connection.dbapi_connection if use_copy else None
+    values_iter = iter(values_iter)
+    while True:
+        batch = list(islice(values_iter, batch_size))
+        if not batch:
+            break
+        if use_copy:
+            _insert_batch_copy(raw_connection, batch)
+        else:
+            db.session.execute(Coaching.__table__.insert(), batch)
+
+def _insert_rows(rows):
+    insert_coachings(values for values, _ in rows)
+
+def _apply_rollup(rows):
+    totals = defaultdict(lambda: [0, 0, 0, 0])
+    for values, team_id in rows:
+        t = totals[(team_id, values['coaching_date'].date(), values['coaching_subject'])]
+        t[0] += 1; t[1] += values['performance_mark'] or 0
+        t[2] += 1 if values['performance_mark'] is not None else 0; t[3] += values['time_spent'] or 0
+    for (team_id, day, subject), (count, mark_sum, mark_count, time_sum) in totals.items():
+        adjust_daily_stats(team_id, day, subject, coaching_count=count, performance_mark_sum=mark_sum,
+                           performance_mark_count=mark_count, time_spent_sum=time_sum)
+
+def import_coachings(text_stream, dry_run=False, skip_invalid=False):
+    """
+    Importiert Coachings aus einem CSV-Textstream.
+    dry_run:      nur prüfen, nichts schreiben.
+    skip_invalid: gültige Zeilen auch dann importieren, wenn andere Zeilen fehlerhaft sind
+                  (sonst wird bei Fehlern nichts importiert).
+    """
+    result = ImportResult(dry_run)
+    read_import_file(text_stream, result)
+    if dry_run or not result.valid_rows or (result.errors and not skip_invalid):
+        return result
+    try:
+        max_id_before = db.session.query(func.max(Coaching.id)).scalar() or 0
+        _insert_rows(result.valid_rows)
+        _apply_rollup(result.valid_rows)
+        refresh_search_documents(Coaching.id > max_id_before)
+        db.session.commit()
+        result.imported = len(result.valid_rows)
+    except Exception:
+        db.session.rollback()
+        raise
+    return result
@@ -0,0 +1,104 @@
+# app/instrumentation.py
+# Optionale Messung pro Request (Config REQUEST_TIMING_ENABLED): Anzahl und Dauer der SQL-Anweisungen,
+# Zeit für das Rendern der Templates und Gesamtzeit. Ergebnis als Server-Timing-Header (im Browser unter
+# Netzwerk -> Timing sichtbar) und als Log-Warnung für langsame Requests (SLOW_REQUEST_MS) und
+# langsame SQL-Anweisungen (SLOW_QUERY_MS; auch außerhalb von Requests, z.B. CLI-Befehle).
+# Kosten: ein paar perf_counter()-Aufrufe pro Anweisung – für den Dauerbetrieb gedacht.
+
+import logging
+import time
+from flask import g, request, has_request_context, before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SLOW_STATEMENT_LOG_CHARS = 500 # nur der Anfang der SQL-Anweisung, ohne Parameter
+
+_settings = {'slow_query_ms': 0} # Engine-Events sind prozessweit registriert, daher hier und nicht in app.config
+
+class RequestTiming:
+    __slots__ = ('started_at', 'db_count', 'db_seconds', 'template_seconds', 'template_started_at')
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.db_count = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.template_started_at = None
+
+    def server_timing(self, total_seconds):
+        return (f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_count} SQL", '
+                f'tpl;dur={self.template_seconds * 1000:.1f};desc="Templates", '
+                f'total;dur={total_seconds * 1000:.1f}')
+
+def _current_timing():
+    return g.get('request_timing') if has_request_context() else None
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('statement_started_at', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get('statement_started_at')
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    timing = _current_timing()
+    if timing is not None:
+        timing.db_count += 1
+        timing.db_seconds += elapsed
+    slow_ms = _settings['slow_query_ms']
+    if slow_ms and elapsed * 1000 >= slow_ms:
+        logger.warning("Langsame SQL-Anweisung (%.1f ms)%s: %s", elapsed * 1000,
+                       f" in {request.endpoint}" if timing is not None else '',
+                       ' '.join(statement.split())[:SLOW_STATEMENT_LOG_CHARS])
+
+def _handle_error(exception_context):
+    # Fehlgeschlagene Anweisung: after_cursor_execute kommt nicht, den Startzeitpunkt trotzdem entfernen
+    conn = exception_context.connection
+    started = conn.info.get('statement_started_at') if conn is not None else None
+    if started and exception_context.execution_context is not None:
+        started.pop()
+
+def _template_started(sender, template, context, **extra):
+    timing = _current_timing()
+    if timing is not None:
+        timing.template_started_at = time.perf_counter()
+
+def _template_finished(sender, template, context, **extra):
+    timing = _current_timing()
+    if timing is not None and timing.template_started_at is not None:
+        timing.template_seconds += time.perf_counter() - timing.template_started_at
+        timing.template_started_at = None
+
+def init_app(app):
+    if not app.config.get('REQUEST_TIMING_ENABLED'):
+        return
+    _settings['slow_query_ms'] = app.config.get('SLOW_QUERY_MS', 100)
+    slow_request_ms = app.config.get('SLOW_REQUEST_MS', 500)
+    send_header = app.config.get('SERVER_TIMING_HEADER', True)
+
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+    before_render_template.connect(_template_started, app)
+    template_rendered.connect(_template_finished, app)
+
+    @app.before_request
+    def start_request_timing():
+        g.request_timing = RequestTiming()
+
+    @app.after_request
+    def finish_request_timing(response):
+        timing = g.get('request_timing')
+        if timing is None:
+            return response
+        total = time.perf_counter() - timing.started_at
+        if send_header:
+            response.headers.add('Server-Timing', timing.server_timing(total))
+        if slow_request_ms and total * 1000 >= slow_request_ms:
+            logger.warning("Langsamer Request %s %s -> %s: %.0f ms gesamt, %d SQL (%.0f ms), Templates %.0f ms",
+                           request.method, request.full_path.rstrip('?'), response.status_code, total * 1000,
+                           timing.db_count, timing.db_seconds * 1000, timing.template_seconds * 1000)
+        return response
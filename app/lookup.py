@@ -0,0 +1,55 @@
+# app/lookup.py
+# Seitenweise Präfix-Suche nach Namen (Benutzer, Teams, Teammitglieder, Coaches) für die JSON-Endpunkte
+# im Admin-Bereich, statt ganze Tabellen in Seiten und Dropdowns zu rendern.
+# Gesucht und sortiert wird über lower(name) – auf PostgreSQL mit COLLATE "C" –, damit die Ausdrucks-Indizes
+# (lower(name), id) aus Migration 5d2e7a91c4b8 den Präfix-Bereich UND die Sortierung bedienen.
+# Der Präfix wird als Bereich abgefragt (lower(name) >= 'ab' AND lower(name) < 'ac'), das funktioniert mit
+# binärer Sortierung auf beiden Datenbanken ohne LIKE-Sonderregeln. Paginiert wird per Keyset (Name, ID).
+# Hinweis: SQLites lower() kennt nur ASCII – Umlaute am Anfang eines Namens werden dort nicht gefaltet.
+
+from sqlalchemy import and_, func, or_
+from app import db
+
+LOOKUP_PAGE_SIZE = 50
+MAX_LOOKUP_PAGE_SIZE = 200
+MAX_PREFIX_LENGTH = 100
+CURSOR_SEPARATOR = '_' # Cursor = "<Sortierschlüssel>_<ID>"; der Schlüssel selbst darf '_' enthalten
+
+def name_key(column):
+    """Sortier- und Suchausdruck für eine Namensspalte (muss dem Index-Ausdruck entsprechen)."""
+    key = func.lower(column)
+    return key.collate('C') if db.session.get_bind().dialect.name == 'postgresql' else key
+
+def _prefix_upper_bound(prefix):
+    last = ord(prefix[-1])
+    return prefix[:-1] + chr(last + 1) if last < 0x10FFFF else None
+
+def encode_lookup_cursor(key, row_id):
+    return f"{key}{CURSOR_SEPARATOR}{row_id}"
+
+def decode_lookup_cursor(cursor_str):
+    key, separator, row_id = (cursor_str or '').rpartition(CURSOR_SEPARATOR)
+    if not separator or not row_id.isdigit():
+        return None
+    return key, int(row_id)
+
+def lookup_page(query, name_column, id_column, term='', after=None, limit=LOOKUP_PAGE_SIZE):
+    """
+    Wendet Präfix-Filter (term) und Keyset-Paginierung (after) auf query an, sortiert nach (Name, ID).
+    query muss eine Spalte "id" liefern. Gibt (rows, next_cursor) zurück; next_cursor ist None auf der letzten Seite.
+    """
+    key = name_key(name_column)
+    prefix = (term or '').strip().lower()[:MAX_PREFIX_LENGTH]
+    if prefix:
+        upper = _prefix_upper_bound(prefix)
+        query = query.filter(key >= prefix, key < upper) if upper else query.filter(key >= prefix)
+    after_key = decode_lookup_cursor(after)
+    if after_key:
+        query = query.filter(or_(key > after_key[0], and_(key == after_key[0], id_column > after_key[1])))
+    rows = query.add_columns(key.label('lookup_key'))\
+        .order_by(key, id_column).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_lookup_cursor(rows[-1].lookup_key, rows[-1].id)
+    return rows, next_cursor
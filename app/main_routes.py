@@ -2,15 +2,22 @@
 from flask import Blueprint, render_template, redirect, url_for, flash, request, abort, current_app, jsonify # Added jsonify
 from flask_login import login_required, current_user
 from app import db
-from app.models import User, Team, TeamMember, Coaching # Ensure all are imported
+from app.models import User, Team, TeamMember, Coaching, CoachingDailyStat, coaching_list_options # Ensure all are imported
 from app.forms import CoachingForm, ProjectLeaderNoteForm
+from app.stats import get_member_stats_for_team, get_team_leaderboard
+from app.pagination import keyset_paginate
+from app.rollup import record_coaching_added, record_coaching_changed, coaching_stats_snapshot
+from app.membership import assign_coaching_team
+from app.search import apply_coaching_search, index_coaching, SCOPE_PRIMARY
+from app.cache import dashboard_cache, conditional_get
 
 # <<< GEÄNDERT >>> Importiere die ARCHIV Konstante
 from app.utils import role_required, ROLE_ADMIN, ROLE_PROJEKTLEITER, ROLE_QM, ROLE_SALESCOACH, ROLE_TRAINER, ROLE_TEAMLEITER, ROLE_ABTEILUNGSLEITER, ARCHIV_TEAM_NAME
 
-from sqlalchemy import desc, func, or_, and_
+from sqlalchemy import desc, false, func, or_, and_
 from datetime import datetime, timedelta, timezone
 import sqlalchemy
+from sqlalchemy.orm import joinedload
 from calendar import monthrange
 
 bp = Blueprint('main', __name__)
@@ -20,6 +27,12 @@ def get_month_name_german(month_number):
     months_german = {1:"Januar",2:"Februar",3:"März",4:"April",5:"Mai",6:"Juni",7:"Juli",8:"August",9:"September",10:"Oktober",11:"November",12:"Dezember"}
     return months_german.get(month_number, "")
 
+def get_month_options():
+    now=datetime.now(timezone.utc); cy=now.year; py=cy-1; m_opts=[]
+    for m in range(12,0,-1): m_opts.append({'value':f"{py}-{m:02d}",'text':f"{get_month_name_german(m)} {py}"})
+    for m in range(now.month,0,-1): m_opts.append({'value':f"{cy}-{m:02d}",'text':f"{get_month_name_german(m)} {cy}"})
+    return m_opts
+
 def calculate_date_range(period_filter_str=None):
     now = datetime.now(timezone.utc); start_date, end_date = None, None
     if not period_filter_str or period_filter_str == 'all': return None, None
@@ -42,31 +55,41 @@ def calculate_date_range(period_filter_str=None):
             pass           
     return start_date,end_date
 
-def get_filtered_coachings_subquery(period_filter_str=None):
-    q = db.session.query(Coaching.id.label("coaching_id_sq"),Coaching.team_member_id.label("team_member_id_sq"),Coaching.performance_mark.label("performance_mark_sq"),Coaching.time_spent.label("time_spent_sq"),Coaching.coaching_subject.label("coaching_subject_sq"))
+def dashboard_cache_key(period_filter_str=None, selected_team_id_str=None):
+    """Cache-Schlüssel: aufgelöster Zeitraum (tagesgenau, damit '7days' usw. mitwandern) + Teamfilter."""
+    s_d,e_d = calculate_date_range(period_filter_str)
+    team_key = selected_team_id_str if selected_team_id_str and selected_team_id_str.isdigit() else 'all'
+    return (s_d.date().isoformat() if s_d else '-', e_d.date().isoformat() if e_d else '-', team_key)
+
+def get_daily_stats_query(period_filter_str=None, *entities):
+    """
+    Basisabfrage auf die Tages-Rollup-Tabelle (coaching_daily_stats), gefiltert auf den Zeitraum
+    und ohne das ARCHIV-Team. Die Zeiträume aus calculate_date_range sind tagesgenau (UTC).
+    """
+    q = db.session.query(*entities).select_from(CoachingDailyStat)\
+        .join(Team, CoachingDailyStat.team_id == Team.id)\
+        .filter(Team.name != ARCHIV_TEAM_NAME)
     s_d,e_d = calculate_date_range(period_filter_str)
-    if s_d: q=q.filter(Coaching.coaching_date>=s_d)
-    if e_d: q=q.filter(Coaching.coaching_date<=e_d)
-    return q.subquery('filtered_coachings_sq')
+    if s_d: q=q.filter(CoachingDailyStat.day>=s_d.date())
+    if e_d: q=q.filter(CoachingDailyStat.day<=e_d.date())
+    return q
 
+@dashboard_cache.cached('perf_charts', dashboard_cache_key)
 def get_performance_data_for_charts(period_filter_str=None, selected_team_id_str=None):
-    sq = get_filtered_coachings_subquery(period_filter_str)
-    q = db.session.query(
+    num_coachings = func.sum(CoachingDailyStat.coaching_count)
+    q = get_daily_stats_query(
+        period_filter_str,
         Team.id.label('team_id'),
         Team.name.label('team_name'),
-        func.coalesce(func.avg(sq.c.performance_mark_sq), 0).label('avg_perf_mark'),
-        func.coalesce(func.sum(sq.c.time_spent_sq), 0).label('total_time'),
-        func.coalesce(func.count(sq.c.coaching_id_sq), 0).label('num_coachings')
-    ).select_from(Team)\
-     .outerjoin(TeamMember, Team.id == TeamMember.team_id)\
-     .outerjoin(sq, TeamMember.id == sq.c.team_member_id_sq)
-
-    q = q.filter(Team.name != ARCHIV_TEAM_NAME)
+        func.coalesce(func.sum(CoachingDailyStat.performance_mark_sum) * 1.0 / func.nullif(func.sum(CoachingDailyStat.performance_mark_count), 0), 0).label('avg_perf_mark'),
+        func.coalesce(func.sum(CoachingDailyStat.time_spent_sum), 0).label('total_time'),
+        func.coalesce(num_coachings, 0).label('num_coachings')
+    )
 
     if selected_team_id_str and selected_team_id_str.isdigit():
         q = q.filter(Team.id == int(selected_team_id_str))
 
-    res = q.group_by(Team.id, Team.name).having(func.count(sq.c.coaching_id_sq) > 0).order_by(Team.name).all()
+    res = q.group_by(Team.id, Team.name).having(num_coachings > 0).order_by(Team.name).all()
     avg_perf_pcnt = [round(r.avg_perf_mark * 10, 2) if r.avg_perf_mark is not None else 0 for r in res]
     total_time_spent_values_list = [r.total_time for r in res]
 
@@ -77,72 +100,65 @@ def get_performance_data_for_charts(period_filter_str=None, selected_team_id_str
         'coachings_done_values': [r.num_coachings for r in res]
     }
 
+@dashboard_cache.cached('subject_distribution', dashboard_cache_key)
 def get_coaching_subject_distribution(period_filter_str=None, selected_team_id_str=None):
-    sq=get_filtered_coachings_subquery(period_filter_str)
-    q=db.session.query(sq.c.coaching_subject_sq.label('subject'),func.count(sq.c.coaching_id_sq).label('count')).select_from(sq).filter(sq.c.coaching_subject_sq.isnot(None)).filter(sq.c.coaching_subject_sq != '')
-    
-    q = q.join(TeamMember, sq.c.team_member_id_sq == TeamMember.id)\
-         .join(Team, TeamMember.team_id == Team.id)\
-         .filter(Team.name != ARCHIV_TEAM_NAME)
+    count_expr=func.sum(CoachingDailyStat.coaching_count)
+    q=get_daily_stats_query(period_filter_str, CoachingDailyStat.coaching_subject.label('subject'), count_expr.label('count')).filter(CoachingDailyStat.coaching_subject != '')
          
     if selected_team_id_str and selected_team_id_str.isdigit(): 
-        q = q.filter(TeamMember.team_id==int(selected_team_id_str))
+        q = q.filter(CoachingDailyStat.team_id==int(selected_team_id_str))
 
-    res=q.group_by(sq.c.coaching_subject_sq).order_by(desc('count')).all()
+    res=q.group_by(CoachingDailyStat.coaching_subject).having(count_expr > 0).order_by(desc('count')).all()
     return {'labels':[r.subject for r in res if r.subject],'values':[r.count for r in res if r.subject]}
 
+@dashboard_cache.cached('global_totals', dashboard_cache_key)
+def get_global_totals(period_filter_str=None):
+    """Anzahl und Gesamtzeit aller Coachings (ohne ARCHIV) im Zeitraum, aus dem Tages-Rollup."""
+    totals = get_daily_stats_query(
+        period_filter_str,
+        func.coalesce(func.sum(CoachingDailyStat.coaching_count), 0).label('total_coachings'),
+        func.coalesce(func.sum(CoachingDailyStat.time_spent_sum), 0).label('total_time')
+    ).one()
+    return int(totals.total_coachings), int(totals.total_time)
+
 @bp.route('/')
 @bp.route('/index')
 @login_required
 def index():
-    page=request.args.get('page',1,type=int); period_arg=request.args.get('period','all'); team_arg=request.args.get('team',"all"); search_arg=request.args.get('search',default="",type=str).strip()
+    after_arg=request.args.get('after'); before_arg=request.args.get('before'); period_arg=request.args.get('period','all'); team_arg=request.args.get('team',"all"); search_arg=request.args.get('search',default="",type=str).strip()
     
-    global_q=Coaching.query.join(TeamMember, Coaching.team_member_id == TeamMember.id)\
-                          .join(Team, TeamMember.team_id == Team.id)\
-                          .filter(Team.name != ARCHIV_TEAM_NAME)
-                          
-    gs_d,ge_d=calculate_date_range(period_arg)
-    if gs_d: global_q=global_q.filter(Coaching.coaching_date>=gs_d)
-    if ge_d: global_q=global_q.filter(Coaching.coaching_date<=ge_d)
-    global_total_coachings=global_q.count(); global_time_obj=global_q.with_entities(func.sum(Coaching.time_spent)).scalar(); global_time=global_time_obj if global_time_obj else 0
+    global_total_coachings,global_time=get_global_totals(period_arg)
     global_time_display=f"{global_time//60} Std. {global_time%60} Min. ({global_time} Min.)"
     
-    list_q=Coaching.query.join(TeamMember,Coaching.team_member_id==TeamMember.id).join(Team, TeamMember.team_id == Team.id).join(User,Coaching.coach_id==User.id,isouter=True)
-    list_q = list_q.filter(Team.name != ARCHIV_TEAM_NAME)
-
+    # <<< GEÄNDERT >>> Filter nur auf coachings (denormalisierte team_id/is_archived): die Gesamtzahl zählt über den
+    # Teilindex ohne Joins, Mitglied/Team/Coach werden nur für die angezeigte Seite dazugeholt
+    filter_q=Coaching.query.filter(Coaching.is_archived == false())
     ls_d,le_d=calculate_date_range(period_arg)
-    if ls_d: list_q=list_q.filter(Coaching.coaching_date>=ls_d)
-    if le_d: list_q=list_q.filter(Coaching.coaching_date<=le_d)
+    if ls_d: filter_q=filter_q.filter(Coaching.coaching_date>=ls_d)
+    if le_d: filter_q=filter_q.filter(Coaching.coaching_date<=le_d)
     if current_user.role==ROLE_TEAMLEITER:
-        if not current_user.team_id_if_leader: flash("Kein Team zugewiesen.","warning"); list_q=list_q.filter(sqlalchemy.sql.false())
-        else:
-            tm_ids=[m.id for m in TeamMember.query.filter_by(team_id=current_user.team_id_if_leader).all()]
-            if not tm_ids: list_q=list_q.filter(Coaching.coach_id==current_user.id) 
-            else: list_q=list_q.filter(or_(Coaching.team_member_id.in_(tm_ids),Coaching.coach_id==current_user.id))
-    elif team_arg and team_arg.isdigit(): list_q=list_q.filter(TeamMember.team_id==int(team_arg))
-    if search_arg: list_q=list_q.filter(or_(TeamMember.name.ilike(f"%{search_arg}%"),User.username.ilike(f"%{search_arg}%"),Coaching.coaching_subject.ilike(f"%{search_arg}%")))
-    total_filtered_list=list_q.count()
-    coachings_page=list_q.order_by(desc(Coaching.coaching_date)).paginate(page=page,per_page=10,error_out=False)
-    
-    chart_perf=get_performance_data_for_charts(period_arg,team_arg) 
-    chart_subj=get_coaching_subject_distribution(period_arg,team_arg)
+        if not current_user.team_id_if_leader: flash("Kein Team zugewiesen.","warning"); filter_q=filter_q.filter(sqlalchemy.sql.false())
+        else: filter_q=filter_q.filter(or_(Coaching.team_id==current_user.team_id_if_leader,Coaching.coach_id==current_user.id)) # Coaching.team_id = aktuelles Team des Mitglieds
+    elif team_arg and team_arg.isdigit(): filter_q=filter_q.filter(Coaching.team_id==int(team_arg))
+
+    list_q=filter_q.join(TeamMember,Coaching.team_member_id==TeamMember.id).join(Team, TeamMember.team_id == Team.id).join(User,Coaching.coach_id==User.id,isouter=True)
+    list_q=list_q.options(*coaching_list_options(Coaching.coach_notes)) # Coach-Notizen lädt die Detailzeile nach
+    count_q=filter_q
+    relevance_col=None
+    if search_arg:
+        list_q,relevance_col=apply_coaching_search(list_q,search_arg,scope=SCOPE_PRIMARY,fallback_columns=(TeamMember.name,User.username,Coaching.coaching_subject))
+        count_q=list_q # der ILIKE-Fallback filtert auf Spalten der gejointen Tabellen
+    coachings_page=keyset_paginate(list_q,per_page=10,after=after_arg,before=before_arg,count=current_app.config.get('PAGINATION_EXACT_COUNTS',True),rank_column=relevance_col,count_query=count_q)
+    total_filtered_list=coachings_page.total
     
     all_teams_dd=Team.query.filter(Team.name != ARCHIV_TEAM_NAME).order_by(Team.name).all()
 
-    now=datetime.now(timezone.utc); cy=now.year; py=cy-1; m_opts=[]
-    for m in range(12,0,-1): m_opts.append({'value':f"{py}-{m:02d}",'text':f"{get_month_name_german(m)} {py}"})
-    for m in range(now.month,0,-1): m_opts.append({'value':f"{cy}-{m:02d}",'text':f"{get_month_name_german(m)} {cy}"})
+    m_opts=get_month_options()
     
     return render_template('main/index.html',
                            title='Coaching - Dashboard',
                            coachings_paginated=coachings_page,
                            total_coachings=total_filtered_list,
-                           chart_labels=chart_perf['labels'],
-                           chart_avg_performance_mark_percentage=chart_perf['avg_performance_values'],
-                           chart_total_time_spent=chart_perf['total_time_spent_values'],
-                           chart_coachings_done=chart_perf['coachings_done_values'],
-                           subject_chart_labels=chart_subj['labels'],
-                           subject_chart_values=chart_subj['values'],
                            all_teams_for_filter=all_teams_dd,
                            current_period_filter=period_arg,
                            current_team_id_filter=team_arg,
@@ -183,20 +199,13 @@ def team_view():
             all_teams_for_selection = Team.query.filter(Team.name != ARCHIV_TEAM_NAME).order_by(Team.name).all()
         return render_template('main/team_view.html', title="Team Auswählen", team=None, all_teams_list=all_teams_for_selection, team_members_performance=[], team_coachings=[], config=current_app.config)
 
-    team_member_ids_in_selected_team = [member.id for member in selected_team_object.members]
-    if team_member_ids_in_selected_team:
-        team_coachings_list_for_display = Coaching.query.filter(Coaching.team_member_id.in_(team_member_ids_in_selected_team)).order_by(desc(Coaching.coaching_date)).limit(10).all()
-
-    for member in selected_team_object.members.all(): 
-        member_coachings_list = Coaching.query.filter_by(team_member_id=member.id).all()
-        avg_score_val = sum(c.overall_score for c in member_coachings_list) / len(member_coachings_list) if member_coachings_list else 0.0
-        leitfaden_adherences_percentages = [c.leitfaden_erfuellung_prozent for c in member_coachings_list if c.leitfaden_erfuellung_prozent is not None]
-        avg_leitfaden_adherence_val = sum(leitfaden_adherences_percentages) / len(leitfaden_adherences_percentages) if leitfaden_adherences_percentages else 0.0
-        total_coaching_time_minutes_val = sum(c.time_spent for c in member_coachings_list if c.time_spent is not None)
-        hours = total_coaching_time_minutes_val // 60; minutes = total_coaching_time_minutes_val % 60
-        formatted_time_str = f"{hours} Std. {minutes} Min."
-        team_members_stats.append({'id': member.id, 'name': member.name, 'avg_score': round(avg_score_val, 2), 'avg_leitfaden_adherence': round(avg_leitfaden_adherence_val, 1), 'total_coachings': len(member_coachings_list), 'raw_total_coaching_time': total_coaching_time_minutes_val, 'formatted_total_coaching_time': formatted_time_str})
-        
+    team_members_stats = get_member_stats_for_team(selected_team_object.id) # eine Zeile pro Mitglied, auch ohne Coachings
+    if team_members_stats: # ohne Mitglieder gibt es auch keine Coachings des Teams
+        # is_archived mitfiltern: für reguläre Teams liest das nur den Teilindex über aktive Coachings
+        team_coachings_list_for_display = Coaching.query.options(joinedload(Coaching.team_member_coached), joinedload(Coaching.coach))\
+            .filter(Coaching.team_id == selected_team_object.id, Coaching.is_archived == (selected_team_object.name == ARCHIV_TEAM_NAME))\
+            .order_by(desc(Coaching.coaching_date)).limit(10).all()
+
     all_teams_for_dropdown = []
     if current_user.role in [ROLE_ADMIN, ROLE_PROJEKTLEITER, ROLE_ABTEILUNGSLEITER, ROLE_QM, ROLE_SALESCOACH, ROLE_TRAINER]:
         all_teams_for_dropdown = Team.query.filter(Team.name != ARCHIV_TEAM_NAME).order_by(Team.name).all()
@@ -205,6 +214,7 @@ def team_view():
                            title=page_title, team=selected_team_object, 
                            team_coachings=team_coachings_list_for_display, 
                            team_members_performance=team_members_stats, 
+                           team_member_count=len(team_members_stats),
                            all_teams_list=all_teams_for_dropdown, 
                            config=current_app.config)
 
@@ -218,7 +228,7 @@ def add_coaching():
     if form.validate_on_submit():
         try:
             coaching = Coaching(team_member_id=form.team_member_id.data,coach_id=current_user.id,coaching_style=form.coaching_style.data,tcap_id=form.tcap_id.data if form.coaching_style.data=='TCAP' and form.tcap_id.data else None,coaching_subject=form.coaching_subject.data,coach_notes=form.coach_notes.data if form.coach_notes.data else None,leitfaden_begruessung=form.leitfaden_begruessung.data,leitfaden_legitimation=form.leitfaden_legitimation.data,leitfaden_pka=form.leitfaden_pka.data,leitfaden_kek=form.leitfaden_kek.data,leitfaden_angebot=form.leitfaden_angebot.data,leitfaden_zusammenfassung=form.leitfaden_zusammenfassung.data,leitfaden_kzb=form.leitfaden_kzb.data,performance_mark=form.performance_mark.data,time_spent=form.time_spent.data)
-            db.session.add(coaching); db.session.commit()
+            assign_coaching_team(coaching); db.session.add(coaching); record_coaching_added(coaching); index_coaching(coaching); db.session.commit()
             flash('Coaching erfolgreich gespeichert!', 'success'); return redirect(url_for('main.index'))
         except Exception as e: db.session.rollback(); current_app.logger.error(f"Add coaching error: {e}"); flash(f'Fehler: {str(e)}', 'danger')
     elif request.method == 'POST':
@@ -239,8 +249,12 @@ def edit_coaching(coaching_id):
     form.update_team_member_choices(exclude_archiv=False)
     if form.validate_on_submit():
         try:
+            old_stats = coaching_stats_snapshot(coaching_to_edit)
             form.populate_obj(coaching_to_edit)
             if coaching_to_edit.coaching_style != 'TCAP': coaching_to_edit.tcap_id = None
+            assign_coaching_team(coaching_to_edit)
+            record_coaching_changed(old_stats, coaching_to_edit)
+            index_coaching(coaching_to_edit)
             db.session.commit(); flash('Coaching erfolgreich aktualisiert!', 'success')
             return redirect(request.args.get('next') or url_for('main.index'))
         except Exception as e: db.session.rollback(); current_app.logger.error(f"Update coaching ID {coaching_id} error: {e}"); flash(f'Fehler: {str(e)}', 'danger')
@@ -253,11 +267,13 @@ def edit_coaching(coaching_id):
 @login_required
 @role_required([ROLE_PROJEKTLEITER, ROLE_QM, ROLE_ABTEILUNGSLEITER])
 def pl_qm_dashboard():
-    page = request.args.get('page', 1, type=int)
+    after_arg = request.args.get('after'); before_arg = request.args.get('before')
     selected_team_id_filter_str = request.args.get('team_id_filter', None) 
+    period_arg = request.args.get('period', 'all')
 
-    coachings_query = Coaching.query.join(TeamMember).join(Team).filter(Team.name != ARCHIV_TEAM_NAME)
-    coachings_paginated = coachings_query.order_by(desc(Coaching.coaching_date)).paginate(page=page, per_page=10, error_out=False)
+    coachings_query = Coaching.query.join(TeamMember).join(Team).join(User, Coaching.coach_id == User.id, isouter=True)\
+        .filter(Coaching.is_archived == false()).options(*coaching_list_options(Coaching.coach_notes))
+    coachings_paginated = keyset_paginate(coachings_query, per_page=10, after=after_arg, before=before_arg)
     note_form = ProjectLeaderNoteForm()
     title = "Notizen Dashboard" 
     if current_user.role == ROLE_QM: title = "Quality Coach Dashboard"
@@ -273,6 +289,7 @@ def pl_qm_dashboard():
             try:
                 coaching = Coaching.query.get_or_404(int(coaching_id_str))
                 coaching.project_leader_notes = form_val.notes.data
+                index_coaching(coaching)
                 db.session.commit()
                 flash(f'Notiz für Coaching ID {coaching_id_str} gespeichert.', 'success')
             except Exception as e:
@@ -283,27 +300,12 @@ def pl_qm_dashboard():
             for f, errs in form_val.errors.items():
                 flash(f"Validierungsfehler '{form_val[f].label.text}': {'; '.join(errs)}", 'danger')
         return redirect(url_for('main.pl_qm_dashboard', 
-                                page=request.args.get('page',1,type=int), 
-                                team_id_filter=selected_team_id_filter_str))
-
-    all_teams_data = []
-    for team_obj_stat_loop in Team.query.filter(Team.name != ARCHIV_TEAM_NAME).all():
-        stats = db.session.query(
-            func.coalesce(func.avg(Coaching.performance_mark * 10.0), 0).label('avg_perf'),
-            func.coalesce(func.sum(Coaching.time_spent), 0).label('total_time'),
-            func.coalesce(func.count(Coaching.id), 0).label('num_coachings')
-        ).join(TeamMember, Coaching.team_member_id == TeamMember.id)\
-         .filter(TeamMember.team_id == team_obj_stat_loop.id).first()
-        all_teams_data.append({
-            'id': team_obj_stat_loop.id, 'name': team_obj_stat_loop.name,
-            'num_coachings': stats.num_coachings if stats else 0,
-            'avg_score': round(stats.avg_perf, 2) if stats else 0,
-            'total_time': stats.total_time if stats else 0
-        })
-    sorted_data = sorted(all_teams_data, key=lambda x: (x.get('avg_score', 0), x.get('num_coachings', 0)), reverse=True)
-    top_3 = sorted_data[:3]
-    teams_c = [t for t in all_teams_data if t.get('num_coachings', 0) > 0]
-    flop_3 = sorted(teams_c, key=lambda x: (x.get('avg_score', 0), -x.get('num_coachings', 0)))[:3] if teams_c else []
+                                after=after_arg, before=before_arg,
+                                team_id_filter=selected_team_id_filter_str,
+                                period=period_arg))
+
+    lb_start, lb_end = calculate_date_range(period_arg)
+    top_3, flop_3 = get_team_leaderboard(lb_start, lb_end, limit=3)
 
     all_teams_for_filter_dropdown = Team.query.filter(Team.name != ARCHIV_TEAM_NAME).order_by(Team.name).all()
     selected_team_object_for_cards = None
@@ -313,38 +315,49 @@ def pl_qm_dashboard():
         selected_team_id = int(selected_team_id_filter_str)
         selected_team_object_for_cards = Team.query.get(selected_team_id)
         if selected_team_object_for_cards:
-            for member in selected_team_object_for_cards.members.all(): 
-                member_coachings_list = Coaching.query.filter_by(team_member_id=member.id).all()
-                
-                # <<< KORREKTUR WAR HIER >>>
-                avg_score_val = sum(c.overall_score for c in member_coachings_list) / len(member_coachings_list) if member_coachings_list else 0.0
-
-                leitfaden_adherences_percentages = [
-                    c.leitfaden_erfuellung_prozent for c in member_coachings_list if c.leitfaden_erfuellung_prozent is not None
-                ]
-                avg_leitfaden_adherence_val = sum(leitfaden_adherences_percentages) / len(leitfaden_adherences_percentages) if leitfaden_adherences_percentages else 0.0
-                total_coaching_time_minutes_val = sum(c.time_spent for c in member_coachings_list if c.time_spent is not None)
-                hours = total_coaching_time_minutes_val // 60; minutes = total_coaching_time_minutes_val % 60
-                formatted_time_str = f"{hours} Std. {minutes} Min."
-                members_data_for_cards.append({
-                    'id': member.id, 'name': member.name, 
-                    'avg_score': round(avg_score_val, 2), 
-                    'avg_leitfaden_adherence': round(avg_leitfaden_adherence_val, 1),
-                    'total_coachings': len(member_coachings_list), 
-                    'raw_total_coaching_time': total_coaching_time_minutes_val, 
-                    'formatted_total_coaching_time': formatted_time_str
-                })
+            members_data_for_cards = get_member_stats_for_team(selected_team_object_for_cards.id)
     return render_template('main/projektleiter_dashboard.html',
                            title=title, coachings_paginated=coachings_paginated,
                            note_form=note_form, top_3_teams=top_3, flop_3_teams=flop_3,
                            all_teams_for_filter=all_teams_for_filter_dropdown, 
                            selected_team_id_filter=selected_team_id_filter_str, 
+                           current_period_filter=period_arg,
+                           month_options=get_month_options(),
                            selected_team_object_for_cards=selected_team_object_for_cards, 
                            members_data_for_cards=members_data_for_cards, 
                            config=current_app.config)
 
+# <<< NEU >>> Chart-Daten der Startseite; index.html lädt sie nach dem Seitenaufbau per fetch()
+@bp.route('/api/dashboard/charts', methods=['GET'])
+@login_required
+@conditional_get('dashboard_charts')
+def get_dashboard_charts():
+    period_arg = request.args.get('period', 'all'); team_arg = request.args.get('team', 'all')
+    chart_perf = get_performance_data_for_charts(period_arg, team_arg)
+    chart_subj = get_coaching_subject_distribution(period_arg, team_arg)
+    return jsonify({
+        "labels": chart_perf['labels'],
+        "avg_performance_values": chart_perf['avg_performance_values'],
+        "total_time_spent_values": chart_perf['total_time_spent_values'],
+        "coachings_done_values": chart_perf['coachings_done_values'],
+        "subject_labels": chart_subj['labels'],
+        "subject_values": chart_subj['values'],
+    })
+
+# <<< NEU >>> Notizen eines Coachings für die Detailzeile der Startseite (die Liste lädt sie nicht mit)
+@bp.route('/api/coaching/<int:coaching_id>/notes', methods=['GET'])
+@login_required
+def get_coaching_notes(coaching_id):
+    row = db.session.query(Coaching.coach_id, Coaching.coach_notes, Coaching.project_leader_notes, Coaching.team_id)\
+        .filter(Coaching.id == coaching_id).first()
+    if row is None: abort(404)
+    if current_user.role == ROLE_TEAMLEITER and row.coach_id != current_user.id and row.team_id != current_user.team_id_if_leader:
+        abort(403) # gleiche Sichtbarkeit wie die Liste auf der Startseite
+    return jsonify({"coach_notes": row.coach_notes or "", "project_leader_notes": row.project_leader_notes or ""})
+
 @bp.route('/api/member_coaching_trend', methods=['GET'])
 @login_required 
+@conditional_get('member_coaching_trend')
 def get_member_coaching_trend():
     team_member_id_str = request.args.get('team_member_id')
     count_str = request.args.get('count', '10') 
@@ -0,0 +1,53 @@
+# app/membership.py
+# Pflege der denormalisierten Spalten coachings.team_id und coachings.is_archived.
+# Beide spiegeln das AKTUELLE Team des gecoachten Mitglieds (wie TeamMember.team_id, also auch nach einem
+# Teamwechsel), damit Listen, Zählungen und Team-Kennzahlen aktive Coachings allein auf der coachings-Tabelle
+# filtern können (Teilindizes "WHERE is_archived = false", siehe app/models.py).
+# Jeder Schreibpfad, der ein Coaching anlegt, dessen Mitglied ändert oder ein Mitglied in ein anderes Team
+# verschiebt, ruft hier die passende Funktion VOR dem commit() auf. Massen-Inserts (Import, Seed) setzen
+# team_id/is_archived direkt in den Zeilen.
+
+from sqlalchemy import select, update
+from app import db
+from app.models import Team, TeamMember, Coaching
+from app.utils import ARCHIV_TEAM_NAME
+
+def member_team_values(team_member_id):
+    """{'team_id': ..., 'is_archived': ...} für Coachings des Mitglieds (None, wenn es das Mitglied nicht gibt)."""
+    row = db.session.query(TeamMember.team_id, Team.name).join(Team, TeamMember.team_id == Team.id)\
+        .filter(TeamMember.id == team_member_id).first()
+    return {'team_id': row.team_id, 'is_archived': row.name == ARCHIV_TEAM_NAME} if row else None
+
+def assign_coaching_team(coaching):
+    """Setzt team_id/is_archived eines (neuen oder bearbeiteten) Coachings aus seinem Mitglied."""
+    values = member_team_values(coaching.team_member_id)
+    if values:
+        coaching.team_id = values['team_id']
+        coaching.is_archived = values['is_archived']
+
+def record_member_team_changed(member_id, new_team_id):
+    """Zieht team_id/is_archived aller Coachings eines Mitglieds auf sein neues Team nach (z.B. Verschieben ins ARCHIV)."""
+    new_team_name = db.session.query(Team.name).filter(Team.id == new_team_id).scalar()
+    table = Coaching.__table__
+    db.session.execute(update(table).where(table.c.team_member_id == member_id)
+                       .values(team_id=new_team_id, is_archived=new_team_name == ARCHIV_TEAM_NAME))
+
+def sync_coaching_teams(*criteria):
+    """
+    Setzt team_id/is_archived der Coachings, die den Kriterien entsprechen (alle ohne Kriterien), aus dem aktuellen
+    Team ihres Mitglieds – ohne commit(). Gibt die Anzahl geänderter Coachings zurück.
+    """
+    table = Coaching.__table__
+    member_team = select(TeamMember.team_id).where(TeamMember.id == table.c.team_member_id).scalar_subquery()
+    archived = select(Team.name == ARCHIV_TEAM_NAME).join(TeamMember, TeamMember.team_id == Team.id)\
+        .where(TeamMember.id == table.c.team_member_id).scalar_subquery()
+    result = db.session.execute(update(table)
+                                .where(table.c.team_id.is_distinct_from(member_team) | table.c.is_archived.is_distinct_from(archived), *criteria)
+                                .values(team_id=member_team, is_archived=archived))
+    return result.rowcount
+
+def rebuild_coaching_teams():
+    """Setzt team_id/is_archived aller Coachings neu aus team_members/teams. Gibt die Anzahl geänderter Coachings zurück."""
+    changed = sync_coaching_teams()
+    db.session.commit()
+    return changed
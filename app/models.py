@@ -1,10 +1,12 @@
 # app/models.py
-print("<<<< START models.py (KORRIGIERTE VERSION) GELADEN >>>>")
 
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db, login_manager 
 from datetime import datetime, timezone
+from sqlalchemy import case, false, func
+from sqlalchemy.orm import contains_eager, defer
+from sqlalchemy.ext.hybrid import hybrid_property
 
 class User(UserMixin, db.Model):
     __tablename__ = 'users'
@@ -27,7 +29,12 @@ class User(UserMixin, db.Model):
 
 @login_manager.user_loader
 def load_user(id):
-    return User.query.get(int(id))
+    # <<< GEÄNDERT >>> Über den Per-Worker-Cache (app/user_cache.py) statt einer Abfrage pro Request
+    from app.user_cache import user_cache, AuthUser
+    def load(user_id):
+        row = db.session.query(User.id, User.username, User.role, User.team_id_if_leader).filter(User.id == user_id).first()
+        return AuthUser(*row) if row else None
+    return user_cache.get(int(id), load)
 
 class Team(db.Model):
     __tablename__ = 'teams'
@@ -47,18 +54,35 @@ class TeamMember(db.Model):
     __tablename__ = 'team_members'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', name='fk_teammember_team_id'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', name='fk_teammember_team_id'), nullable=False, index=True)
     coachings_received = db.relationship('Coaching', backref='team_member_coached', lazy='dynamic')
     def __repr__(self):
         return f'<TeamMember {self.name} (Team ID: {self.team_id})>'
 
+# (Anzeigename, Spaltenname) der sieben Leitfaden-Punkte
+LEITFADEN_FIELDS = [
+    ("Begrüßung", 'leitfaden_begruessung'),
+    ("Legitimation", 'leitfaden_legitimation'),
+    ("PKA", 'leitfaden_pka'),
+    ("KEK", 'leitfaden_kek'),
+    ("Angebot", 'leitfaden_angebot'),
+    ("Zusammenfassung", 'leitfaden_zusammenfassung'),
+    ("KZB", 'leitfaden_kzb'),
+]
+
 class Coaching(db.Model):
     # ... (Felder bis project_leader_notes bleiben gleich) ...
     __tablename__ = 'coachings'
+    # <<< NEU >>> SQLite: IDs nie wiederverwenden (sonst kollidieren neue Coachings mit coachings_archive)
+    __table_args__ = {'sqlite_autoincrement': True}
     id = db.Column(db.Integer, primary_key=True)
     team_member_id = db.Column(db.Integer, db.ForeignKey('team_members.id', name='fk_coaching_team_member_id'), nullable=False)
+    # <<< NEU >>> Denormalisiert aus dem AKTUELLEN Team des Mitglieds (Pflege: app/membership.py), damit Listen und
+    # Kennzahlen aktive Coachings ohne Join über team_members/teams filtern können
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', name='fk_coaching_team_id'), nullable=False)
+    is_archived = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false()) # Mitglied im ARCHIV
     coach_id = db.Column(db.Integer, db.ForeignKey('users.id', name='fk_coaching_coach_id'), nullable=False)
-    coaching_date = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    coaching_date = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
     coaching_style = db.Column(db.String(50), nullable=True)
     tcap_id = db.Column(db.String(50), nullable=True)
     coaching_subject = db.Column(db.String(50), nullable=True) 
@@ -78,29 +102,45 @@ class Coaching(db.Model):
         
     @property
     def leitfaden_fields_list(self): # Hilfs-Property für die Leitfadenfelder
-        return [
-            ("Begrüßung", self.leitfaden_begruessung),
-            ("Legitimation", self.leitfaden_legitimation),
-            ("PKA", self.leitfaden_pka),
-            ("KEK", self.leitfaden_kek),
-            ("Angebot", self.leitfaden_angebot),
-            ("Zusammenfassung", self.leitfaden_zusammenfassung),
-            ("KZB", self.leitfaden_kzb)
-        ]
+        return [(label, getattr(self, attr)) for label, attr in LEITFADEN_FIELDS]
+
+    @classmethod
+    def _leitfaden_count_expr(cls, value):
+        expr = None
+        for _, attr in LEITFADEN_FIELDS:
+            term = case((getattr(cls, attr) == value, 1), else_=0)
+            expr = term if expr is None else expr + term
+        return expr
+
+    # Hybrid-Properties: in Python pro Objekt, in Abfragen als SQL-Ausdruck
+    # (z.B. func.avg(Coaching.leitfaden_erfuellung_prozent), filter(Coaching.leitfaden_erfuellung_prozent < 50)).
+    @hybrid_property
+    def leitfaden_ja_count(self):
+        return sum(1 for _, value in self.leitfaden_fields_list if value == "Ja")
+
+    @leitfaden_ja_count.expression
+    def leitfaden_ja_count(cls):
+        return cls._leitfaden_count_expr("Ja")
+
+    @hybrid_property
+    def leitfaden_nein_count(self):
+        return sum(1 for _, value in self.leitfaden_fields_list if value == "Nein")
+
+    @leitfaden_nein_count.expression
+    def leitfaden_nein_count(cls):
+        return cls._leitfaden_count_expr("Nein")
+
+    @hybrid_property
+    def leitfaden_ka_count(self):
+        return sum(1 for _, value in self.leitfaden_fields_list if value == "k.A.")
+
+    @leitfaden_ka_count.expression
+    def leitfaden_ka_count(cls):
+        return cls._leitfaden_count_expr("k.A.")
 
     @property
-    def leitfaden_counts(self): # NEUE Property für die Zählung
-        ja_count = 0
-        nein_count = 0
-        ka_count = 0
-        for _, value in self.leitfaden_fields_list:
-            if value == "Ja":
-                ja_count += 1
-            elif value == "Nein":
-                nein_count += 1
-            elif value == "k.A.":
-                ka_count += 1
-        return {'ja': ja_count, 'nein': nein_count, 'ka': ka_count}
+    def leitfaden_counts(self):
+        return {'ja': self.leitfaden_ja_count, 'nein': self.leitfaden_nein_count, 'ka': self.leitfaden_ka_count}
 
     @property
     def leitfaden_erfuellung_display(self):
@@ -117,16 +157,20 @@ class Coaching(db.Model):
         # Erfüllung als X/Y, und k.A. separat anzeigen
         return f"{ja}/{total_relevant} ({ka} k.A.)"
 
-    @property
-    def leitfaden_erfuellung_prozent(self): # Für interne Berechnungen, falls noch benötigt
-        counts = self.leitfaden_counts
-        ja = counts['ja']
-        nein = counts['nein']
-        total_relevant = ja + nein
+    @hybrid_property
+    def leitfaden_erfuellung_prozent(self): # Ja / (Ja + Nein) * 100
+        ja = self.leitfaden_ja_count
+        total_relevant = ja + self.leitfaden_nein_count
         if total_relevant == 0:
             return 0.0 # Oder 100.0, je nach Definition, wenn nichts Relevantes bewertet wurde
         return (ja / total_relevant) * 100
 
+    @leitfaden_erfuellung_prozent.expression
+    def leitfaden_erfuellung_prozent(cls):
+        ja = cls._leitfaden_count_expr("Ja")
+        nein = cls._leitfaden_count_expr("Nein")
+        return func.coalesce(ja * 100.0 / func.nullif(ja + nein, 0), 0.0)
+
     @property
     def overall_score(self): # Basiert NUR auf performance_mark
         if self.performance_mark is None:
@@ -137,4 +181,131 @@ class Coaching(db.Model):
     def __repr__(self):
         return f'<Coaching {self.id} for TeamMember {self.team_member_id} on {self.coaching_date}>'
 
-print("<<<< ENDE models.py (KORRIGIERTE VERSION) GELADEN >>>>")
+# <<< NEU >>> Auf PostgreSQL ist coachings nach Jahren von coaching_date partitioniert (Migration 9e4b2c6d1f37,
+# app/partitioning.py); der Primärschlüssel ist dort (id, coaching_date). db.create_all() legt eine normale Tabelle an.
+
+# Zusammengesetzte Indizes für die typischen Zugriffe: Coachings eines Mitglieds bzw. Coaches,
+# jeweils neueste zuerst (Trend-API, Team-Ansicht, Coach-Filter in der Coaching-Verwaltung).
+db.Index('ix_coachings_team_member_id_coaching_date', Coaching.team_member_id, Coaching.coaching_date.desc())
+db.Index('ix_coachings_coach_id_coaching_date', Coaching.coach_id, Coaching.coaching_date.desc())
+# Teilindizes nur über aktive Coachings (Mitglied nicht im ARCHIV, Migration 2f6b9d4e8a13): Listen, Zählungen und
+# Team-Kennzahlen filtern mit Coaching.is_archived == false() (muss genau so formuliert sein, damit der Planer den
+# Teilindex nimmt) und lesen nur die coachings-Tabelle bzw. den Index.
+db.Index('ix_coachings_active_coaching_date', Coaching.coaching_date, Coaching.id,
+         postgresql_where=Coaching.is_archived == false(), sqlite_where=Coaching.is_archived == false())
+db.Index('ix_coachings_active_team_id_coaching_date', Coaching.team_id, Coaching.coaching_date, Coaching.id,
+         postgresql_where=Coaching.is_archived == false(), sqlite_where=Coaching.is_archived == false())
+
+class ArchivedCoaching(Coaching):
+    # <<< NEU >>> Cold-Storage: aus coachings verschobene Coachings (alte bzw. von archivierten Mitgliedern,
+    # siehe app/retention.py und 'flask archive-coachings'). Gleiche Spalten und ID wie zuvor in coachings plus
+    # archived_at; über concrete-Vererbung gelten dieselben Properties und Hybrid-Ausdrücke (Leitfaden, Score).
+    # Abfragen auf Coaching lesen diese Tabelle NICHT mit – nur die Coaching-Verwaltung mit tier=archiv.
+    # Ohne Fremdschlüssel: Archivzeilen sollen das Löschen von Benutzern oder Teams nicht blockieren.
+    # team_id/is_archived geben den Stand beim Verschieben wieder.
+    __table__ = db.Table(
+        'coachings_archive',
+        *[db.Column(column.name, column.type, primary_key=column.primary_key, autoincrement=False, nullable=column.nullable)
+          for column in Coaching.__table__.columns],
+        db.Column('archived_at', db.DateTime, nullable=False),
+    )
+    __mapper_args__ = {'concrete': True}
+    team_member_coached = db.relationship(TeamMember, primaryjoin=lambda: db.foreign(ArchivedCoaching.team_member_id) == TeamMember.id, viewonly=True)
+    coach = db.relationship(User, primaryjoin=lambda: db.foreign(ArchivedCoaching.coach_id) == User.id, viewonly=True)
+
+    def __repr__(self):
+        return f'<ArchivedCoaching {self.id} for TeamMember {self.team_member_id} on {self.coaching_date}>'
+
+# Archiv-Liste der Coaching-Verwaltung: neueste zuerst, optional je Team bzw. Mitglied (Migration 7c3e5a1f9b20)
+db.Index('ix_coachings_archive_coaching_date', ArchivedCoaching.coaching_date, ArchivedCoaching.id)
+db.Index('ix_coachings_archive_team_id_coaching_date', ArchivedCoaching.team_id, ArchivedCoaching.coaching_date)
+db.Index('ix_coachings_archive_team_member_id_coaching_date', ArchivedCoaching.team_member_id, ArchivedCoaching.coaching_date)
+
+def coaching_list_options(*deferred_columns, model=Coaching):
+    """
+    Loader-Optionen für Coaching-Listen, deren Abfrage TeamMember, Team und User (Coach) bereits joint:
+    Mitglied, Team und Coach kommen aus denselben Zeilen (keine Einzelabfragen pro Zeile; das per
+    Default gejointe Team des Coaches wird nicht gebraucht), deferred_columns (z.B. Coaching.coach_notes)
+    werden erst beim Zugriff geladen. model: Coaching oder ArchivedCoaching.
+    """
+    return [contains_eager(model.team_member_coached).contains_eager(TeamMember.team),
+            contains_eager(model.coach).lazyload(User.led_team_obj)] + [defer(column) for column in deferred_columns]
+
+class CoachingDailyStat(db.Model):
+    # Tages-Rollup pro (Team, Tag, Thema) für Dashboard-Charts und Gesamtsummen.
+    # Wird bei jedem Schreibzugriff auf Coachings inkrementell gepflegt (siehe app/rollup.py).
+    __tablename__ = 'coaching_daily_stats'
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id', name='fk_coaching_daily_stats_team_id'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True, index=True)
+    coaching_subject = db.Column(db.String(50), primary_key=True, default='') # '' steht für "kein Thema"
+    coaching_count = db.Column(db.Integer, nullable=False, default=0)
+    performance_mark_sum = db.Column(db.Integer, nullable=False, default=0)
+    performance_mark_count = db.Column(db.Integer, nullable=False, default=0) # Anzahl Coachings mit Note (für AVG)
+    time_spent_sum = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<CoachingDailyStat team={self.team_id} day={self.day} subject={self.coaching_subject!r} count={self.coaching_count}>'
+
+class CoachingSearchDocument(db.Model):
+    # Suchdokument pro Coaching für die Volltextsuche (siehe app/search.py).
+    # PostgreSQL: generierte tsvector-Spalte search_vector mit GIN-Index.
+    # SQLite: externe FTS5-Tabelle coaching_search_fts, per Trigger synchron gehalten.
+    # Den Fremdschlüssel auf coachings gibt es auf PostgreSQL seit der Partitionierung nicht mehr (Migration 9e4b2c6d1f37).
+    __tablename__ = 'coaching_search_documents'
+    coaching_id = db.Column(db.Integer, db.ForeignKey('coachings.id', name='fk_coaching_search_documents_coaching_id', ondelete='CASCADE'), primary_key=True)
+    primary_text = db.Column(db.Text, nullable=False, default='') # Mitglied, Coach, Thema (höchste Gewichtung)
+    secondary_text = db.Column(db.Text, nullable=False, default='') # Team, Coaching-Stil, TCAP-ID
+    notes_text = db.Column(db.Text, nullable=False, default='') # Coach- und Projektleiter-Notizen
+
+    def __repr__(self):
+        return f'<CoachingSearchDocument coaching={self.coaching_id}>'
+
+# Dialektspezifische Suchindizes (gleiche Anweisungen wie in Migration 8b41f0c7d2e9), damit auch
+# db.create_all() (lokale Datenbanken, Benchmarks) eine durchsuchbare Tabelle anlegt.
+SEARCH_DDL_POSTGRESQL = [
+    "ALTER TABLE coaching_search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', primary_text), 'A') || "
+    "setweight(to_tsvector('simple', secondary_text), 'B') || "
+    "setweight(to_tsvector('simple', notes_text), 'C')) STORED",
+    "CREATE INDEX ix_coaching_search_documents_search_vector ON coaching_search_documents USING GIN (search_vector)",
+]
+SEARCH_DDL_SQLITE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS coaching_search_fts USING fts5("
+    "primary_text, secondary_text, notes_text, content='coaching_search_documents', content_rowid='coaching_id')",
+    "CREATE TRIGGER coaching_search_documents_ai AFTER INSERT ON coaching_search_documents BEGIN "
+    "INSERT INTO coaching_search_fts(rowid, primary_text, secondary_text, notes_text) "
+    "VALUES (new.coaching_id, new.primary_text, new.secondary_text, new.notes_text); END",
+    "CREATE TRIGGER coaching_search_documents_ad AFTER DELETE ON coaching_search_documents BEGIN "
+    "INSERT INTO coaching_search_fts(coaching_search_fts, rowid, primary_text, secondary_text, notes_text) "
+    "VALUES ('delete', old.coaching_id, old.primary_text, old.secondary_text, old.notes_text); END",
+    "CREATE TRIGGER coaching_search_documents_au AFTER UPDATE ON coaching_search_documents BEGIN "
+    "INSERT INTO coaching_search_fts(coaching_search_fts, rowid, primary_text, secondary_text, notes_text) "
+    "VALUES ('delete', old.coaching_id, old.primary_text, old.secondary_text, old.notes_text); "
+    "INSERT INTO coaching_search_fts(rowid, primary_text, secondary_text, notes_text) "
+    "VALUES (new.coaching_id, new.primary_text, new.secondary_text, new.notes_text); END",
+]
+
+# Ausdrucks-Indizes (lower(name), id) für die Präfix-Suche der Admin-Listen (app/lookup.py, Migration 5d2e7a91c4b8).
+LOOKUP_INDEXES = [
+    ('ix_users_username_lookup', User.__table__, 'username'),
+    ('ix_teams_name_lookup', Team.__table__, 'name'),
+    ('ix_team_members_name_lookup', TeamMember.__table__, 'name'),
+]
+for _index_name, _table, _column in LOOKUP_INDEXES:
+    db.event.listen(_table, 'after_create', db.DDL(
+        f'CREATE INDEX {_index_name} ON {_table.name} (lower({_column}) COLLATE "C", id)').execute_if(dialect='postgresql'))
+    db.event.listen(_table, 'after_create', db.DDL(
+        f'CREATE INDEX {_index_name} ON {_table.name} (lower({_column}), id)').execute_if(dialect='sqlite'))
+
+def sqlite_has_fts5(connection):
+    return bool(connection.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+def _sqlite_fts5_available(ddl, target, bind, **kw):
+    return sqlite_has_fts5(bind)
+
+for _stmt in SEARCH_DDL_POSTGRESQL:
+    db.event.listen(CoachingSearchDocument.__table__, 'after_create', db.DDL(_stmt).execute_if(dialect='postgresql'))
+for _stmt in SEARCH_DDL_SQLITE:
+    db.event.listen(CoachingSearchDocument.__table__, 'after_create', db.DDL(_stmt).execute_if(dialect='sqlite', callable_=_sqlite_fts5_available))
+db.event.listen(CoachingSearchDocument.__table__, 'before_drop', db.DDL("DROP TABLE IF EXISTS coaching_search_fts").execute_if(dialect='sqlite'))
+
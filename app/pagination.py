@@ -0,0 +1,99 @@
+# app/pagination.py
+# Keyset-/Seek-Paginierung für Coaching-Listen (sortiert nach coaching_date DESC, id DESC).
+# Statt OFFSET + COUNT(*) wird ab der letzten gesehenen Zeile (Cursor = Datum + ID) weitergelesen,
+# damit auch tiefe Seiten nur einen Index-Bereich lesen.
+# Bei einer Volltextsuche wird zusätzlich zuerst nach Relevanz sortiert (Cursor = Relevanz + Datum + ID).
+
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+CURSOR_SEPARATOR = '_'
+
+def encode_cursor(key):
+    """key: (coaching_date, id) bzw. (rank, coaching_date, id) bei Relevanzsortierung."""
+    *rank, coaching_date, coaching_id = key
+    parts = [repr(float(r)) for r in rank] + [coaching_date.isoformat(), str(coaching_id)]
+    return CURSOR_SEPARATOR.join(parts)
+
+def decode_cursor(cursor_str, ranked=False):
+    """Gibt den Sortierschlüssel als Tupel zurück oder None, wenn der Cursor fehlt oder ungültig ist."""
+    if not cursor_str:
+        return None
+    parts = cursor_str.split(CURSOR_SEPARATOR)
+    if len(parts) != (3 if ranked else 2):
+        return None
+    try:
+        key = (datetime.fromisoformat(parts[-2]), int(parts[-1]))
+        return (float(parts[0]),) + key if ranked else key
+    except ValueError:
+        return None
+
+class KeysetPagination:
+    """Eine Seite einer Keyset-Paginierung (ähnliche Attribute wie Flask-SQLAlchemys Pagination)."""
+
+    def __init__(self, items, per_page, has_prev, has_next, total=None, keys=None):
+        self.items = items
+        self.per_page = per_page
+        self.has_prev = has_prev
+        self.has_next = has_next
+        self.total = total # None, wenn keine exakte Zählung angefordert wurde
+        self._keys = keys if keys is not None else [(c.coaching_date, c.id) for c in items]
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self._keys[-1]) if self.has_next and self._keys else None
+
+    @property
+    def prev_cursor(self):
+        return encode_cursor(self._keys[0]) if self.has_prev and self._keys else None
+
+def _seek_condition(columns, key, older):
+    """Lexikografischer Vergleich (c1, c2, ...) < key (older=True) bzw. > key."""
+    condition = None
+    for column, value in reversed(list(zip(columns, key))):
+        compare = column < value if older else column > value
+        condition = compare if condition is None else or_(compare, and_(column == value, condition))
+    # Redundante Schranke auf der ersten Spalte erlaubt dem Planer einen Index-Bereichsscan
+    bound = columns[0] <= key[0] if older else columns[0] >= key[0]
+    return and_(bound, condition)
+
+def keyset_paginate(query, per_page, after=None, before=None, count=False, rank_column=None, count_query=None):
+    """
+    Paginiert eine Coaching-Abfrage (Coaching oder ArchivedCoaching) nach (coaching_date DESC, id DESC).
+    after:  Cursor-String – liefert die Seite NACH diesem Eintrag (ältere Coachings).
+    before: Cursor-String – liefert die Seite VOR diesem Eintrag (neuere Coachings).
+    count:  Wenn True, wird zusätzlich die exakte Gesamtzahl per COUNT(*) ermittelt.
+    rank_column: optionale Relevanzspalte (z.B. aus app.search); sortiert dann nach (rank DESC, Datum DESC, ID DESC).
+    count_query: optionale Abfrage für die Gesamtzahl mit denselben Treffern (z.B. ohne die Joins für die Anzeige).
+    """
+    total = (count_query if count_query is not None else query).order_by(None).count() if count else None
+    ranked = rank_column is not None
+    model = query.column_descriptions[0]['entity'] # Coaching oder ArchivedCoaching (Archiv-Bestand)
+    columns = ([rank_column] if ranked else []) + [model.coaching_date, model.id]
+    if ranked:
+        query = query.add_columns(rank_column)
+
+    def split_rows(rows):
+        if not ranked:
+            return rows, [(c.coaching_date, c.id) for c in rows]
+        return [r[0] for r in rows], [(r[1], r[0].coaching_date, r[0].id) for r in rows]
+
+    after_key = decode_cursor(after, ranked)
+    before_key = decode_cursor(before, ranked) if not after_key else None
+
+    if before_key:
+        rows = query.filter(_seek_condition(columns, before_key, older=False))\
+            .order_by(*[c.asc() for c in columns])\
+            .limit(per_page + 1).all()
+        if len(rows) > per_page:
+            items, keys = split_rows(list(reversed(rows[:per_page])))
+            return KeysetPagination(items, per_page, has_prev=True, has_next=True, total=total, keys=keys)
+        # Anfang der Liste erreicht: reguläre erste Seite liefern, damit sie immer voll ist
+        after_key = None
+
+    if after_key:
+        query = query.filter(_seek_condition(columns, after_key, older=True))
+    rows = query.order_by(*[c.desc() for c in columns]).limit(per_page + 1).all()
+    has_next = len(rows) > per_page
+    items, keys = split_rows(rows[:per_page])
+    return KeysetPagination(items, per_page, has_prev=after_key is not None, has_next=has_next, total=total, keys=keys)
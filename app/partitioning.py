@@ -0,0 +1,49 @@
+# app/partitioning.py
+# Jahrespartitionen der Tabelle coachings auf PostgreSQL (Migration 9e4b2c6d1f37): coachings ist dort nach
+# coaching_date partitioniert (coachings_y2025, coachings_y2026, ... und coachings_default für alles ohne
+# Jahrespartition). Perioden-Filter lesen so nur die Partitionen der betroffenen Jahre (Partition Pruning).
+# Neue Jahre legt die DB-Funktion coachings_ensure_year_partition() an; ensure_coaching_partitions() ruft sie
+# für das laufende und das nächste Jahr auf – beim Start von gunicorn (gunicorn.conf.py: when_ready) und per
+# 'flask ensure-coaching-partitions' (z.B. als Cronjob). Auf SQLite und ohne Migration sind alle Funktionen No-ops.
+
+from datetime import datetime, timezone
+from sqlalchemy import text
+from app import db
+
+PARTITION_YEARS_AHEAD = 1 # Partitionen im Voraus, damit der Jahreswechsel nie in coachings_default landet
+
+def coachings_partitioned():
+    """True, wenn coachings eine partitionierte PostgreSQL-Tabelle ist."""
+    if db.session.get_bind().dialect.name != 'postgresql':
+        return False
+    return db.session.execute(text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('coachings'))"
+    )).scalar()
+
+def ensure_coaching_partitions(years_ahead=PARTITION_YEARS_AHEAD, now=None):
+    """
+    Legt fehlende Jahrespartitionen an: laufendes Jahr bis years_ahead Jahre voraus sowie alle Jahre, deren
+    Coachings in coachings_default liegen (z.B. importierte alte Coachings). Gibt die neu angelegten Jahre zurück.
+    """
+    if not coachings_partitioned():
+        return []
+    year = (now or datetime.now(timezone.utc)).year
+    default_years = db.session.execute(text(
+        "SELECT DISTINCT extract(year FROM coaching_date)::integer FROM coachings_default"
+    )).scalars().all()
+    created = []
+    for partition_year in sorted(set(range(year, year + years_ahead + 1)) | set(default_years)):
+        if db.session.execute(text("SELECT coachings_ensure_year_partition(:year)"), {'year': partition_year}).scalar():
+            created.append(partition_year)
+    db.session.commit()
+    return created
+
+def coaching_partitions():
+    """(Name, Bereich, geschätzte Zeilenzahl) aller Partitionen von coachings; leer ohne Partitionierung."""
+    if not coachings_partitioned():
+        return []
+    return db.session.execute(text(
+        "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint "
+        "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = to_regclass('coachings') ORDER BY c.relname"
+    )).all()
@@ -0,0 +1,103 @@
+# app/retention.py
+# Cold-Storage für Coachings: Coachings von Mitgliedern im ARCHIV und Coachings, die älter als N Jahre sind,
+# werden aus coachings in die Archivtabelle coachings_archive (Modell ArchivedCoaching) verschoben. Listen,
+# Zählungen und Aggregationen lesen dann nur noch die aktuellen Coachings.
+# Verschoben wird batchweise (aufsteigend nach ID), jeder Batch in einer eigenen Transaktion: Zeilen kopieren,
+# vom Rollup abziehen, Suchdokumente entfernen, Zeilen löschen, commit(). Ein Fehler rollt nur den laufenden
+# Batch zurück; ein erneuter Aufruf macht dort weiter.
+# Gelesen wird das Archiv nur auf ausdrücklichen Wunsch (Coaching-Verwaltung und Export mit tier=archiv).
+# Zurückholen, z.B. nach der Reaktivierung eines Mitglieds: restore_coachings() bzw. 'flask restore-coachings'.
+
+from datetime import datetime, timezone
+from sqlalchemy import delete, literal, or_, select, true
+from app import db
+from app.models import User, TeamMember, Coaching, ArchivedCoaching
+from app.membership import sync_coaching_teams
+from app.rollup import record_coachings_added, record_coachings_deleted
+from app.search import refresh_search_documents, remove_search_documents
+
+TIER_HOT = 'aktiv'
+TIER_ARCHIVE = 'archiv'
+TIER_MODELS = {TIER_HOT: Coaching, TIER_ARCHIVE: ArchivedCoaching}
+RETENTION_BATCH_SIZE = 1000
+COACHING_COLUMNS = [column.name for column in Coaching.__table__.columns]
+
+def tier_model(tier):
+    """Modell zum Bestand ('aktiv' = coachings, 'archiv' = coachings_archive); Unbekanntes gilt als 'aktiv'."""
+    return TIER_MODELS.get(tier, Coaching)
+
+def retention_cutoff(older_than_years, now=None):
+    """Stichtag: Coachings VOR diesem Zeitpunkt sind älter als older_than_years Jahre."""
+    now = now or datetime.now(timezone.utc)
+    if now.month == 2 and now.day == 29:
+        now = now.replace(day=28)
+    return now.replace(year=now.year - older_than_years)
+
+def retention_criterion(older_than_years=None, archived_members=True, now=None):
+    """Bedingung für zu verschiebende Coachings oder None, wenn keine Regel aktiv ist."""
+    conditions = []
+    if archived_members:
+        conditions.append(Coaching.is_archived == true())
+    if older_than_years:
+        conditions.append(Coaching.coaching_date < retention_cutoff(older_than_years, now))
+    return or_(*conditions) if conditions else None
+
+def _move_batches(select_ids, move_batch, batch_size):
+    moved = 0
+    while True:
+        ids = db.session.scalars(select_ids.limit(batch_size)).all()
+        if not ids:
+            return moved
+        try:
+            move_batch(ids)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        moved += len(ids)
+
+def archive_coachings(criterion, batch_size=RETENTION_BATCH_SIZE):
+    """Verschiebt die Coachings, die criterion erfüllen, nach coachings_archive. Gibt die Anzahl zurück."""
+    # IDs werden nie wiederverwendet (SQLite: AUTOINCREMENT, PostgreSQL: Sequenz), archivierte IDs bleiben also frei
+    source, archive = Coaching.__table__, ArchivedCoaching.__table__
+
+    def move_batch(ids):
+        batch = Coaching.id.in_(ids)
+        archived_at = literal(datetime.now(timezone.utc), db.DateTime)
+        db.session.execute(archive.insert().from_select(
+            COACHING_COLUMNS + ['archived_at'],
+            select(*[source.c[name] for name in COACHING_COLUMNS], archived_at).where(batch)
+        ))
+        record_coachings_deleted(batch)
+        remove_search_documents(batch)
+        db.session.execute(delete(source).where(batch))
+
+    select_ids = select(Coaching.id).where(criterion).order_by(Coaching.id)
+    return _move_batches(select_ids, move_batch, batch_size)
+
+def restore_coachings(criterion, batch_size=RETENTION_BATCH_SIZE):
+    """
+    Holt die archivierten Coachings, die criterion (auf ArchivedCoaching) erfüllen, nach coachings zurück –
+    mit team_id/is_archived aus dem aktuellen Team des Mitglieds. Gibt die Anzahl zurück.
+    Coachings, deren Coach oder Mitglied nicht mehr existiert (Archiv ohne Fremdschlüssel), bleiben im Archiv;
+    siehe orphaned_archive_criterion().
+    """
+    source, archive = Coaching.__table__, ArchivedCoaching.__table__
+
+    def move_batch(ids):
+        db.session.execute(source.insert().from_select(
+            COACHING_COLUMNS, select(*[archive.c[name] for name in COACHING_COLUMNS]).where(archive.c.id.in_(ids))
+        ))
+        batch = Coaching.id.in_(ids)
+        sync_coaching_teams(batch)
+        record_coachings_added(batch)
+        refresh_search_documents(batch)
+        db.session.execute(delete(archive).where(archive.c.id.in_(ids)))
+
+    select_ids = select(ArchivedCoaching.id).where(criterion, ~orphaned_archive_criterion()).order_by(ArchivedCoaching.id)
+    return _move_batches(select_ids, move_batch, batch_size)
+
+def orphaned_archive_criterion():
+    """Archivierte Coachings, deren Coach oder Mitglied gelöscht wurde – sie verletzten beim Zurückholen die Fremdschlüssel."""
+    return or_(ArchivedCoaching.coach_id.not_in(select(User.id)),
+               ArchivedCoaching.team_member_id.not_in(select(TeamMember.id)))
@@ -0,0 +1,157 @@
+# app/rollup.py
+# Pflege der Tages-Rollup-Tabelle coaching_daily_stats.
+# Jeder Schreibpfad auf Coachings (Anlegen, Bearbeiten, Löschen, Mitglied verschieben)
+# ruft hier die passenden Funktionen VOR dem commit() auf, damit Rollup und Coachings
+# in derselben Transaktion geändert werden.
+
+from datetime import date, datetime
+from sqlalchemy import func, delete, and_
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.models import TeamMember, Coaching, CoachingDailyStat
+
+METRIC_COLUMNS = ('coaching_count', 'performance_mark_sum', 'performance_mark_count', 'time_spent_sum')
+
+def _to_day(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10]) # SQLite liefert date() als String
+
+def adjust_daily_stats(team_id, day, coaching_subject, coaching_count=0, performance_mark_sum=0, performance_mark_count=0, time_spent_sum=0):
+    """
+    Addiert (bzw. subtrahiert bei negativen Werten) die Deltas auf die Rollup-Zeile
+    (team_id, day, coaching_subject). Nutzt INSERT ... ON CONFLICT DO UPDATE, wo verfügbar.
+    """
+    if not coaching_count and not performance_mark_sum and not performance_mark_count and not time_spent_sum:
+        return
+    key = {'team_id': team_id, 'day': _to_day(day), 'coaching_subject': coaching_subject or ''}
+    deltas = {
+        'coaching_count': coaching_count, 'performance_mark_sum': performance_mark_sum,
+        'performance_mark_count': performance_mark_count, 'time_spent_sum': time_spent_sum
+    }
+    table = CoachingDailyStat.__table__
+    dialect_name = db.session.get_bind().dialect.name
+
+    if dialect_name in ('postgresql', 'sqlite'):
+        insert = postgresql.insert if dialect_name == 'postgresql' else sqlite.insert
+        stmt = insert(table).values(**key, **deltas)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.team_id, table.c.day, table.c.coaching_subject],
+            set_={col: table.c[col] + stmt.excluded[col] for col in METRIC_COLUMNS}
+        )
+        db.session.execute(stmt)
+    else:
+        row = db.session.get(CoachingDailyStat, (key['team_id'], key['day'], key['coaching_subject']), with_for_update=True)
+        if row is None:
+            db.session.add(CoachingDailyStat(**key, **deltas))
+        else:
+            for col in METRIC_COLUMNS:
+                setattr(row, col, getattr(row, col) + deltas[col])
+        db.session.flush()
+
+    if coaching_count < 0:
+        db.session.execute(delete(table).where(and_(
+            table.c.team_id == key['team_id'], table.c.day == key['day'],
+            table.c.coaching_subject == key['coaching_subject'], table.c.coaching_count <= 0
+        )))
+
+def coaching_stats_snapshot(coaching):
+    """Hält die rollup-relevanten Werte eines Coachings fest (z.B. vor populate_obj)."""
+    team_id = db.session.query(TeamMember.team_id).filter(TeamMember.id == coaching.team_member_id).scalar()
+    return {
+        'team_id': team_id,
+        'day': coaching.coaching_date,
+        'coaching_subject': coaching.coaching_subject,
+        'performance_mark': coaching.performance_mark,
+        'time_spent': coaching.time_spent
+    }
+
+def apply_snapshot(snapshot, sign=1):
+    if snapshot['team_id'] is None or snapshot['day'] is None:
+        return
+    adjust_daily_stats(
+        snapshot['team_id'], snapshot['day'], snapshot['coaching_subject'],
+        coaching_count=sign,
+        performance_mark_sum=sign * (snapshot['performance_mark'] or 0),
+        performance_mark_count=sign if snapshot['performance_mark'] is not None else 0,
+        time_spent_sum=sign * (snapshot['time_spent'] or 0)
+    )
+
+def record_coaching_added(coaching):
+    if coaching.coaching_date is None:
+        db.session.flush() # coaching_date-Default wird erst beim Flush gesetzt
+    apply_snapshot(coaching_stats_snapshot(coaching), +1)
+
+def record_coaching_deleted(coaching):
+    apply_snapshot(coaching_stats_snapshot(coaching), -1)
+
+def record_coaching_changed(old_snapshot, coaching):
+    new_snapshot = coaching_stats_snapshot(coaching)
+    if new_snapshot == old_snapshot:
+        return
+    apply_snapshot(old_snapshot, -1)
+    apply_snapshot(new_snapshot, +1)
+
+def _grouped_coaching_totals(*criteria):
+    day_expr = func.date(Coaching.coaching_date)
+    subject_expr = func.coalesce(Coaching.coaching_subject, '')
+    return db.session.query(
+        Coaching.team_id.label('team_id'),
+        day_expr.label('day'),
+        subject_expr.label('coaching_subject'),
+        func.count(Coaching.id).label('coaching_count'),
+        func.coalesce(func.sum(Coaching.performance_mark), 0).label('performance_mark_sum'),
+        func.count(Coaching.performance_mark).label('performance_mark_count'),
+        func.coalesce(func.sum(Coaching.time_spent), 0).label('time_spent_sum')
+    ).filter(*criteria)\
+     .group_by(Coaching.team_id, day_expr, subject_expr)
+
+def record_coachings_deleted(*criteria):
+    """Zieht die Coachings, die den Kriterien entsprechen, vor einem Bulk-Delete vom Rollup ab."""
+    for r in _grouped_coaching_totals(*criteria).all():
+        adjust_daily_stats(r.team_id, r.day, r.coaching_subject,
+                           coaching_count=-r.coaching_count,
+                           performance_mark_sum=-r.performance_mark_sum,
+                           performance_mark_count=-r.performance_mark_count,
+                           time_spent_sum=-r.time_spent_sum)
+
+def record_coachings_added(*criteria):
+    """Addiert die Coachings, die den Kriterien entsprechen, nach einem Bulk-Insert auf das Rollup."""
+    for r in _grouped_coaching_totals(*criteria).all():
+        adjust_daily_stats(r.team_id, r.day, r.coaching_subject,
+                           coaching_count=r.coaching_count,
+                           performance_mark_sum=r.performance_mark_sum,
+                           performance_mark_count=r.performance_mark_count,
+                           time_spent_sum=r.time_spent_sum)
+
+def record_member_moved(member_id, old_team_id, new_team_id):
+    """Verschiebt die Rollup-Anteile eines Mitglieds von seinem alten in das neue Team."""
+    if old_team_id == new_team_id:
+        return
+    for r in _grouped_coaching_totals(Coaching.team_member_id == member_id).all():
+        adjust_daily_stats(old_team_id, r.day, r.coaching_subject,
+                           coaching_count=-r.coaching_count,
+                           performance_mark_sum=-r.performance_mark_sum,
+                           performance_mark_count=-r.performance_mark_count,
+                           time_spent_sum=-r.time_spent_sum)
+        adjust_daily_stats(new_team_id, r.day, r.coaching_subject,
+                           coaching_count=r.coaching_count,
+                           performance_mark_sum=r.performance_mark_sum,
+                           performance_mark_count=r.performance_mark_count,
+                           time_spent_sum=r.time_spent_sum)
+
+def rebuild_daily_stats():
+    """Baut coaching_daily_stats vollständig aus der coachings-Tabelle neu auf. Gibt die Zeilenzahl zurück."""
+    table = CoachingDailyStat.__table__
+    totals = _grouped_coaching_totals().subquery('daily_totals_sq')
+    db.session.execute(delete(table))
+    db.session.execute(table.insert().from_select(
+        ['team_id', 'day', 'coaching_subject'] + list(METRIC_COLUMNS),
+        db.select(totals.c.team_id, totals.c.day, totals.c.coaching_subject,
+                  totals.c.coaching_count, totals.c.performance_mark_sum,
+                  totals.c.performance_mark_count, totals.c.time_spent_sum)
+    ))
+    db.session.commit()
+    return db.session.query(func.count()).select_from(table).scalar()
@@ -0,0 +1,134 @@
+# app/search.py
+# Volltextsuche über Coachings.
+# Pro Coaching gibt es ein Suchdokument (coaching_search_documents) mit drei gewichteten Textfeldern.
+# Die eigentliche Indizierung übernimmt die Datenbank: tsvector + GIN-Index auf PostgreSQL,
+# FTS5 auf SQLite. Jeder Schreibpfad, der Coachings oder die darin gesuchten Namen ändert
+# (Mitglied, Coach, Team), ruft hier die passende Funktion VOR dem commit() auf.
+# Ohne Suchindex (andere Datenbanken, SQLite ohne FTS5, Migration fehlt) wird auf ILIKE zurückgefallen.
+
+import re
+from sqlalchemy import func, inspect, or_, text
+from app import db
+from app.models import User, Team, TeamMember, Coaching, CoachingSearchDocument
+
+SEARCH_TS_CONFIG = 'simple' # keine Wortstamm-Reduktion: Namen und IDs sollen unverändert gefunden werden
+MAX_SEARCH_TOKENS = 8
+
+SCOPE_ALL = 'all' # alle Felder (Coaching-Verwaltung)
+SCOPE_PRIMARY = 'primary' # nur Mitglied, Coach und Thema (Dashboard-Suche)
+
+_backend_cache = {}
+
+def _space_joined(*columns):
+    expr = func.coalesce(columns[0], '')
+    for column in columns[1:]:
+        expr = expr + ' ' + func.coalesce(column, '')
+    return expr
+
+def _document_select(*criteria):
+    return db.select(
+        Coaching.id,
+        _space_joined(TeamMember.name, User.username, Coaching.coaching_subject),
+        _space_joined(Team.name, Coaching.coaching_style, Coaching.tcap_id),
+        _space_joined(Coaching.coach_notes, Coaching.project_leader_notes)
+    ).select_from(Coaching)\
+     .join(TeamMember, Coaching.team_member_id == TeamMember.id)\
+     .join(Team, TeamMember.team_id == Team.id)\
+     .outerjoin(User, Coaching.coach_id == User.id)\
+     .where(*criteria)
+
+def _matching_ids(*criteria):
+    return db.select(Coaching.id).join(TeamMember, Coaching.team_member_id == TeamMember.id).where(*criteria)
+
+def remove_search_documents(*criteria):
+    """Entfernt die Suchdokumente der passenden Coachings (vor dem Löschen der Coachings aufrufen)."""
+    table = CoachingSearchDocument.__table__
+    db.session.execute(table.delete().where(table.c.coaching_id.in_(_matching_ids(*criteria))))
+
+def refresh_search_documents(*criteria):
+    """
+    Baut die Suchdokumente der Coachings neu auf, die den Kriterien entsprechen
+    (Kriterien auf Coaching oder TeamMember, z.B. TeamMember.team_id == 3).
+    """
+    db.session.flush()
+    table = CoachingSearchDocument.__table__
+    remove_search_documents(*criteria)
+    db.session.execute(table.insert().from_select(
+        ['coaching_id', 'primary_text', 'secondary_text', 'notes_text'], _document_select(*criteria)
+    ))
+
+def index_coaching(coaching):
+    if coaching.id is None:
+        db.session.flush()
+    refresh_search_documents(Coaching.id == coaching.id)
+
+def rebuild_search_index():
+    """Baut alle Suchdokumente aus der coachings-Tabelle neu auf. Gibt die Anzahl zurück."""
+    table = CoachingSearchDocument.__table__
+    db.session.execute(table.delete())
+    db.session.execute(table.insert().from_select(
+        ['coaching_id', 'primary_text', 'secondary_text', 'notes_text'], _document_select()
+    ))
+    db.session.commit()
+    return db.session.query(func.count()).select_from(table).scalar()
+
+def _detect_backend(engine):
+    inspector = inspect(engine)
+    if engine.dialect.name == 'postgresql':
+        if not inspector.has_table(CoachingSearchDocument.__tablename__):
+            return None
+        columns = {c['name'] for c in inspector.get_columns(CoachingSearchDocument.__tablename__)}
+        return 'postgresql' if 'search_vector' in columns else None
+    if engine.dialect.name == 'sqlite':
+        return 'sqlite' if inspector.has_table('coaching_search_fts') else None
+    return None
+
+def search_backend():
+    """'postgresql', 'sqlite' oder None (kein Suchindex vorhanden). Wird pro Engine einmal ermittelt."""
+    engine = db.engine
+    if engine not in _backend_cache:
+        _backend_cache[engine] = _detect_backend(engine)
+    return _backend_cache[engine]
+
+def search_tokens(term):
+    return re.findall(r'[^\W_]+', (term or '').lower())[:MAX_SEARCH_TOKENS]
+
+def coaching_search_subquery(term, scope=SCOPE_ALL):
+    """
+    Liefert eine Subquery (coaching_id, relevance) aller Treffer – jedes Suchwort als Präfix,
+    alle Wörter müssen vorkommen. None, wenn kein Suchindex verfügbar ist oder der Begriff keine Wörter enthält.
+    """
+    backend = search_backend(); tokens = search_tokens(term)
+    if backend is None or not tokens:
+        return None
+    if backend == 'postgresql':
+        weights = 'A' if scope == SCOPE_PRIMARY else ''
+        sql = text(
+            "SELECT coaching_id, CAST(ts_rank(search_vector, to_tsquery(:ts_config, :q)) AS DOUBLE PRECISION) AS relevance "
+            "FROM coaching_search_documents WHERE search_vector @@ to_tsquery(:ts_config, :q)"
+        ).bindparams(ts_config=SEARCH_TS_CONFIG, q=' & '.join(f"{tok}:*{weights}" for tok in tokens))
+    else:
+        match = ' AND '.join(f'"{tok}"*' for tok in tokens)
+        if scope == SCOPE_PRIMARY:
+            match = f'{{primary_text}} : ({match})'
+        # bm25() ist umso kleiner, je besser der Treffer – negiert, damit "größer = relevanter" gilt
+        sql = text(
+            "SELECT rowid AS coaching_id, -bm25(coaching_search_fts, 10.0, 5.0, 1.0) AS relevance "
+            "FROM coaching_search_fts WHERE coaching_search_fts MATCH :q"
+        ).bindparams(q=match)
+    return sql.columns(coaching_id=db.Integer, relevance=db.Float).subquery('coaching_search_sq')
+
+def apply_ilike_search(query, term, columns):
+    """ILIKE-Suche: mindestens eine der Spalten enthält den Begriff (ohne Suchindex, z.B. für archivierte Coachings)."""
+    pattern = f"%{term}%"
+    return query.filter(or_(*[column.ilike(pattern) for column in columns]))
+
+def apply_coaching_search(query, term, scope=SCOPE_ALL, fallback_columns=()):
+    """
+    Schränkt eine Coaching-Abfrage auf die Suchtreffer ein.
+    Gibt (query, relevance_column) zurück; relevance_column ist None beim ILIKE-Fallback über fallback_columns.
+    """
+    search_sq = coaching_search_subquery(term, scope)
+    if search_sq is None:
+        return apply_ilike_search(query, term, fallback_columns), None
+    return query.join(search_sq, search_sq.c.coaching_id == Coaching.id), search_sq.c.relevance
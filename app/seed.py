@@ -0,0 +1,148 @@
+# app/seed.py
+# Synthetische Testdaten für lokale Entwicklung, Benchmarks und Lasttests ('flask seed').
+# Erzeugt Teams mit Teamleitern, aktive und archivierte Teammitglieder (Team ARCHIV), Fach-Coaches
+# und Coachings mit realistischer Verteilung: nur Werktage zu Bürozeiten, Themen/Stile gewichtet,
+# TCAP-IDs bei TCAP-Coachings, Leitfaden-Erfüllung und Note abhängig vom "Können" des Mitglieds.
+# Mit gleichem seed, gleichen Größen und gleichem Enddatum entstehen identische Daten.
+# Eingefügt wird ohne ORM-Objekte (insert_coachings: COPY auf PostgreSQL, sonst executemany) und ohne
+# Index-Pflege (Indizes der coachings-Tabelle werden danach neu aufgebaut); Rollup und Suchindex werden danach einmal komplett aufgebaut.
+
+import random
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import bindparam, insert, update
+from werkzeug.security import generate_password_hash
+from app import db
+from app.models import User, Team, TeamMember, Coaching, LEITFADEN_FIELDS
+from app.importer import insert_coachings
+from app.rollup import rebuild_daily_stats
+from app.search import rebuild_search_index
+from app.utils import ARCHIV_TEAM_NAME, ROLE_ADMIN, ROLE_PROJEKTLEITER, ROLE_QM, ROLE_SALESCOACH, ROLE_TRAINER, ROLE_TEAMLEITER
+
+SEED_BATCH_SIZE = 10000
+
+COACHING_SUBJECT_WEIGHTS = {'Sales': 45, 'Qualität': 35, 'Allgemein': 20}
+TCAP_SHARE = 0.4 # Rest: Side-by-Side
+TEAMLEADER_COACH_SHARE = 0.7 # Rest: Qualitäts-/Sales-Coaches und Trainer
+KA_SHARE = 0.08 # Anteil "k.A." je Leitfaden-Punkt
+COACH_NOTES_SHARE = 0.6
+PROJECT_LEADER_NOTES_SHARE = 0.05
+SPECIALISTS = ((ROLE_QM, 'qm'), (ROLE_SALESCOACH, 'salescoach'), (ROLE_TRAINER, 'trainer'))
+
+FIRST_NAMES = ['Anna', 'Ben', 'Clara', 'David', 'Elif', 'Felix', 'Greta', 'Hannes', 'Ines', 'Jonas', 'Katrin', 'Leon',
+               'Mara', 'Nils', 'Olga', 'Paul', 'Quentin', 'Rosa', 'Sven', 'Tanja', 'Umut', 'Vera', 'Willi', 'Yasemin']
+LAST_NAMES = ['Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber', 'Meyer', 'Wagner', 'Becker', 'Schulz', 'Hoffmann',
+              'Koch', 'Richter', 'Klein', 'Wolf', 'Schröder', 'Neumann', 'Schwarz', 'Zimmermann', 'Braun', 'Krüger']
+NOTE_PHRASES = ['Begrüßung freundlich und klar.', 'Legitimation vollständig.', 'Legitimation vergessen, bitte nachschulen.',
+                'Gute Bedarfsanalyse.', 'Einwandbehandlung üben.', 'Angebot zu früh platziert.', 'Abschlussfrage fehlt.',
+                'Zusammenfassung am Ende sehr gut.', 'Gesprächsführung souverän.', 'Pausen im Gespräch reduzieren.',
+                'KZB korrekt gesetzt.', 'Produktwissen ausbauen.']
+PL_NOTE_PHRASES = ['Im Teammeeting besprechen.', 'Nachcoaching in zwei Wochen.', 'Positiv hervorheben.']
+
+def _workdays(start_day, end_day):
+    days, day = [], start_day
+    while day <= end_day:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+def _insert_returning_ids(model, rows):
+    if not rows:
+        return []
+    result = db.session.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+    return [row[0] for row in result]
+
+def database_is_empty():
+    return not any(db.session.query(model.id).limit(1).first() for model in (User, Team, TeamMember, Coaching))
+
+def seed_database(teams=20, members_per_team=15, archived_members=50, coachings=50000, days=730,
+                  specialists_per_role=2, seed=1, password='seed', end_date=None):
+    """
+    Befüllt eine LEERE Datenbank (Tabellen müssen existieren) mit synthetischen Daten und
+    gibt die Anzahl der angelegten Datensätze zurück. Alle Benutzer erhalten dasselbe Passwort:
+    admin, pl, qm1.., salescoach1.., trainer1.., tl001.. (Teamleiter von "Team 001" usw.).
+    """
+    rng = random.Random(seed)
+    end_day = end_date or date.today()
+    workdays = _workdays(end_day - timedelta(days=days - 1), end_day)
+    password_hash = generate_password_hash(password) # einmal hashen statt pro Benutzer
+
+    team_ids = _insert_returning_ids(Team, [{'name': f'Team {i:03d}'} for i in range(1, teams + 1)])
+    archiv_team_id = _insert_returning_ids(Team, [{'name': ARCHIV_TEAM_NAME}])[0]
+
+    user_rows = [{'username': 'admin', 'role': ROLE_ADMIN}, {'username': 'pl', 'role': ROLE_PROJEKTLEITER}]
+    user_rows += [{'username': f'{prefix}{i}', 'role': role} for role, prefix in SPECIALISTS for i in range(1, specialists_per_role + 1)]
+    user_rows += [{'username': f'tl{i:03d}', 'role': ROLE_TEAMLEITER, 'team_id_if_leader': team_id} for i, team_id in enumerate(team_ids, 1)]
+    for row in user_rows:
+        row['password_hash'] = password_hash
+        row.setdefault('team_id_if_leader', None)
+    user_ids = _insert_returning_ids(User, user_rows)
+    leader_ids = user_ids[-teams:] if teams else []
+    specialist_ids = user_ids[2:len(user_ids) - teams] or user_ids[:1]
+    if team_ids:
+        db.session.execute(update(Team.__table__).where(Team.__table__.c.id == bindparam('b_team_id'))
+                           .values(team_leader_id=bindparam('b_leader_id')),
+                           [{'b_team_id': t, 'b_leader_id': l} for t, l in zip(team_ids, leader_ids)])
+
+    # Mitglieder: (Team, ARCHIV?, Teamleiter, Können 0..1, letzter möglicher Coaching-Tag als Index in workdays)
+    member_rows, member_profiles = [], []
+    for team_id, leader_id in zip(team_ids, leader_ids):
+        for _ in range(members_per_team):
+            member_rows.append({'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', 'team_id': team_id})
+            member_profiles.append((team_id, False, leader_id, rng.uniform(0.35, 0.95), len(workdays)))
+    for _ in range(archived_members if team_ids else 0):
+        # Archivierte Mitglieder: früher in einem normalen Team, Coachings nur bis zum Ausscheiden
+        member_rows.append({'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', 'team_id': archiv_team_id})
+        member_profiles.append((archiv_team_id, True, rng.choice(leader_ids), rng.uniform(0.2, 0.8), max(1, int(len(workdays) * rng.uniform(0.1, 0.8)))))
+    member_ids = _insert_returning_ids(TeamMember, member_rows)
+    members = list(zip(member_ids, member_profiles))
+
+    inserted = 0
+    if members and workdays and coachings:
+        # Tabelle ist leer: Indizes erst nach dem Laden aufbauen statt bei jeder Zeile pflegen (~3x schneller)
+        connection = db.session.connection()
+        coaching_indexes = list(Coaching.__table__.indexes)
+        for index in coaching_indexes:
+            index.drop(connection, checkfirst=True)
+        insert_coachings(_coaching_rows(rng, coachings, members, specialist_ids, workdays), SEED_BATCH_SIZE)
+        for index in coaching_indexes:
+            index.create(connection, checkfirst=True)
+        inserted = coachings
+    db.session.commit()
+    rebuild_daily_stats()
+    rebuild_search_index() # committet
+    return {'teams': len(team_ids) + 1, 'users': len(user_ids), 'team_members': len(member_ids),
+            'archived_members': len(member_ids) - teams * members_per_team, 'coachings': inserted}
+
+def _coaching_rows(rng, count, members, specialist_ids, workdays):
+    # Pro Zeile nur random()-Aufrufe und Listenzugriffe (randrange/choices/sample kosten bei 1 Mio. Zeilen Sekunden)
+    leitfaden_attrs = [attr for _, attr in LEITFADEN_FIELDS]
+    day_starts = [datetime.combine(day, time(8)) for day in workdays]
+    subject_pool = [subject for subject, weight in COACHING_SUBJECT_WEIGHTS.items() for _ in range(weight)]
+    note_pool = [' '.join(rng.sample(NOTE_PHRASES, rng.randint(1, 3))) for _ in range(500)]
+    tcap_minutes, sbs_minutes = list(range(10, 46)), list(range(30, 121, 5))
+    random_value, gauss = rng.random, rng.gauss
+    num_members, num_specialists, num_days = len(members), len(specialist_ids), len(workdays)
+    for seq in range(1, count + 1):
+        member_id, (team_id, is_archived, leader_id, skill, last_day) = members[int(random_value() * num_members)]
+        while last_day < num_days and random_value() * num_days >= last_day: # archivierte Mitglieder anteilig zur aktiven Zeit
+            member_id, (team_id, is_archived, leader_id, skill, last_day) = members[int(random_value() * num_members)]
+        is_tcap = random_value() < TCAP_SHARE
+        minutes = tcap_minutes if is_tcap else sbs_minutes
+        yes_limit = KA_SHARE + (1 - KA_SHARE) * skill
+        values = {
+            'team_member_id': member_id, 'team_id': team_id, 'is_archived': is_archived,
+            'coach_id': leader_id if random_value() < TEAMLEADER_COACH_SHARE else specialist_ids[int(random_value() * num_specialists)],
+            'coaching_date': day_starts[int(random_value() * last_day)] + timedelta(seconds=int(random_value() * 36000)), # 8-18 Uhr
+            'coaching_style': 'TCAP' if is_tcap else 'Side-by-Side',
+            'tcap_id': f'TCAP-{seq:08d}' if is_tcap else None,
+            'coaching_subject': subject_pool[int(random_value() * len(subject_pool))],
+            'performance_mark': min(10, max(0, round(skill * 10 + gauss(0, 1.5)))),
+            'time_spent': minutes[int(random_value() * len(minutes))],
+            'coach_notes': note_pool[int(random_value() * len(note_pool))] if random_value() < COACH_NOTES_SHARE else None,
+            'project_leader_notes': PL_NOTE_PHRASES[int(random_value() * len(PL_NOTE_PHRASES))] if random_value() < PROJECT_LEADER_NOTES_SHARE else None,
+        }
+        for attr in leitfaden_attrs:
+            r = random_value()
+            values[attr] = 'k.A.' if r < KA_SHARE else ('Ja' if r < yes_limit else 'Nein')
+        yield values
@@ -0,0 +1,183 @@
+// app/static/admin_lookup.js
+// Lädt Admin-Tabellen und Filter-Dropdowns seitenweise über die JSON-Endpunkte unter /admin/api/...
+// (Antwort: {items: [...], next_cursor: "..." | null}, Präfix-Suche über ?q=, nächste Seite über ?after=).
+// Zeilen und Optionen werden per textContent aufgebaut – Namen werden nie als HTML interpretiert.
+var AdminLookup = (function () {
+    var SEARCH_DELAY_MS = 250;
+
+    function fetchPage(baseUrl, term, after) {
+        var url = new URL(baseUrl, window.location.origin);
+        if (term) { url.searchParams.set('q', term); }
+        if (after) { url.searchParams.set('after', after); }
+        return fetch(url.toString(), { credentials: 'same-origin', headers: { 'Accept': 'application/json' } })
+            .then(function (response) {
+                if (!response.ok) { throw new Error('HTTP ' + response.status); }
+                return response.json();
+            });
+    }
+
+    function debounce(fn) {
+        var timer = null;
+        return function () {
+            clearTimeout(timer);
+            timer = setTimeout(fn, SEARCH_DELAY_MS);
+        };
+    }
+
+    // Sucht, lädt weitere Seiten und verwirft Antworten veralteter Suchen (generation)
+    function createLoader(baseUrl, onItems, onState) {
+        var state = { term: '', cursor: null, loading: false, generation: 0 };
+        function load(reset) {
+            if (reset) { state.generation++; state.cursor = null; }
+            else if (state.loading || !state.cursor) { return; }
+            var generation = state.generation;
+            state.loading = true;
+            onState(state, reset);
+            fetchPage(baseUrl, state.term, reset ? null : state.cursor).then(function (data) {
+                if (generation !== state.generation) { return; }
+                state.cursor = data.next_cursor;
+                onItems(data.items, reset);
+            }).catch(function (error) {
+                console.error('Laden fehlgeschlagen:', baseUrl, error);
+            }).then(function () {
+                if (generation !== state.generation) { return; }
+                state.loading = false;
+                onState(state, false);
+            });
+        }
+        return {
+            state: state,
+            search: function (term) { state.term = term.trim(); load(true); },
+            more: function () { load(false); }
+        };
+    }
+
+    function cell(text) {
+        var td = document.createElement('td');
+        td.textContent = text === null || text === undefined ? '' : text;
+        return td;
+    }
+
+    function link(href, text, cssClass) {
+        var a = document.createElement('a');
+        a.href = href;
+        a.className = 'btn btn-xs ' + cssClass;
+        a.textContent = text;
+        return a;
+    }
+
+    function deleteForm(action, confirmText) {
+        var form = document.createElement('form');
+        form.action = action;
+        form.method = 'POST';
+        form.style.display = 'inline';
+        form.addEventListener('submit', function (event) {
+            if (!confirm(confirmText)) { event.preventDefault(); }
+        });
+        var button = document.createElement('input');
+        button.type = 'submit';
+        button.value = 'Löschen';
+        button.className = 'btn btn-xs btn-danger';
+        form.appendChild(button);
+        return form;
+    }
+
+    // Tabelle: <table data-lookup-url=... data-empty-text=...>, dazu Suchfeld und "Mehr laden"-Button.
+    // renderRow(item) liefert die Zellen (td-Elemente) einer Zeile.
+    function table(tableEl, searchInput, moreButton, renderRow) {
+        var tbody = tableEl.querySelector('tbody');
+        var columns = tableEl.querySelectorAll('thead th').length;
+        var emptyText = tableEl.getAttribute('data-empty-text') || 'Keine Einträge gefunden.';
+        var loader = createLoader(tableEl.getAttribute('data-lookup-url'), function (items, reset) {
+            if (reset) { tbody.textContent = ''; }
+            items.forEach(function (item) {
+                var tr = document.createElement('tr');
+                renderRow(item).forEach(function (td) { tr.appendChild(td); });
+                tbody.appendChild(tr);
+            });
+            if (!tbody.children.length) {
+                var tr = document.createElement('tr');
+                var td = cell(emptyText);
+                td.colSpan = columns;
+                td.className = 'text-center';
+                tr.appendChild(td);
+                tbody.appendChild(tr);
+            }
+        }, function (state) {
+            moreButton.disabled = state.loading;
+            moreButton.style.display = state.cursor || state.loading ? '' : 'none';
+        });
+        if (searchInput) {
+            var search = debounce(function () { loader.search(searchInput.value); });
+            searchInput.addEventListener('input', search);
+        }
+        moreButton.addEventListener('click', function () { loader.more(); });
+        loader.search('');
+        return loader;
+    }
+
+    // Filter-Dropdown: <select data-lookup-url=... data-lookup-label=...>. Die erste Option ("Alle ...")
+    // und die serverseitig gewählte Option bleiben stehen; der Rest wird beim ersten Fokus bzw. per Suche geladen.
+    var LABELS = {
+        name: function (item) { return item.name; },
+        username: function (item) { return item.username; },
+        member: function (item) { return item.name + ' (' + item.team + ')'; }
+    };
+
+    function select(selectEl, searchInput) {
+        var label = LABELS[selectEl.getAttribute('data-lookup-label')] || LABELS.name;
+        var allOption = selectEl.options[0];
+        var moreOption = document.createElement('option');
+        moreOption.value = '';
+        moreOption.textContent = 'Mehr laden…';
+        var loaded = false;
+
+        function selectedOption() {
+            var option = selectEl.options[selectEl.selectedIndex];
+            return option && option !== allOption && option !== moreOption ? option : null;
+        }
+
+        var loader = createLoader(selectEl.getAttribute('data-lookup-url'), function (items, reset) {
+            var keep = selectedOption();
+            if (reset) {
+                Array.prototype.slice.call(selectEl.options).forEach(function (option) {
+                    if (option !== allOption && option !== keep) { selectEl.removeChild(option); }
+                });
+            } else if (moreOption.parentNode) {
+                selectEl.removeChild(moreOption);
+            }
+            items.forEach(function (item) {
+                if (keep && keep.value === String(item.id)) { return; }
+                var option = document.createElement('option');
+                option.value = item.id;
+                option.textContent = label(item);
+                selectEl.appendChild(option);
+            });
+        }, function (state) {
+            if (moreOption.parentNode) { selectEl.removeChild(moreOption); }
+            if (state.cursor && !state.loading) { selectEl.appendChild(moreOption); }
+        });
+
+        var lastValue = selectEl.value;
+        selectEl.addEventListener('change', function () {
+            if (selectEl.options[selectEl.selectedIndex] === moreOption) {
+                selectEl.value = lastValue; // "Mehr laden…" ist keine Auswahl
+                loader.more();
+                return;
+            }
+            lastValue = selectEl.value;
+        });
+        function loadOnce() {
+            if (!loaded) { loaded = true; loader.search(searchInput ? searchInput.value : ''); }
+        }
+        selectEl.addEventListener('focus', loadOnce);
+        selectEl.addEventListener('mousedown', loadOnce);
+        if (searchInput) {
+            var search = debounce(function () { loaded = true; loader.search(searchInput.value); });
+            searchInput.addEventListener('input', search);
+        }
+        return loader;
+    }
+
+    return { table: table, select: select, cell: cell, link: link, deleteForm: deleteForm };
+})();
@@ -0,0 +1,125 @@
+# app/stats.py
+# Gemeinsame Statistik-Abfragen für die Dashboards (team_view, pl_qm_dashboard) und das Admin-Panel.
+# Alle Kennzahlen werden per GROUP BY in der Datenbank berechnet, statt pro Mitglied
+# Coachings zu laden und in Python zu summieren.
+
+from sqlalchemy import func, case, false, and_, or_
+from app import db
+from app.models import Team, TeamMember, Coaching
+from app.utils import ARCHIV_TEAM_NAME
+
+def format_minutes(total_minutes):
+    hours = total_minutes // 60; minutes = total_minutes % 60
+    return f"{hours} Std. {minutes} Min."
+
+def get_member_stats_for_team(team_id):
+    """
+    Liefert für jedes Mitglied eines Teams Durchschnitts-Score, Leitfaden-Erfüllung,
+    Anzahl Coachings und Gesamtzeit – in einer einzigen gruppierten Abfrage.
+    Mitglieder ohne Coachings sind mit 0-Werten enthalten.
+    """
+    rows = db.session.query(
+        TeamMember.id.label('id'),
+        TeamMember.name.label('name'),
+        func.avg(func.coalesce(Coaching.performance_mark, 0) * 10.0).label('avg_score'),
+        func.avg(Coaching.leitfaden_erfuellung_prozent).label('avg_leitfaden_adherence'),
+        func.count(Coaching.id).label('total_coachings'),
+        func.coalesce(func.sum(Coaching.time_spent), 0).label('total_time')
+    ).select_from(TeamMember)\
+     .outerjoin(Coaching, Coaching.team_member_id == TeamMember.id)\
+     .filter(TeamMember.team_id == team_id)\
+     .group_by(TeamMember.id, TeamMember.name)\
+     .order_by(TeamMember.id)\
+     .all()
+
+    members_stats = []
+    for r in rows:
+        total_time = int(r.total_time or 0)
+        members_stats.append({
+            'id': r.id, 'name': r.name,
+            'avg_score': round(float(r.avg_score), 2) if r.total_coachings else 0.0,
+            'avg_leitfaden_adherence': round(float(r.avg_leitfaden_adherence), 1) if r.total_coachings else 0.0,
+            'total_coachings': r.total_coachings,
+            'raw_total_coaching_time': total_time,
+            'formatted_total_coaching_time': format_minutes(total_time)
+        })
+    return members_stats
+
+def get_member_counts_by_team(team_ids=None):
+    """Anzahl Mitglieder je Team ({team_id: Anzahl}) aus einer GROUP-BY-Abfrage; Teams ohne Mitglieder fehlen."""
+    query = db.session.query(TeamMember.team_id, func.count(TeamMember.id)).group_by(TeamMember.team_id)
+    if team_ids is not None:
+        query = query.filter(TeamMember.team_id.in_(team_ids))
+    return dict(query.all())
+
+def _supports_window_functions():
+    dialect_name = db.engine.dialect.name
+    if dialect_name == 'sqlite':
+        import sqlite3
+        return sqlite3.sqlite_version_info >= (3, 25, 0)
+    return dialect_name in ('postgresql', 'mysql', 'mariadb', 'mssql', 'oracle')
+
+def get_team_leaderboard(start_date=None, end_date=None, limit=3):
+    """
+    Top- und Flop-Teams (nach Ø Performance Mark, dann Anzahl Coachings) für einen Zeitraum.
+    Eine gruppierte Abfrage über alle aktiven Teams; das Ranking erfolgt per RANK()-Fensterfunktion,
+    sofern die Datenbank sie unterstützt, sonst in Python auf demselben Ergebnis.
+    Rückgabe: (top_teams, flop_teams) – Flop berücksichtigt nur Teams mit Coachings.
+    """
+    # Coachings direkt über die denormalisierte team_id (nur aktive, Teilindex), ohne Umweg über team_members
+    coaching_join = and_(Coaching.team_id == Team.id, Coaching.is_archived == false())
+    if start_date: coaching_join = and_(coaching_join, Coaching.coaching_date >= start_date)
+    if end_date: coaching_join = and_(coaching_join, Coaching.coaching_date <= end_date)
+
+    avg_score = func.coalesce(func.avg(Coaching.performance_mark * 10.0), 0)
+    num_coachings = func.count(Coaching.id)
+    total_time = func.coalesce(func.sum(Coaching.time_spent), 0)
+    columns = [
+        Team.id.label('id'), Team.name.label('name'),
+        avg_score.label('avg_score'), num_coachings.label('num_coachings'), total_time.label('total_time')
+    ]
+    use_window = _supports_window_functions()
+    if use_window:
+        columns += [
+            func.rank().over(order_by=(avg_score.desc(), num_coachings.desc())).label('top_rank'),
+            func.rank().over(partition_by=case((num_coachings > 0, 1), else_=0),
+                             order_by=(avg_score.asc(), num_coachings.desc())).label('flop_rank')
+        ]
+    grouped = db.session.query(*columns).select_from(Team)\
+        .outerjoin(Coaching, coaching_join)\
+        .filter(Team.name != ARCHIV_TEAM_NAME)\
+        .group_by(Team.id, Team.name)
+
+    if use_window:
+        sq = grouped.subquery('team_leaderboard_sq')
+        rows = db.session.query(sq).filter(or_(
+            sq.c.top_rank <= limit,
+            and_(sq.c.num_coachings > 0, sq.c.flop_rank <= limit)
+        )).all()
+        top_rows = sorted(rows, key=lambda r: (r.top_rank, r.id))
+        flop_rows = sorted((r for r in rows if r.num_coachings > 0), key=lambda r: (r.flop_rank, r.id))
+        top_ranks = [r.top_rank for r in top_rows]
+        flop_ranks = [r.flop_rank for r in flop_rows]
+    else:
+        rows = grouped.order_by(Team.id).all()
+        top_rows = sorted(rows, key=lambda r: (r.avg_score, r.num_coachings), reverse=True)
+        flop_rows = sorted((r for r in rows if r.num_coachings > 0), key=lambda r: (r.avg_score, -r.num_coachings))
+        top_ranks = _rank_positions([(r.avg_score, r.num_coachings) for r in top_rows])
+        flop_ranks = _rank_positions([(r.avg_score, r.num_coachings) for r in flop_rows])
+
+    def to_dict(r, rank):
+        return {'id': r.id, 'name': r.name, 'rank': rank,
+                'num_coachings': r.num_coachings,
+                'avg_score': round(float(r.avg_score), 2),
+                'total_time': int(r.total_time)}
+
+    top_teams = [to_dict(r, rank) for r, rank in zip(top_rows, top_ranks)][:limit]
+    flop_teams = [to_dict(r, rank) for r, rank in zip(flop_rows, flop_ranks)][:limit]
+    return top_teams, flop_teams
+
+def _rank_positions(sort_keys):
+    # RANK()-Semantik für bereits sortierte Schlüssel: gleiche Werte teilen sich den Platz.
+    ranks = []
+    for i, key in enumerate(sort_keys):
+        ranks.append(ranks[-1] if i > 0 and key == sort_keys[i - 1] else i + 1)
+    return ranks
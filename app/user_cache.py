@@ -0,0 +1,85 @@
+# app/user_cache.py
+# Per-Worker-Cache für den angemeldeten Benutzer (Flask-Login user_loader).
+# Gespeichert werden nur die Felder, die role_required, die Routen und die Templates brauchen
+# (id, username, role, team_id_if_leader) – als schlankes AuthUser-Objekt statt der ORM-Instanz.
+# Einträge laufen nach USER_CACHE_TTL Sekunden ab (0 = aus). Änderungen an Benutzern in diesem
+# Worker (edit_user, delete_user, Teamleiter-Zuordnung in den Team-Routen) entfernen den Eintrag
+# nach dem commit() sofort; andere Worker sehen sie spätestens nach Ablauf der TTL.
+
+import threading
+import time
+from flask import current_app
+from flask_login import UserMixin
+from app import db
+
+SESSION_DIRTY_USERS = 'user_cache_dirty'
+
+class AuthUser(UserMixin):
+    """Unveränderliche Sicht auf einen Benutzer für current_user."""
+
+    __slots__ = ('id', 'username', 'role', 'team_id_if_leader')
+
+    def __init__(self, id, username, role, team_id_if_leader):
+        self.id = id
+        self.username = username
+        self.role = role
+        self.team_id_if_leader = team_id_if_leader
+
+    def __repr__(self):
+        return f'<AuthUser {self.username}>'
+
+class UserCache:
+    def __init__(self):
+        self._entries = {} # user_id -> (expires_at, AuthUser)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id, load):
+        """Liefert den AuthUser aus dem Cache oder lädt ihn über load(user_id) (None, wenn es ihn nicht gibt)."""
+        ttl = current_app.config.get('USER_CACHE_TTL', 60)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] >= now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        user = load(user_id)
+        if user is not None and ttl > 0:
+            with self._lock:
+                self._entries[user_id] = (now + ttl, user)
+        return user
+
+    def invalidate(self, user_id=None):
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                    'hit_rate': round(self.hits / total, 3) if total else 0.0}
+
+user_cache = UserCache()
+
+# --- Invalidierung über Session-Events ---
+
+def _collect_changed_users(session, flush_context):
+    for obj in list(session.dirty) + list(session.deleted):
+        if getattr(obj, '__tablename__', None) == 'users' and obj.id is not None:
+            session.info.setdefault(SESSION_DIRTY_USERS, set()).add(obj.id)
+
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop(SESSION_DIRTY_USERS, ()):
+        user_cache.invalidate(user_id)
+
+def _clear_after_rollback(session):
+    session.info.pop(SESSION_DIRTY_USERS, None)
+
+db.event.listen(db.session, 'after_flush', _collect_changed_users)
+db.event.listen(db.session, 'after_commit', _invalidate_after_commit)
+db.event.listen(db.session, 'after_rollback', _clear_after_rollback)
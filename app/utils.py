@@ -1,5 +1,6 @@
 # app/utils.py
 
+import logging
 from functools import wraps
 from flask_login import current_user
 from flask import abort
@@ -10,6 +11,8 @@ from .models import db, Team
 # <<< NEU >>> Konstante für den Namen des Archiv-Teams, um Tippfehler zu vermeiden
 ARCHIV_TEAM_NAME = "ARCHIV"
 
+logger = logging.getLogger(__name__)
+
 def role_required(role_name_or_list):
     """
     Decorator, der prüft, ob der aktuelle Benutzer die erforderliche Rolle hat.
@@ -55,7 +58,7 @@ def get_or_create_archiv_team():
     archiv_team = Team.query.filter_by(name=ARCHIV_TEAM_NAME).first()
     
     if not archiv_team:
-        print(f"INFO: Erstelle das spezielle Team: {ARCHIV_TEAM_NAME}")
+        logger.info("Erstelle das spezielle Team: %s", ARCHIV_TEAM_NAME)
         archiv_team = Team(
             name=ARCHIV_TEAM_NAME
             # Falls dein Team-Modell weitere Pflichtfelder hätte, müssten sie hier gefüllt werden.
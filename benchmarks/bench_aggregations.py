@@ -0,0 +1,28 @@
+# benchmarks/bench_aggregations.py
+"""Aggregations-Helfer aus app/main_routes.py (ohne Dashboard-Cache, siehe conftest.py)."""
+import pytest
+
+from app.main_routes import calculate_date_range, get_performance_data_for_charts, get_coaching_subject_distribution
+
+PERIODS = ['all', '30days', 'current_year']
+
+@pytest.mark.parametrize('period', PERIODS + ['7days', 'current_quarter', '2024-03'])
+def test_calculate_date_range(benchmark, period):
+    benchmark.group = 'calculate_date_range'
+    benchmark(calculate_date_range, period)
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_performance_data_for_charts(benchmark, app_context, period):
+    benchmark.group = 'get_performance_data_for_charts'
+    result = benchmark(get_performance_data_for_charts.uncached, period, 'all')
+    assert result['labels']
+
+def test_performance_data_for_charts_single_team(benchmark, app_context, bench_ids):
+    benchmark.group = 'get_performance_data_for_charts'
+    benchmark(get_performance_data_for_charts.uncached, 'current_year', str(bench_ids['team_id']))
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_coaching_subject_distribution(benchmark, app_context, period):
+    benchmark.group = 'get_coaching_subject_distribution'
+    result = benchmark(get_coaching_subject_distribution.uncached, period, 'all')
+    assert result['labels']
@@ -0,0 +1,79 @@
+# benchmarks/bench_views.py
+"""Komplette Requests über den Flask-Test-Client (Routing, Login, Abfragen, Template-Rendering)."""
+import pytest
+
+def _get(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, f"{url}: HTTP {response.status_code}"
+    return response
+
+@pytest.mark.parametrize('query', ['', '?period=30days', '?search=m%C3%BCller'])
+def test_index(benchmark, admin_client, query):
+    benchmark.group = 'index'
+    benchmark(_get, admin_client, '/' + query)
+
+def test_index_dashboard_charts_api(benchmark, admin_client):
+    benchmark.group = 'index'
+    benchmark(_get, admin_client, '/api/dashboard/charts?period=current_year')
+
+def test_team_view(benchmark, admin_client, bench_ids):
+    benchmark.group = 'team_view'
+    benchmark(_get, admin_client, f"/team_view?team_id={bench_ids['team_id']}")
+
+@pytest.mark.parametrize('query', ['', '?period=current_year'])
+def test_pl_qm_dashboard(benchmark, pl_client, query):
+    benchmark.group = 'pl_qm_dashboard'
+    benchmark(_get, pl_client, '/coaching_review_dashboard' + query)
+
+def test_pl_qm_dashboard_team_filter(benchmark, pl_client, bench_ids):
+    benchmark.group = 'pl_qm_dashboard'
+    benchmark(_get, pl_client, f"/coaching_review_dashboard?team_id_filter={bench_ids['team_id']}")
+
+@pytest.mark.parametrize('query', ['', '?period=30days', '?search=bedarfsanalyse'])
+def test_manage_coachings(benchmark, admin_client, query):
+    benchmark.group = 'manage_coachings'
+    benchmark(_get, admin_client, '/admin/manage_coachings' + query)
+
+@pytest.mark.parametrize('url', ['/admin/api/users', '/admin/api/teams', '/admin/api/team_members',
+                                 '/admin/api/team_members?q=an', '/admin/api/team_members?archived=all&q=m', '/admin/api/coaches'])
+def test_admin_lookup(benchmark, admin_client, url):
+    benchmark.group = 'admin_lookup'
+    benchmark(_get, admin_client, url)
+
+@pytest.mark.parametrize('count', ['10', 'all'])
+def test_member_coaching_trend(benchmark, admin_client, bench_ids, count):
+    benchmark.group = 'get_member_coaching_trend'
+    benchmark(_get, admin_client, f"/api/member_coaching_trend?team_member_id={bench_ids['member_id']}&count={count}")
+
+# Feste Anzahl SQL-Anweisungen pro Listenseite (unabhängig von der Datenmenge): Mitglied, Team und Coach
+# werden mit der Liste geladen, nicht pro Zeile nachgeladen (siehe models.coaching_list_options).
+LIST_PAGE_QUERY_COUNTS = [
+    ('admin_client', '/', 4),
+    ('admin_client', '/?search=m%C3%BCller', 4),
+    ('admin_client', '/admin/manage_coachings', 1), # Filter-Dropdowns laden über /admin/api/... nach
+    ('admin_client', '/admin/manage_coachings?search=bedarfsanalyse', 1),
+    ('pl_client', '/coaching_review_dashboard', 3),
+    ('admin_client', '/admin/', 0), # Tabellen laden über /admin/api/... nach
+    ('admin_client', '/admin/api/users', 1),
+    ('admin_client', '/admin/api/teams', 2), # + Mitgliederzahlen der Seite
+    ('admin_client', '/admin/api/team_members?q=an', 1),
+    ('admin_client', '/admin/api/coaches', 1),
+]
+
+@pytest.mark.parametrize('client_fixture, url, expected', LIST_PAGE_QUERY_COUNTS)
+def test_list_page_query_count(request, bench_app, client_fixture, url, expected):
+    from sqlalchemy import event
+    from app import db
+    client = request.getfixturevalue(client_fixture)
+    _get(client, url) # einmalige Abfragen (Benutzer-Cache, Erkennung des Suchindex) nicht mitzählen
+    statements = []
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    with bench_app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    try:
+        _get(client, url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+    assert len(statements) == expected, "\n".join(' '.join(s.split())[:120] for s in statements)
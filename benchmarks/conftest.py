@@ -0,0 +1,115 @@
+# benchmarks/conftest.py
+"""
+pytest-benchmark-Suite für die Aggregations-Helfer und die wichtigsten Views, auf einer befüllten
+SQLite-Datenbank (Daten aus app/seed.py wie 'flask seed', BENCH_SCALE = 10k | 100k | 1m Coachings, Standard 10k).
+Die Datenbank wird einmal pro Größe und Schema-Stand erzeugt und unter BENCH_DB_DIR wiederverwendet (BENCH_RESEED=1
+erzwingt einen Neuaufbau). Der Dashboard-Cache ist abgeschaltet – gemessen wird die Berechnung, nicht der Cache-Treffer.
+
+Aufruf (aus dem Projektverzeichnis, Abhängigkeiten: pip install -r benchmarks/requirements.txt):
+    pytest -c benchmarks/pytest.ini benchmarks                          # nur messen
+    pytest -c benchmarks/pytest.ini benchmarks --benchmark-save=10k     # Baseline ablegen (benchmarks/baselines)
+    pytest -c benchmarks/pytest.ini benchmarks --benchmark-compare --benchmark-compare-fail=min:30%
+                                                                        # gegen die letzte Baseline; min statt mean, weil robuster gegen Rauschen
+    BENCH_SCALE=100k pytest -c benchmarks/pytest.ini benchmarks --benchmark-save=100k
+"""
+import hashlib
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BENCH_SCALE = os.environ.get('BENCH_SCALE', '10k').lower()
+BENCH_DB_DIR = os.environ.get('BENCH_DB_DIR', os.path.join(tempfile.gettempdir(), 'coaching_benchmarks'))
+BENCH_PASSWORD = 'benchmark'
+SEED = 20240501
+
+NUM_TEAMS = 40
+MEMBERS_PER_TEAM = 25
+ARCHIVED_MEMBERS = 100
+
+if BENCH_SCALE not in SCALES:
+    raise pytest.UsageError(f"BENCH_SCALE muss einer von {', '.join(SCALES)} sein, nicht {BENCH_SCALE!r}.")
+
+def _seed(db, num_coachings):
+    from app.seed import seed_database
+    db.create_all()
+    seed_database(teams=NUM_TEAMS, members_per_team=MEMBERS_PER_TEAM, archived_members=ARCHIVED_MEMBERS,
+                  coachings=num_coachings, days=3 * 365, seed=SEED, password=BENCH_PASSWORD)
+
+def _schema_fingerprint(db):
+    # Kurzer Hash über das SQLite-DDL aller Tabellen und Indizes: neue Spalten/Indizes -> neue Datenbankdatei
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable
+    dialect = sqlite.dialect()
+    tables = [db.metadata.tables[name] for name in sorted(db.metadata.tables)]
+    ddl = [str(CreateTable(table).compile(dialect=dialect)) for table in tables]
+    ddl += sorted(str(CreateIndex(index).compile(dialect=dialect)) for table in tables for index in table.indexes)
+    return hashlib.sha1('\n'.join(ddl).encode()).hexdigest()[:8]
+
+@pytest.fixture(scope='session')
+def bench_app():
+    from config import Config
+    from app import create_app, db
+    import app.models # noqa: F401 – Tabellen registrieren
+    os.makedirs(BENCH_DB_DIR, exist_ok=True)
+    db_path = os.path.join(BENCH_DB_DIR, f'seed_{SEED}_{BENCH_SCALE}_{_schema_fingerprint(db)}.sqlite3')
+    if os.environ.get('BENCH_RESEED') and os.path.exists(db_path):
+        os.remove(db_path)
+    needs_seed = not os.path.exists(db_path)
+
+    class BenchConfig(Config):
+        TESTING = True
+        WTF_CSRF_ENABLED = False
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+        DASHBOARD_CACHE_BACKEND = 'none'
+        REQUEST_TIMING_ENABLED = False
+
+    app = create_app(BenchConfig)
+    if needs_seed:
+        with app.app_context():
+            try:
+                _seed(db, SCALES[BENCH_SCALE])
+            except BaseException:
+                db.session.remove(); db.engine.dispose()
+                os.remove(db_path) # keine halb befüllte Datenbank wiederverwenden
+                raise
+    return app
+
+@pytest.fixture(scope='session')
+def bench_ids(bench_app):
+    """IDs für die Views: ein reguläres Team und das Mitglied mit den meisten Coachings darin."""
+    from app import db
+    from app.models import Team, TeamMember, Coaching
+    from sqlalchemy import func
+    with bench_app.app_context():
+        team_id = db.session.query(Team.id).filter(Team.name == 'Team 001').scalar()
+        member_id = db.session.query(TeamMember.id).join(Coaching, Coaching.team_member_id == TeamMember.id)\
+            .filter(TeamMember.team_id == team_id).group_by(TeamMember.id).order_by(func.count(Coaching.id).desc()).limit(1).scalar()
+    return {'team_id': team_id, 'member_id': member_id}
+
+def _logged_in_client(app, username):
+    client = app.test_client()
+    response = client.post('/auth/login', data={'username': username, 'password': BENCH_PASSWORD})
+    assert response.status_code == 302, f"Anmeldung als {username} fehlgeschlagen"
+    return client
+
+@pytest.fixture(scope='session')
+def admin_client(bench_app):
+    return _logged_in_client(bench_app, 'admin')
+
+@pytest.fixture(scope='session')
+def pl_client(bench_app):
+    return _logged_in_client(bench_app, 'pl')
+
+@pytest.fixture
+def app_context(bench_app):
+    with bench_app.app_context():
+        yield
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info['bench_scale'] = BENCH_SCALE
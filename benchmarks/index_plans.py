@@ -0,0 +1,153 @@
+# benchmarks/index_plans.py
+"""
+Zeigt Abfragepläne und Laufzeiten der typischen Coaching-Abfragen OHNE und MIT den
+Indizes aus Migration c3d145e3056a auf einer frisch befüllten Datenbank.
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/index_plans.py                      # SQLite-Datei im Temp-Verzeichnis, 200k Coachings
+    python benchmarks/index_plans.py --coachings 1000000
+    python benchmarks/index_plans.py --database-url postgresql://user:pw@localhost/coaching_bench
+
+ACHTUNG: Die Zieldatenbank wird komplett geleert (drop_all/create_all).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import text
+
+from config import Config
+from app import create_app, db
+from app.models import User, Team, TeamMember, Coaching
+
+BENCH_INDEXES = [
+    'ix_coachings_team_member_id_coaching_date',
+    'ix_coachings_coach_id_coaching_date',
+    'ix_coachings_coaching_date',
+    'ix_team_members_team_id',
+]
+
+# (Name, SQL, Parameter) – entspricht den Abfrageformen der Views
+QUERY_SHAPES = [
+    ("Trend eines Mitglieds (member + date desc)",
+     "SELECT id, performance_mark, coaching_date FROM coachings WHERE team_member_id = :member_id "
+     "ORDER BY coaching_date DESC LIMIT 10", {'member_id': 42}),
+    ("Coach-Filter, Seite 1 (coach + date desc)",
+     "SELECT id FROM coachings WHERE coach_id = :coach_id ORDER BY coaching_date DESC LIMIT 15", {'coach_id': 3}),
+    ("Neueste Coachings (date desc)",
+     "SELECT id FROM coachings ORDER BY coaching_date DESC LIMIT 10", {}),
+    ("Zeitraum-Zählung (date range)",
+     "SELECT count(*) FROM coachings WHERE coaching_date >= :start AND coaching_date <= :end", None),
+    ("Mitglieder eines Teams (team_id)",
+     "SELECT id, name FROM team_members WHERE team_id = :team_id", {'team_id': 7}),
+    ("Mitglieder-Statistik eines Teams (join)",
+     "SELECT tm.id, count(c.id), avg(c.performance_mark) FROM team_members tm "
+     "LEFT JOIN coachings c ON c.team_member_id = tm.id WHERE tm.team_id = :team_id GROUP BY tm.id", {'team_id': 7}),
+]
+
+def seed(num_teams, members_per_team, num_coachings, rng):
+    conn = db.session.connection()
+    conn.execute(User.__table__.insert(), [
+        {'id': i, 'username': f'coach{i}', 'role': 'Teamleiter'} for i in range(1, num_teams + 11)
+    ])
+    conn.execute(Team.__table__.insert(), [{'id': i, 'name': f'Team {i:03d}'} for i in range(1, num_teams + 1)])
+    member_rows = [{'id': t * members_per_team + m + 1, 'name': f'Agent {t}-{m}', 'team_id': t + 1}
+                   for t in range(num_teams) for m in range(members_per_team)]
+    conn.execute(TeamMember.__table__.insert(), member_rows)
+    num_members = len(member_rows); num_coaches = num_teams + 10
+    now = datetime.utcnow(); batch = []
+    for i in range(1, num_coachings + 1):
+        batch.append({
+            'id': i, 'team_member_id': rng.randint(1, num_members), 'coach_id': rng.randint(1, num_coaches),
+            'coaching_date': now - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60)),
+            'coaching_style': 'TCAP', 'coaching_subject': rng.choice(['Sales', 'Qualität', 'Allgemein']),
+            'performance_mark': rng.randint(0, 10), 'time_spent': rng.randint(5, 60)
+        })
+        if len(batch) == 10000:
+            conn.execute(Coaching.__table__.insert(), batch); batch = []
+    if batch:
+        conn.execute(Coaching.__table__.insert(), batch)
+    db.session.commit()
+
+def explain(sql, params):
+    dialect = db.engine.dialect.name
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect == 'sqlite' else 'EXPLAIN '
+    rows = db.session.execute(text(prefix + sql), params).all()
+    if dialect == 'sqlite':
+        return [r[-1] for r in rows]
+    return [r[0] for r in rows]
+
+def timed(sql, params, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter(); db.session.execute(text(sql), params).all(); elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000.0
+
+def run_shapes(label, repeat):
+    print(f"\n===== {label} =====")
+    results = {}
+    for name, sql, params in QUERY_SHAPES:
+        if params is None:
+            end = datetime.utcnow(); params = {'start': end - timedelta(days=90), 'end': end}
+        plan = explain(sql, params); ms = timed(sql, params, repeat)
+        results[name] = ms
+        print(f"\n-- {name}: {ms:.2f} ms")
+        for line in plan:
+            print(f"   {line}")
+    return results
+
+def set_indexes(present):
+    tables = [Coaching.__table__, TeamMember.__table__]
+    for table in tables:
+        for index in table.indexes:
+            if index.name not in BENCH_INDEXES:
+                continue
+            if present:
+                index.create(db.engine, checkfirst=True)
+            else:
+                index.drop(db.engine, checkfirst=True)
+    db.session.execute(text('ANALYZE'))
+    db.session.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=None)
+    parser.add_argument('--coachings', type=int, default=200000)
+    parser.add_argument('--teams', type=int, default=40)
+    parser.add_argument('--members-per-team', type=int, default=150)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    database_url = args.database_url or 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'index_bench.db')
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = database_url
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.drop_all(); db.create_all()
+        set_indexes(present=False)
+        t0 = time.perf_counter()
+        seed(args.teams, args.members_per_team, args.coachings, random.Random(args.seed))
+        print(f"Befüllt: {args.coachings} Coachings, {args.teams * args.members_per_team} Mitglieder "
+              f"in {time.perf_counter() - t0:.1f}s ({db.engine.url.render_as_string(hide_password=True)})")
+
+        before = run_shapes('OHNE Indizes', args.repeat)
+        set_indexes(present=True)
+        after = run_shapes('MIT Indizes', args.repeat)
+
+        print("\n===== Zusammenfassung (beste von %d Läufen) =====" % args.repeat)
+        for name, _, _ in QUERY_SHAPES:
+            speedup = before[name] / after[name] if after[name] else float('inf')
+            print(f"{name:<45} {before[name]:>10.2f} ms -> {after[name]:>8.2f} ms  (x{speedup:.1f})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+# benchmarks/latency_app.py
+"""
+WSGI-Einstiegspunkt für Lasttests mit künstlicher DB-Latenz: jede SQL-Anweisung wartet zusätzlich
+BENCH_DB_LATENCY_MS Millisekunden (Standard 2) – simuliert eine entfernte Postgres-DB auf einer lokalen
+SQLite-Datei. Nur für benchmarks/load_test.py gedacht, nie produktiv verwenden.
+
+    BENCH_DB_LATENCY_MS=2 gunicorn -c gunicorn.conf.py --chdir . "benchmarks.latency_app:app"
+"""
+import os
+import time
+
+from sqlalchemy import event
+
+from app import create_app, db
+
+DB_LATENCY_SECONDS = float(os.environ.get('BENCH_DB_LATENCY_MS', 2)) / 1000.0
+
+app = create_app()
+
+def _simulate_round_trip(conn, cursor, statement, parameters, context, executemany):
+    time.sleep(DB_LATENCY_SECONDS)
+
+with app.app_context():
+    event.listen(db.engine, 'before_cursor_execute', _simulate_round_trip)
@@ -0,0 +1,87 @@
+# benchmarks/load_test.py
+"""
+Einfacher Lasttest gegen eine LAUFENDE Instanz (z.B. gunicorn -c gunicorn.conf.py "app:create_app()").
+Jeder virtuelle Benutzer meldet sich einmal an und ruft dann die angegebenen Seiten reihum ab.
+Ausgabe: Durchsatz (Requests/s), Latenz p50/p95/p99 und Fehler – Grundlage für die Sizing-Tabelle
+in gunicorn.conf.py.
+
+Testdaten vorher z.B. mit "flask seed --reset --coachings 200000" anlegen (Benutzer admin, Passwort seed).
+
+Aufruf (aus dem Projektverzeichnis):
+    python benchmarks/load_test.py --base-url http://127.0.0.1:8000 --username admin --password geheim
+    python benchmarks/load_test.py --concurrency 32 --duration 60 --path / --path /team_view
+"""
+import argparse
+import re
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.cookiejar import CookieJar
+
+DEFAULT_PATHS = ['/', '/team_view', '/api/dashboard/charts', '/admin/manage_coachings'] # für einen Admin-Benutzer
+
+def open_session(base_url, username, password):
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+    login_page = opener.open(base_url + '/auth/login').read().decode('utf-8')
+    match = re.search(r'name="csrf_token"[^>]*value="([^"]+)"', login_page)
+    data = {'username': username, 'password': password}
+    if match:
+        data['csrf_token'] = match.group(1)
+    response = opener.open(base_url + '/auth/login', urllib.parse.urlencode(data).encode('utf-8'))
+    if '/auth/login' in response.geturl():
+        raise SystemExit(f"Anmeldung als {username!r} fehlgeschlagen.")
+    return opener
+
+def worker(opener, base_url, paths, stop_at, latencies, errors, lock):
+    i = 0
+    while time.perf_counter() < stop_at:
+        path = paths[i % len(paths)]; i += 1
+        started = time.perf_counter()
+        try:
+            opener.open(base_url + path).read()
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+        except (urllib.error.URLError, ConnectionError) as e:
+            with lock:
+                errors.append(f"{path}: {e}")
+
+def percentile(values, pct):
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--username', default='admin')
+    parser.add_argument('--password', default='admin')
+    parser.add_argument('--concurrency', type=int, default=16, help='Gleichzeitige Benutzer (Threads).')
+    parser.add_argument('--duration', type=float, default=30.0, help='Messdauer in Sekunden.')
+    parser.add_argument('--path', action='append', dest='paths', help=f'Seite(n), Standard: {DEFAULT_PATHS}')
+    args = parser.parse_args()
+    base_url = args.base_url.rstrip('/'); paths = args.paths or DEFAULT_PATHS
+
+    openers = [open_session(base_url, args.username, args.password) for _ in range(args.concurrency)]
+    latencies, errors, lock = [], [], threading.Lock()
+    started = time.perf_counter(); stop_at = started + args.duration
+    threads = [threading.Thread(target=worker, args=(o, base_url, paths, stop_at, latencies, errors, lock)) for o in openers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"Seiten: {', '.join(paths)}")
+    print(f"Gleichzeitige Benutzer: {args.concurrency}, Dauer: {elapsed:.1f} s")
+    print(f"Requests: {len(latencies)} ok, {len(errors)} Fehler, {len(latencies) / elapsed:.1f} Requests/s")
+    if latencies:
+        print(f"Latenz ms: p50 {percentile(latencies, 50) * 1000:.0f}, p95 {percentile(latencies, 95) * 1000:.0f}, "
+              f"p99 {percentile(latencies, 99) * 1000:.0f}, Mittel {statistics.mean(latencies) * 1000:.0f}")
+    for message in errors[:10]:
+        print(f"  Fehler: {message}")
+
+if __name__ == '__main__':
+    main()
@@ -4,37 +4,53 @@ from dotenv import load_dotenv
 
 # Lade Umgebungsvariablen aus der .env Datei (primär für lokale Entwicklung)
 # Diese Zeile wird auf Railway keine .env-Datei finden, was OK ist, da dort Umgebungsvariablen anders gesetzt werden.
+# Diagnose (.env, SECRET_KEY, Datenbank) loggt create_app() über app.logger (sichtbar mit LOG_LEVEL=DEBUG) –
+# beim Import dieser Datei ist noch kein Log-Handler eingerichtet.
 basedir = os.path.abspath(os.path.dirname(__file__))
-print(f"DEBUG [config.py]: Lade .env aus basedir: {basedir}") # DEBUG
-if os.path.exists(os.path.join(basedir, '.env')):
-    print("DEBUG [config.py]: .env Datei GEFUNDEN, wird geladen.") # DEBUG
-    load_dotenv(os.path.join(basedir, '.env'))
-else:
-    print("DEBUG [config.py]: .env Datei NICHT gefunden (erwartet auf Railway).") # DEBUG
+DOTENV_PATH = os.path.join(basedir, '.env')
+DOTENV_FOUND = os.path.exists(DOTENV_PATH)
+if DOTENV_FOUND:
+    load_dotenv(DOTENV_PATH)
 
 
 class Config:
-    print("DEBUG [config.py]: Innerhalb der Config-Klasse, VOR dem Lesen von Umgebungsvariablen.") # DEBUG
-
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'ein-sehr-geheimer-fallback-schluessel'
-    print(f"DEBUG [config.py]: SECRET_KEY gelesen als: {'SET (Länge: ' + str(len(SECRET_KEY)) + ')' if SECRET_KEY != '1234' else 'Fallback verwendet'}") # DEBUG
-    
-    DATABASE_URL_FROM_ENV = os.environ.get('DATABASE_URL')
-    print(f"DEBUG [config.py]: ROHER Wert für DATABASE_URL aus os.environ: '{DATABASE_URL_FROM_ENV}' (Typ: {type(DATABASE_URL_FROM_ENV)})") # DEBUG
 
-    SQLALCHEMY_DATABASE_URI = DATABASE_URL_FROM_ENV # Zuweisung
-    
-    if SQLALCHEMY_DATABASE_URI and isinstance(SQLALCHEMY_DATABASE_URI, str) and SQLALCHEMY_DATABASE_URI.startswith("postgres://"):
-        print(f"DEBUG [config.py]: Ersetze 'postgres://' in '{SQLALCHEMY_DATABASE_URI}'") # DEBUG
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    if SQLALCHEMY_DATABASE_URI and SQLALCHEMY_DATABASE_URI.startswith("postgres://"):
         SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace("postgres://", "postgresql://", 1)
-        print(f"DEBUG [config.py]: SQLALCHEMY_DATABASE_URI nach replace: '{SQLALCHEMY_DATABASE_URI}'") # DEBUG
-    elif not SQLALCHEMY_DATABASE_URI:
-        print("DEBUG [config.py]: SQLALCHEMY_DATABASE_URI ist leer oder None VOR der postgres:// Prüfung.") # DEBUG
-    elif not isinstance(SQLALCHEMY_DATABASE_URI, str):
-        print(f"DEBUG [config.py]: SQLALCHEMY_DATABASE_URI ist kein String, sondern Typ {type(SQLALCHEMY_DATABASE_URI)}.") # DEBUG
 
+    # Log-Level für die App-Logger ('app', 'app.*'), z.B. DEBUG für die Startdiagnose
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
 
-    print(f"DEBUG [config.py]: Finale SQLALCHEMY_DATABASE_URI, die gesetzt wird: '{SQLALCHEMY_DATABASE_URI}'") # DEBUG
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Verbindungspool pro Worker-Prozess (Sizing siehe gunicorn.conf.py): pre_ping verwirft vom Proxy/DB
+    # geschlossene Verbindungen vor der Benutzung, recycle erneuert sie, bevor Leerlauf-Timeouts greifen.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', 'true').lower() in ('1', 'true', 'yes'),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    if SQLALCHEMY_DATABASE_URI and not SQLALCHEMY_DATABASE_URI.startswith('sqlite'): # SQLite nutzt eigene Pool-Klassen
+        SQLALCHEMY_ENGINE_OPTIONS.update({
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', os.environ.get('GUNICORN_THREADS', 4))),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 2)),
+            'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        })
     PERFORMANCE_BENCHMARK = 80.0
-print("DEBUG [config.py]: config.py wurde vollständig geladen.") # DEBUG
+    # Cold-Storage ('flask archive-coachings'): Coachings älter als N Jahre ins Archiv verschieben (0 = keine Altersgrenze)
+    COACHING_RETENTION_YEARS = int(os.environ.get('COACHING_RETENTION_YEARS', 0))
+    # Keyset-Paginierung: exakte Gesamtzahl (zusätzliches COUNT(*)) für die Coaching-Liste ermitteln?
+    PAGINATION_EXACT_COUNTS = os.environ.get('PAGINATION_EXACT_COUNTS', 'true').lower() in ('1', 'true', 'yes')
+    # Cache für Dashboard-Aggregate: 'lru' (ein Worker), 'sqlite' (gemeinsame Datei für mehrere Worker) oder 'none'.
+    # Unter gunicorn mit mehreren Workern setzt gunicorn.conf.py 'sqlite' als Standard und lehnt 'lru' ab.
+    DASHBOARD_CACHE_BACKEND = os.environ.get('DASHBOARD_CACHE_BACKEND', 'lru').lower()
+    DASHBOARD_CACHE_PATH = os.environ.get('DASHBOARD_CACHE_PATH') # Standard: instance/dashboard_cache.sqlite3
+    DASHBOARD_CACHE_MAX_ENTRIES = int(os.environ.get('DASHBOARD_CACHE_MAX_ENTRIES', 256))
+    DASHBOARD_CACHE_TTL = int(os.environ.get('DASHBOARD_CACHE_TTL', 600)) # Sekunden; Sicherheitsnetz für Schreibzugriffe außerhalb der App
+    # Messung pro Request (app/instrumentation.py): Server-Timing-Header und Log-Warnungen ab den Schwellwerten (ms, 0 = aus)
+    REQUEST_TIMING_ENABLED = os.environ.get('REQUEST_TIMING_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    SERVER_TIMING_HEADER = os.environ.get('SERVER_TIMING_HEADER', 'true').lower() in ('1', 'true', 'yes')
+    SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', 500))
+    SLOW_QUERY_MS = int(os.environ.get('SLOW_QUERY_MS', 100))
+    # Cache für den angemeldeten Benutzer pro Worker (Sekunden, 0 = aus); Änderungen in anderen Workern greifen nach Ablauf
+    USER_CACHE_TTL = int(os.environ.get('USER_CACHE_TTL', 60))
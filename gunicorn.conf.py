@@ -0,0 +1,101 @@
+# gunicorn.conf.py
+# Produktionskonfiguration für gunicorn; alle Werte über Umgebungsvariablen steuerbar.
+# Wird von gunicorn automatisch aus dem Arbeitsverzeichnis gelesen (Procfile: gunicorn -c gunicorn.conf.py ...).
+#
+# Sizing-Leitfaden
+# ----------------
+# Die App ist I/O-lastig (jede Seite = einige DB-Abfragen), daher gthread-Worker: mehrere Threads pro
+# Prozess warten parallel auf die Datenbank, ohne den Speicher eines weiteren Prozesses zu kosten.
+#
+#   Worker  (WEB_CONCURRENCY)   ≈ Anzahl CPU-Kerne des Containers (nicht des Hosts!), mindestens 2
+#   Threads (GUNICORN_THREADS)  4–8; mehr bringt nur etwas, solange die DB-Antwortzeiten dominieren
+#   DB_POOL_SIZE                = GUNICORN_THREADS (jeder Thread hält höchstens eine Verbindung)
+#   DB_MAX_OVERFLOW             klein (2), nur für Hintergrundarbeit wie Export-Streams
+#   Verbindungen gesamt         = WEB_CONCURRENCY × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+#                                 muss unter max_connections der Datenbank bleiben (Railway-Postgres: 100,
+#                                 abzüglich Reserve für Migrationen/psql)
+#
+# Messung (benchmarks/load_test.py, 16 gleichzeitige Benutzer, je 30 s, Seiten /, /team_view,
+# /api/dashboard/charts, /admin/manage_coachings; 1 vCPU inkl. Lastgenerator, SQLite mit 400 Coachings).
+# "+3 ms DB" = benchmarks/latency_app.py mit BENCH_DB_LATENCY_MS=3 (simuliert eine entfernte Postgres-DB):
+#
+#   Konfiguration                    lokal: Req/s  p50  p95 ms   +3 ms DB: Req/s  p50  p95 ms
+#   sync,    1 Worker                       101   166  251                 –
+#   sync,    2 Worker                        94   169  248                44   364  562
+#   sync,    4 Worker                        82   190  285                68   231  353
+#   gthread, 2 Worker × 4 Threads            84   177  383                71   218  411
+#   gthread, 2 Worker × 8 Threads            95   146  393                73   227  426
+#   (in keinem Lauf Fehler)
+#
+# Ergebnis: Mit lokaler DB ist die App CPU-gebunden; mehr Prozesse/Threads bringen auf einem Kern nichts.
+# Sobald jede Abfrage auf das Netzwerk wartet, halbiert sync mit 2 Workern den Durchsatz (Warteschlange zur
+# Mittagszeit); 2 × 4 Threads erreicht dasselbe wie 4 sync-Worker bei halbem Speicher und halber Zahl an
+# Pools. Mehr als 4 Threads pro Worker brachte kaum noch etwas -> Standard 2 × 4; bei mehr Kernen
+# WEB_CONCURRENCY erhöhen. Für die eigene Umgebung die Tabelle mit load_test.py neu messen.
+
+import multiprocessing
+import os
+
+def _env_bool(name, default):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', max(2, min(multiprocessing.cpu_count(), 4))))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+
+# Dashboard-Cache (app/cache.py): 'lru' lebt pro Prozess – bei mehreren Workern sähe jeder nur seine eigenen
+# Invalidierungen (neue Teammitglieder erschienen nur in einem Teil der Antworten). Daher Standard 'sqlite';
+# ausdrücklich gesetztes 'lru' wird abgelehnt. Muss vor dem Laden der App (config.py) gesetzt sein.
+if workers > 1:
+    if os.environ.setdefault('DASHBOARD_CACHE_BACKEND', 'sqlite').lower() == 'lru':
+        raise RuntimeError(
+            f"DASHBOARD_CACHE_BACKEND='lru' ist nur mit einem Worker möglich (WEB_CONCURRENCY={workers}); "
+            "'sqlite' oder 'none' verwenden"
+        )
+
+# App einmal im Master laden: schnellere Worker-Starts und geteilter Speicher (Copy-on-Write).
+# DB-Verbindungen aus dem Master werden in post_fork verworfen.
+preload_app = _env_bool('GUNICORN_PRELOAD', True)
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60)) # Exporte streamen, blockieren den Worker aber nicht länger
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+# Worker nach N Requests erneuern (gegen schleichendes Speicherwachstum). Standard aus: beim Neustart eines
+# gthread-Workers gingen im Lasttest vereinzelt Verbindungen verloren (Connection reset).
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None # Heartbeat nicht auf (langsamer) Container-Disk
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG') # z.B. '-' für stdout; Standard: aus
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
+
+def when_ready(server):
+    # Fehlende Jahrespartitionen von coachings anlegen (PostgreSQL, sonst No-op; app/partitioning.py) –
+    # einmal im Master bei jedem Start/Deploy. Ein Fehler hier darf den Start nicht verhindern.
+    if not _env_bool('COACHING_PARTITION_MAINTENANCE', True):
+        return
+    try:
+        from app import db
+        from app.partitioning import ensure_coaching_partitions
+        flask_app = server.app.wsgi()
+        with flask_app.app_context():
+            created = ensure_coaching_partitions()
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+        if created:
+            server.log.info("coachings: Jahrespartitionen angelegt: %s", ', '.join(map(str, created)))
+    except Exception:
+        server.log.exception("coachings: Jahrespartitionen konnten nicht geprüft werden")
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+    # Vom Master geerbte Pool-Verbindungen nicht im Worker weiterverwenden (gleiche Sockets in mehreren Prozessen)
+    from app import db
+    flask_app = worker.app.wsgi()
+    with flask_app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
@@ -1,10 +1,13 @@
 import logging
+import re
 from logging.config import fileConfig
 
 from flask import current_app
 
 from alembic import context
 
+from app.models import LOOKUP_INDEXES
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -51,6 +54,37 @@ def get_metadata():
     return target_db.metadata
 
 
+# Schemaobjekte außerhalb der Modelle (per DDL angelegt), die Autogenerate/'flask db check' nicht als zu
+# löschend melden soll – Volltextsuche (app/search.py, Migration 8b41f0c7d2e9):
+# SQLite: FTS5-Tabelle samt Schattentabellen (coaching_search_fts_data, _idx, _docsize, _config);
+# PostgreSQL: generierte Spalte search_vector mit GIN-Index.
+EXCLUDED_TABLE_PREFIXES = ('coaching_search_fts',)
+EXCLUDED_COLUMNS = {('coaching_search_documents', 'search_vector')}
+EXCLUDED_INDEXES = {'ix_coaching_search_documents_search_vector'}
+# Ausdrucks-Indizes der Präfix-Suche (Migration 5d2e7a91c4b8); auch in den Modellen nur per DDL angelegt
+EXCLUDED_INDEXES |= {index_name for index_name, _, _ in LOOKUP_INDEXES}
+# PostgreSQL: Jahrespartitionen von coachings (coachings_y2025, ..., coachings_default; Migration 9e4b2c6d1f37)
+# samt ihren Indizes, außerdem der dort entfallene Fremdschlüssel der Suchdokumente auf coachings
+COACHING_PARTITION_NAME = re.compile(r'coachings_(y\d{4}|default)')
+POSTGRESQL_EXCLUDED_FOREIGN_KEYS = {'fk_coaching_search_documents_coaching_id'}
+
+
+def include_name(name, type_, parent_names):
+    if type_ == 'table':
+        return not name.startswith(EXCLUDED_TABLE_PREFIXES) and not COACHING_PARTITION_NAME.fullmatch(name)
+    if type_ == 'column':
+        return (parent_names.get('table_name'), name) not in EXCLUDED_COLUMNS
+    if type_ == 'index':
+        return name not in EXCLUDED_INDEXES
+    return True
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == 'foreign_key_constraint' and name in POSTGRESQL_EXCLUDED_FOREIGN_KEYS:
+        return context.get_context().dialect.name != 'postgresql'
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -65,7 +99,8 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=get_metadata(), literal_binds=True
+        url=url, target_metadata=get_metadata(), literal_binds=True,
+        include_name=include_name, include_object=include_object
     )
 
     with context.begin_transaction():
@@ -100,6 +135,8 @@ def run_migrations_online():
         context.configure(
             connection=connection,
             target_metadata=get_metadata(),
+            include_name=include_name,
+            include_object=include_object,
             **conf_args
         )
 
@@ -0,0 +1,59 @@
+"""Denormalize team_id and archive flag on coachings, partial indexes over active rows
+
+Revision ID: 2f6b9d4e8a13
+Revises: 5d2e7a91c4b8
+Create Date: 2026-10-18 22:41:05.270318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6b9d4e8a13'
+down_revision = '5d2e7a91c4b8'
+branch_labels = None
+depends_on = None
+
+ARCHIV_TEAM_NAME = 'ARCHIV' # wie app.utils.ARCHIV_TEAM_NAME
+
+
+def upgrade():
+    with op.batch_alter_table('coachings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('team_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('is_archived', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+    # Bestehende Coachings aus dem aktuellen Team ihres Mitglieds befüllen (entspricht 'flask rebuild-coaching-teams')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(sa.text("""
+            UPDATE coachings c SET team_id = tm.team_id, is_archived = (t.name = :archiv)
+            FROM team_members tm JOIN teams t ON t.id = tm.team_id
+            WHERE tm.id = c.team_member_id
+        """).bindparams(archiv=ARCHIV_TEAM_NAME))
+    else:
+        op.execute(sa.text("""
+            UPDATE coachings SET
+                team_id = (SELECT tm.team_id FROM team_members tm WHERE tm.id = coachings.team_member_id),
+                is_archived = (SELECT t.name = :archiv FROM team_members tm JOIN teams t ON t.id = tm.team_id
+                               WHERE tm.id = coachings.team_member_id)
+        """).bindparams(archiv=ARCHIV_TEAM_NAME))
+
+    with op.batch_alter_table('coachings', schema=None) as batch_op:
+        batch_op.alter_column('team_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_coaching_team_id', 'teams', ['team_id'], ['id'])
+
+    # Teilindizes nur über aktive Coachings; Bedingung wie in app/models.py (is_archived = false bzw. = 0 auf SQLite)
+    active = sa.column('is_archived') == sa.false()
+    op.create_index('ix_coachings_active_coaching_date', 'coachings', ['coaching_date', 'id'], unique=False,
+                    postgresql_where=active, sqlite_where=active)
+    op.create_index('ix_coachings_active_team_id_coaching_date', 'coachings', ['team_id', 'coaching_date', 'id'], unique=False,
+                    postgresql_where=active, sqlite_where=active)
+
+
+def downgrade():
+    op.drop_index('ix_coachings_active_team_id_coaching_date', table_name='coachings')
+    op.drop_index('ix_coachings_active_coaching_date', table_name='coachings')
+    with op.batch_alter_table('coachings', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_coaching_team_id', type_='foreignkey')
+        batch_op.drop_column('is_archived')
+        batch_op.drop_column('team_id')
@@ -0,0 +1,36 @@
+"""Add lower(name) lookup indexes for admin prefix search
+
+Revision ID: 5d2e7a91c4b8
+Revises: 8b41f0c7d2e9
+Create Date: 2026-10-18 21:04:12.318506
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e7a91c4b8'
+down_revision = '8b41f0c7d2e9'
+branch_labels = None
+depends_on = None
+
+# (Indexname, Tabelle, Namensspalte) – entspricht LOOKUP_INDEXES in app/models.py
+LOOKUP_INDEXES = [
+    ('ix_users_username_lookup', 'users', 'username'),
+    ('ix_teams_name_lookup', 'teams', 'name'),
+    ('ix_team_members_name_lookup', 'team_members', 'name'),
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    # PostgreSQL: COLLATE "C", damit Präfix-Bereich und ORDER BY den Index nutzen (siehe app/lookup.py)
+    collate = ' COLLATE "C"' if bind.dialect.name == 'postgresql' else ''
+    for index_name, table, column in LOOKUP_INDEXES:
+        op.execute(f"CREATE INDEX {index_name} ON {table} (lower({column}){collate}, id)")
+
+
+def downgrade():
+    for index_name, table, _ in LOOKUP_INDEXES:
+        op.drop_index(index_name, table_name=table)
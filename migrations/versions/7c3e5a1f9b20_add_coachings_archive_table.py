@@ -0,0 +1,55 @@
+"""Add coachings_archive table (cold storage for old and archived coachings)
+
+Revision ID: 7c3e5a1f9b20
+Revises: 2f6b9d4e8a13
+Create Date: 2026-10-19 09:12:44.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e5a1f9b20'
+down_revision = '2f6b9d4e8a13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Gleiche Spalten wie coachings (ID wird übernommen, kein Autoincrement), ohne Fremdschlüssel und Defaults
+    op.create_table('coachings_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('team_member_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('is_archived', sa.Boolean(), nullable=False),
+    sa.Column('coach_id', sa.Integer(), nullable=False),
+    sa.Column('coaching_date', sa.DateTime(), nullable=False),
+    sa.Column('coaching_style', sa.String(length=50), nullable=True),
+    sa.Column('tcap_id', sa.String(length=50), nullable=True),
+    sa.Column('coaching_subject', sa.String(length=50), nullable=True),
+    sa.Column('coach_notes', sa.Text(), nullable=True),
+    sa.Column('leitfaden_begruessung', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_legitimation', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_pka', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_kek', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_angebot', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_zusammenfassung', sa.String(length=10), nullable=True),
+    sa.Column('leitfaden_kzb', sa.String(length=10), nullable=True),
+    sa.Column('performance_mark', sa.Integer(), nullable=True),
+    sa.Column('time_spent', sa.Integer(), nullable=True),
+    sa.Column('project_leader_notes', sa.Text(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_coachings_archive_coaching_date', 'coachings_archive', ['coaching_date', 'id'], unique=False)
+    op.create_index('ix_coachings_archive_team_id_coaching_date', 'coachings_archive', ['team_id', 'coaching_date'], unique=False)
+    op.create_index('ix_coachings_archive_team_member_id_coaching_date', 'coachings_archive', ['team_member_id', 'coaching_date'], unique=False)
+
+
+def downgrade():
+    # Achtung: verschobene Coachings vorher mit 'flask restore-coachings' zurückholen, sonst gehen sie verloren
+    op.drop_index('ix_coachings_archive_team_member_id_coaching_date', table_name='coachings_archive')
+    op.drop_index('ix_coachings_archive_team_id_coaching_date', table_name='coachings_archive')
+    op.drop_index('ix_coachings_archive_coaching_date', table_name='coachings_archive')
+    op.drop_table('coachings_archive')
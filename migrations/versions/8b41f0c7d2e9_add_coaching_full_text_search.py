@@ -0,0 +1,83 @@
+"""Add coaching full-text search documents
+
+Revision ID: 8b41f0c7d2e9
+Revises: c3d145e3056a
+Create Date: 2026-10-18 11:26:53.804417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b41f0c7d2e9'
+down_revision = 'c3d145e3056a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('coaching_search_documents',
+    sa.Column('coaching_id', sa.Integer(), nullable=False),
+    sa.Column('primary_text', sa.Text(), nullable=False),
+    sa.Column('secondary_text', sa.Text(), nullable=False),
+    sa.Column('notes_text', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['coaching_id'], ['coachings.id'], name='fk_coaching_search_documents_coaching_id', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('coaching_id')
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Gewichtung: A = Mitglied/Coach/Thema, B = Team/Stil/TCAP-ID, C = Notizen
+        op.execute("""
+            ALTER TABLE coaching_search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', primary_text), 'A') ||
+                setweight(to_tsvector('simple', secondary_text), 'B') ||
+                setweight(to_tsvector('simple', notes_text), 'C')) STORED
+        """)
+        op.execute("CREATE INDEX ix_coaching_search_documents_search_vector ON coaching_search_documents USING GIN (search_vector)")
+    elif bind.dialect.name == 'sqlite' and bind.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar():
+        op.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS coaching_search_fts USING fts5(
+                primary_text, secondary_text, notes_text, content='coaching_search_documents', content_rowid='coaching_id')
+        """)
+        op.execute("""
+            CREATE TRIGGER coaching_search_documents_ai AFTER INSERT ON coaching_search_documents BEGIN
+                INSERT INTO coaching_search_fts(rowid, primary_text, secondary_text, notes_text)
+                VALUES (new.coaching_id, new.primary_text, new.secondary_text, new.notes_text);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER coaching_search_documents_ad AFTER DELETE ON coaching_search_documents BEGIN
+                INSERT INTO coaching_search_fts(coaching_search_fts, rowid, primary_text, secondary_text, notes_text)
+                VALUES ('delete', old.coaching_id, old.primary_text, old.secondary_text, old.notes_text);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER coaching_search_documents_au AFTER UPDATE ON coaching_search_documents BEGIN
+                INSERT INTO coaching_search_fts(coaching_search_fts, rowid, primary_text, secondary_text, notes_text)
+                VALUES ('delete', old.coaching_id, old.primary_text, old.secondary_text, old.notes_text);
+                INSERT INTO coaching_search_fts(rowid, primary_text, secondary_text, notes_text)
+                VALUES (new.coaching_id, new.primary_text, new.secondary_text, new.notes_text);
+            END
+        """)
+
+    # Bestehende Coachings einmalig indizieren (entspricht 'flask rebuild-search-index').
+    op.execute("""
+        INSERT INTO coaching_search_documents (coaching_id, primary_text, secondary_text, notes_text)
+        SELECT c.id,
+               coalesce(tm.name, '') || ' ' || coalesce(u.username, '') || ' ' || coalesce(c.coaching_subject, ''),
+               coalesce(t.name, '') || ' ' || coalesce(c.coaching_style, '') || ' ' || coalesce(c.tcap_id, ''),
+               coalesce(c.coach_notes, '') || ' ' || coalesce(c.project_leader_notes, '')
+        FROM coachings c
+        JOIN team_members tm ON c.team_member_id = tm.id
+        JOIN teams t ON tm.team_id = t.id
+        LEFT JOIN users u ON c.coach_id = u.id
+    """)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS coaching_search_fts")
+    op.drop_table('coaching_search_documents')
@@ -0,0 +1,165 @@
+"""Partition coachings by year (range on coaching_date) on PostgreSQL
+
+Revision ID: 9e4b2c6d1f37
+Revises: 7c3e5a1f9b20
+Create Date: 2026-10-19 14:37:21.904118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4b2c6d1f37'
+down_revision = '7c3e5a1f9b20'
+branch_labels = None
+depends_on = None
+
+# Nur PostgreSQL: coachings wird eine nach coaching_date (Jahre) partitionierte Tabelle. Perioden-Filter
+# (current_year, current_quarter, YYYY-MM, ...) lesen dann nur die Partitionen der betroffenen Jahre.
+# SQLite: keine Partitionierung, die Migration ändert nichts.
+#
+# Einschränkungen partitionierter Tabellen:
+# - Primärschlüssel muss den Partitionsschlüssel enthalten -> (id, coaching_date); id bleibt über die
+#   Sequenz coachings_id_seq eindeutig.
+# - Fremdschlüssel auf coachings(id) sind nicht möglich -> fk_coaching_search_documents_coaching_id entfällt,
+#   die Suchdokumente werden ohnehin explizit mitgelöscht (app/search.py: remove_search_documents).
+#
+# Neue Jahre legt coachings_ensure_year_partition(jahr) an (aufgerufen von app/partitioning.py: beim Start
+# von gunicorn und per 'flask ensure-coaching-partitions'). Zeilen ohne passende Jahrespartition landen in
+# coachings_default und werden beim Anlegen ihrer Jahrespartition dorthin verschoben.
+
+COLUMNS = [
+    'id', 'team_member_id', 'team_id', 'is_archived', 'coach_id', 'coaching_date', 'coaching_style', 'tcap_id',
+    'coaching_subject', 'coach_notes', 'leitfaden_begruessung', 'leitfaden_legitimation', 'leitfaden_pka',
+    'leitfaden_kek', 'leitfaden_angebot', 'leitfaden_zusammenfassung', 'leitfaden_kzb', 'performance_mark',
+    'time_spent', 'project_leader_notes',
+]
+
+ENSURE_YEAR_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION coachings_ensure_year_partition(p_year integer) RETURNS boolean
+LANGUAGE plpgsql AS $$
+DECLARE
+    partition_name text := format('coachings_y%s', p_year);
+    lower_bound timestamp := make_timestamp(p_year, 1, 1, 0, 0, 0);
+    upper_bound timestamp := make_timestamp(p_year + 1, 1, 1, 0, 0, 0);
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('coachings_ensure_year_partition'));
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN false;
+    END IF;
+    IF EXISTS (SELECT 1 FROM coachings_default WHERE coaching_date >= lower_bound AND coaching_date < upper_bound) THEN
+        -- Zeilen des Jahres liegen bereits in der Default-Partition: in die neue Tabelle verschieben, dann anhängen
+        EXECUTE format('CREATE TABLE %I (LIKE coachings INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+        EXECUTE format('WITH moved AS (DELETE FROM coachings_default WHERE coaching_date >= %L AND coaching_date < %L RETURNING *) '
+                       'INSERT INTO %I SELECT * FROM moved', lower_bound, upper_bound, partition_name);
+        EXECUTE format('ALTER TABLE coachings ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)', partition_name, lower_bound, upper_bound);
+    ELSE
+        EXECUTE format('CREATE TABLE %I PARTITION OF coachings FOR VALUES FROM (%L) TO (%L)', partition_name, lower_bound, upper_bound);
+    END IF;
+    RETURN true;
+END
+$$
+"""
+
+
+def _coaching_columns(id_column):
+    return [
+        id_column,
+        sa.Column('team_member_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('is_archived', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('coach_id', sa.Integer(), nullable=False),
+        sa.Column('coaching_date', sa.DateTime(), nullable=False),
+        sa.Column('coaching_style', sa.String(length=50), nullable=True),
+        sa.Column('tcap_id', sa.String(length=50), nullable=True),
+        sa.Column('coaching_subject', sa.String(length=50), nullable=True),
+        sa.Column('coach_notes', sa.Text(), nullable=True),
+        sa.Column('leitfaden_begruessung', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_legitimation', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_pka', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_kek', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_angebot', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_zusammenfassung', sa.String(length=10), nullable=True),
+        sa.Column('leitfaden_kzb', sa.String(length=10), nullable=True),
+        sa.Column('performance_mark', sa.Integer(), nullable=True),
+        sa.Column('time_spent', sa.Integer(), nullable=True),
+        sa.Column('project_leader_notes', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['team_member_id'], ['team_members.id'], name='fk_coaching_team_member_id'),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], name='fk_coaching_team_id'),
+        sa.ForeignKeyConstraint(['coach_id'], ['users.id'], name='fk_coaching_coach_id'),
+    ]
+
+
+def _create_coaching_indexes():
+    # wie app/models.py (Migrationen c3d145e3056a und 2f6b9d4e8a13); auf der partitionierten Tabelle
+    # angelegt, gelten sie für alle bestehenden und künftigen Partitionen
+    active = sa.column('is_archived') == sa.false()
+    op.create_index('ix_coachings_coaching_date', 'coachings', ['coaching_date'], unique=False)
+    op.create_index('ix_coachings_team_member_id_coaching_date', 'coachings',
+                    ['team_member_id', sa.text('coaching_date DESC')], unique=False)
+    op.create_index('ix_coachings_coach_id_coaching_date', 'coachings',
+                    ['coach_id', sa.text('coaching_date DESC')], unique=False)
+    op.create_index('ix_coachings_active_coaching_date', 'coachings', ['coaching_date', 'id'], unique=False,
+                    postgresql_where=active)
+    op.create_index('ix_coachings_active_team_id_coaching_date', 'coachings', ['team_id', 'coaching_date', 'id'], unique=False,
+                    postgresql_where=active)
+
+
+def _copy_coachings(source):
+    column_list = ', '.join(COLUMNS)
+    op.execute(f"INSERT INTO coachings ({column_list}) SELECT {column_list} FROM {source}")
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Alte Tabelle beiseitelegen; die Sequenz überlebt deren DROP und geht danach an die neue Tabelle
+    op.execute("ALTER TABLE coachings RENAME TO coachings_unpartitioned")
+    op.execute("ALTER TABLE coachings_unpartitioned RENAME CONSTRAINT coachings_pkey TO coachings_unpartitioned_pkey")
+    op.execute("ALTER SEQUENCE coachings_id_seq OWNED BY NONE")
+
+    id_column = sa.Column('id', sa.Integer(), server_default=sa.text("nextval('coachings_id_seq'::regclass)"),
+                          autoincrement=False, nullable=False)
+    op.create_table('coachings', *_coaching_columns(id_column),
+                    sa.PrimaryKeyConstraint('id', 'coaching_date', name='coachings_pkey'),
+                    postgresql_partition_by='RANGE (coaching_date)')
+    op.execute("CREATE TABLE coachings_default PARTITION OF coachings DEFAULT")
+    op.execute(ENSURE_YEAR_PARTITION_FUNCTION)
+    # Jahrespartitionen vom ältesten Coaching bis zum nächsten Jahr
+    op.execute("""
+        SELECT coachings_ensure_year_partition(year)
+        FROM generate_series(
+            COALESCE((SELECT min(extract(year FROM coaching_date))::integer FROM coachings_unpartitioned),
+                     extract(year FROM timezone('UTC', now()))::integer),
+            extract(year FROM timezone('UTC', now()))::integer + 1) AS year
+    """)
+
+    _copy_coachings('coachings_unpartitioned')
+    op.drop_constraint('fk_coaching_search_documents_coaching_id', 'coaching_search_documents', type_='foreignkey')
+    op.drop_table('coachings_unpartitioned')
+    op.execute("ALTER SEQUENCE coachings_id_seq OWNED BY coachings.id")
+    _create_coaching_indexes()
+    op.execute("ANALYZE coachings")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE coachings RENAME TO coachings_partitioned")
+    op.execute("ALTER TABLE coachings_partitioned RENAME CONSTRAINT coachings_pkey TO coachings_partitioned_pkey")
+    op.execute("ALTER SEQUENCE coachings_id_seq OWNED BY NONE")
+
+    id_column = sa.Column('id', sa.Integer(), server_default=sa.text("nextval('coachings_id_seq'::regclass)"),
+                          autoincrement=False, nullable=False)
+    op.create_table('coachings', *_coaching_columns(id_column), sa.PrimaryKeyConstraint('id', name='coachings_pkey'))
+    _copy_coachings('coachings_partitioned')
+    op.drop_table('coachings_partitioned') # entfernt auch alle Partitionen
+    op.execute("DROP FUNCTION coachings_ensure_year_partition(integer)")
+    op.execute("ALTER SEQUENCE coachings_id_seq OWNED BY coachings.id")
+    _create_coaching_indexes()
+    op.create_foreign_key('fk_coaching_search_documents_coaching_id', 'coaching_search_documents', 'coachings',
+                          ['coaching_id'], ['id'], ondelete='CASCADE')
+    op.execute("ANALYZE coachings")
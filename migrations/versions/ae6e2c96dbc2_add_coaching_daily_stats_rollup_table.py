@@ -0,0 +1,50 @@
+"""Add coaching_daily_stats rollup table
+
+Revision ID: ae6e2c96dbc2
+Revises: f62172b38762
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ae6e2c96dbc2'
+down_revision = 'f62172b38762'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('coaching_daily_stats',
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('coaching_subject', sa.String(length=50), nullable=False),
+    sa.Column('coaching_count', sa.Integer(), nullable=False),
+    sa.Column('performance_mark_sum', sa.Integer(), nullable=False),
+    sa.Column('performance_mark_count', sa.Integer(), nullable=False),
+    sa.Column('time_spent_sum', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], name='fk_coaching_daily_stats_team_id'),
+    sa.PrimaryKeyConstraint('team_id', 'day', 'coaching_subject')
+    )
+    with op.batch_alter_table('coaching_daily_stats', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_coaching_daily_stats_day'), ['day'], unique=False)
+
+    # Bestehende Coachings einmalig in das Rollup übernehmen (entspricht 'flask rebuild-daily-stats').
+    op.execute("""
+        INSERT INTO coaching_daily_stats
+            (team_id, day, coaching_subject, coaching_count, performance_mark_sum, performance_mark_count, time_spent_sum)
+        SELECT tm.team_id, date(c.coaching_date), coalesce(c.coaching_subject, ''),
+               count(c.id), coalesce(sum(c.performance_mark), 0), count(c.performance_mark), coalesce(sum(c.time_spent), 0)
+        FROM coachings c
+        JOIN team_members tm ON c.team_member_id = tm.id
+        GROUP BY tm.team_id, date(c.coaching_date), coalesce(c.coaching_subject, '')
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('coaching_daily_stats', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_coaching_daily_stats_day'))
+
+    op.drop_table('coaching_daily_stats')
@@ -0,0 +1,60 @@
+"""Never reuse coaching ids on SQLite (AUTOINCREMENT on coachings)
+
+Revision ID: b5d8e1a4c7f2
+Revises: 9e4b2c6d1f37
+Create Date: 2026-10-20 10:05:12.730461
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d8e1a4c7f2'
+down_revision = '9e4b2c6d1f37'
+branch_labels = None
+depends_on = None
+
+# Nur SQLite: ohne AUTOINCREMENT vergibt SQLite neue IDs als max(id) + 1 und damit erneut die ID eines
+# gelöschten oder nach coachings_archive verschobenen Coachings (Kollision beim Zurückholen).
+# Mit AUTOINCREMENT merkt sich sqlite_sequence die höchste je vergebene ID; sie wird hier auf das Maximum
+# über coachings und coachings_archive gesetzt. PostgreSQL vergibt IDs aus coachings_id_seq und ist nicht betroffen.
+
+COACHING_INDEXES = {
+    'ix_coachings_coaching_date': ['coaching_date'],
+    'ix_coachings_team_member_id_coaching_date': ['team_member_id', sa.text('coaching_date DESC')],
+    'ix_coachings_coach_id_coaching_date': ['coach_id', sa.text('coaching_date DESC')],
+    'ix_coachings_active_coaching_date': ['coaching_date', 'id'],
+    'ix_coachings_active_team_id_coaching_date': ['team_id', 'coaching_date', 'id'],
+}
+
+
+def _recreate_coachings(autoincrement):
+    # Indizes wie app/models.py selbst neu anlegen: der Tabellenneubau überträgt DESC-Spalten und
+    # Teilindizes (WHERE is_archived = 0) nicht zuverlässig
+    for name in COACHING_INDEXES:
+        op.drop_index(name, table_name='coachings')
+    with op.batch_alter_table('coachings', recreate='always', table_kwargs={'sqlite_autoincrement': autoincrement}):
+        pass
+    active = sa.column('is_archived') == sa.false()
+    for name, columns in COACHING_INDEXES.items():
+        op.create_index(name, 'coachings', columns, unique=False,
+                        sqlite_where=active if name.startswith('ix_coachings_active_') else None)
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _recreate_coachings(autoincrement=True)
+    op.execute("DELETE FROM sqlite_sequence WHERE name = 'coachings'")
+    op.execute("""
+        INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'coachings', max(coalesce((SELECT max(id) FROM coachings), 0),
+                                coalesce((SELECT max(id) FROM coachings_archive), 0))
+    """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _recreate_coachings(autoincrement=False)
@@ -0,0 +1,36 @@
+"""Add indexes for coaching access paths
+
+Revision ID: c3d145e3056a
+Revises: ae6e2c96dbc2
+Create Date: 2026-10-18 10:04:17.532961
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d145e3056a'
+down_revision = 'ae6e2c96dbc2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Mitglied + Datum absteigend: Trend-API, Team-Ansicht, Mitglieder-Statistiken
+    op.create_index('ix_coachings_team_member_id_coaching_date', 'coachings',
+                    ['team_member_id', sa.text('coaching_date DESC')], unique=False)
+    # Coach + Datum absteigend: Coach-Filter in der Coaching-Verwaltung, Teamleiter-Liste
+    op.create_index('ix_coachings_coach_id_coaching_date', 'coachings',
+                    ['coach_id', sa.text('coaching_date DESC')], unique=False)
+    # Datum allein: Zeitraumfilter und ORDER BY coaching_date DESC der Listen
+    op.create_index(op.f('ix_coachings_coaching_date'), 'coachings', ['coaching_date'], unique=False)
+    # Mitglieder eines Teams
+    op.create_index(op.f('ix_team_members_team_id'), 'team_members', ['team_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_team_members_team_id'), table_name='team_members')
+    op.drop_index(op.f('ix_coachings_coaching_date'), table_name='coachings')
+    op.drop_index('ix_coachings_coach_id_coaching_date', table_name='coachings')
+    op.drop_index('ix_coachings_team_member_id_coaching_date', table_name='coachings')